@@ -1,16 +1,6 @@
 import os
 import sys
 
-from AINodes.src.nodes.basic.data.array_to_string_basic_node import ArrayToStringBasicNode
-from AINodes.src.nodes.basic.data.data_split_node import DataSplitNode  # Import DataSplitNode
-from AINodes.src.nodes.basic.data.float_to_string_basic_node import FloatToStringBasicNode
-from AINodes.src.nodes.basic.math.add_and_multiply_basic_node import AddAndMultiplyBasicNode
-from AINodes.src.nodes.basic.ml.lineare_regression_basic_node import LinearRegressionNode
-from AINodes.src.nodes.basic.ml.r2_score_basic_node import R2ScoreBasicNode
-from AINodes.src.nodes.input.single_float_input_node import SingleFloatInputNode
-from AINodes.src.nodes.input.sklearn_dataset_input_node import SklearnDatasetInputNode
-from AINodes.src.nodes.output.print_output_node import PrintOutputNode
-
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))  # Add current directory to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))  # Add "src" folder to path
 
@@ -45,6 +35,8 @@ def test_mvc():
 
 
 def test_sklearn_dataset():
+    from AINodes.src.nodes.input.sklearn_dataset_input_node import SklearnDatasetInputNode
+
     print("🔍 Testing SklearnDatasetInputNode...")
 
     # ✅ Only testing the working datasets
@@ -57,20 +49,23 @@ def test_sklearn_dataset():
         dataset_node = SklearnDatasetInputNode(node_type=f"dataset_{dataset_name}", dataset_name=dataset_name)
 
         # Execute node to load data
-        output = dataset_node.compute()
+        output = dataset_node.execute()
 
         if output is None:
             print(f"❌ Failed to load dataset: {dataset_name}")
             continue
 
-        # Extract outputs
-        dataset_dict = output.get("dataset_dict", {})
-        features = output.get("features", [])
-        targets = output.get("targets", [])
+        # Extract outputs (reading a socket evaluates its lazy output)
+        dataset_dict = dataset_node.output_dict.pass_data() or {}
+        features = dataset_node.output_X.pass_data()
+        targets = dataset_node.output_y.pass_data()
+        if features is None or targets is None:
+            print(f"❌ Failed to load dataset: {dataset_name}")
+            continue
 
         # Print results
         print(
-            f"✅ {dataset_name} - Features Shape: {len(features)} samples, {len(features[0]) if features else 0} features")
+            f"✅ {dataset_name} - Features Shape: {len(features)} samples, {len(features[0]) if len(features) else 0} features")
         print(f"✅ {dataset_name} - Targets Shape: {len(targets)} labels")
         print(f"🔹 Sample Features: {features[:3]}")
         print(f"🔹 Sample Targets: {targets[:10]}")
@@ -83,6 +78,10 @@ def test_multiply_add() -> None:
     - Uses fixed float input nodes.
     - Outputs the results via print nodes.
     """
+    from AINodes.src.nodes.basic.math.add_and_multiply_basic_node import AddAndMultiplyBasicNode
+    from AINodes.src.nodes.input.single_float_input_node import SingleFloatInputNode
+    from AINodes.src.nodes.output.print_output_node import PrintOutputNode
+
     editor = NodeEditor()
 
     # Create nodes
@@ -119,6 +118,14 @@ def main():
     - Computes R² score for model evaluation.
     - Outputs predictions and R² score.
     """
+    from AINodes.src.nodes.basic.data.array_to_string_basic_node import ArrayToStringBasicNode
+    from AINodes.src.nodes.basic.data.data_split_node import DataSplitNode
+    from AINodes.src.nodes.basic.data.float_to_string_basic_node import FloatToStringBasicNode
+    from AINodes.src.nodes.basic.ml.lineare_regression_basic_node import LinearRegressionNode
+    from AINodes.src.nodes.basic.ml.r2_score_basic_node import R2ScoreBasicNode
+    from AINodes.src.nodes.input.sklearn_dataset_input_node import SklearnDatasetInputNode
+    from AINodes.src.nodes.output.print_output_node import PrintOutputNode
+
     editor = NodeEditor()
 
     # Load dataset
@@ -181,6 +188,14 @@ def test_data_split_node():
     - Splits dataset into train/test sets (90% train, 10% test).
     - Converts arrays to strings before printing.
     """
+    from AINodes.src.nodes.basic.data.array_to_string_basic_node import ArrayToStringBasicNode
+    from AINodes.src.nodes.basic.data.data_split_node import DataSplitNode
+    from AINodes.src.nodes.basic.data.float_to_string_basic_node import FloatToStringBasicNode
+    from AINodes.src.nodes.basic.ml.lineare_regression_basic_node import LinearRegressionNode
+    from AINodes.src.nodes.basic.ml.r2_score_basic_node import R2ScoreBasicNode
+    from AINodes.src.nodes.input.sklearn_dataset_input_node import SklearnDatasetInputNode
+    from AINodes.src.nodes.output.print_output_node import PrintOutputNode
+
     print("🔍 Testing DataSplitNode...")
 
     # Initialize Node Editor
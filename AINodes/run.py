@@ -0,0 +1,170 @@
+"""
+Headless runner for saved node graphs.
+
+Loads a graph JSON file (as written by "Save" in the editor) and executes it without importing Qt,
+so graphs can run in batch jobs on servers without a display.
+
+Usage:
+    python -m AINodes.run graph.json
+    python -m AINodes.run graph.json --set <node>.test_size=0.3 --output <node> --executor threads
+    python -m AINodes.run graph.json --release-outputs --pin <node>
+    python -m AINodes.run graph.json --sweep <node>.test_size=[0.1,0.2,0.3] --sweep-workers 4 --table results.csv
+
+<node> is either a node id or a node type; a node type addresses every node of that type.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+from AINodes.src.core.node import Node
+from AINodes.src.core.node_editor import NodeEditor
+from AINodes.src.execution.graph_executor import NodeExecutionError
+from AINodes.src.execution.parameter_sweep import expand_grid
+from AINodes.src.utils.logger import logger
+
+
+def parse_value(text: str) -> Any:
+    """
+    Parses a parameter value from the command line.
+    - JSON literals (numbers, true/false, null, lists, quoted strings) are decoded, everything else stays a string.
+
+    :param text: The value as given on the command line.
+    :return: The parsed value.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def apply_overrides(editor: NodeEditor, overrides: List[str]) -> None:
+    """
+    Applies parameter overrides of the form `<node>.<parameter>=<value>`.
+
+    :param editor: The editor holding the loaded graph.
+    :param overrides: The overrides as given on the command line.
+    :raises ValueError: If an override is malformed or addresses an unknown node or parameter.
+    """
+    for override in overrides:
+        target, separator, value = override.partition("=")
+        reference, _, key = target.rpartition(".")
+        if not separator or not reference or not key:
+            raise ValueError(f"Invalid override '{override}', expected <node>.<parameter>=<value>.")
+
+        for node in editor.find_nodes(reference):
+            if key not in node.serialize_parameters():
+                raise ValueError(f"Node {node.node_id} ({node.node_type}) has no parameter '{key}'.")
+            node.set_parameter(key, parse_value(value))
+
+
+def parse_sweep(sweeps: List[str]) -> Dict[str, List[Any]]:
+    """
+    Parses sweep arguments of the form `<node>.<parameter>=<JSON list>` into a parameter grid.
+
+    :param sweeps: The sweep arguments as given on the command line.
+    :return: A grid mapping "<node>.<parameter>" to the values to try.
+    :raises ValueError: If an argument is malformed.
+    """
+    grid = {}
+    for sweep in sweeps:
+        target, separator, values = sweep.partition("=")
+        values = parse_value(values)
+        if not separator or "." not in target or not isinstance(values, list) or not values:
+            raise ValueError(f"Invalid sweep '{sweep}', expected <node>.<parameter>=[value, ...].")
+        grid[target] = values
+    return grid
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m AINodes.run",
+                                     description="Executes a saved AINodes graph without the user interface.")
+    parser.add_argument("graph", help="Path of the graph JSON file.")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="NODE.PARAM=VALUE",
+                        help="Overrides a node parameter; NODE is a node id or type. Can be repeated.")
+    parser.add_argument("--output", dest="outputs", action="append", default=[], metavar="NODE",
+                        help="Only executes the given node (id or type) and its upstream nodes. "
+                             "Can be repeated. Defaults to all output nodes.")
+    parser.add_argument("--executor", choices=("sequential", "threads", "processes"), default="sequential",
+                        help="The execution backend (default: sequential).")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Maximum number of worker threads/processes for the parallel backends.")
+    parser.add_argument("--result-cache", nargs="?", const="", default=None, metavar="DIR",
+                        help="Enables the persistent result cache (optionally in DIR).")
+    parser.add_argument("--release-outputs", action="store_true",
+                        help="Frees intermediate results as soon as they are no longer needed, to cut peak memory.")
+    parser.add_argument("--pin", dest="pinned", action="append", default=[], metavar="NODE",
+                        help="Keeps the output of the given node (id or type) with --release-outputs. Can be repeated.")
+    parser.add_argument("--memory-budget", type=float, default=None, metavar="MB",
+                        help="Moves intermediate arrays to memory-mapped temporary files once they exceed MB megabytes.")
+    parser.add_argument("--sweep", dest="sweeps", action="append", default=[], metavar="NODE.PARAM=[V1,V2,...]",
+                        help="Runs the graph for every value (combined with the other --sweep arguments as a grid) "
+                             "and prints one result table. Can be repeated.")
+    parser.add_argument("--assignments", metavar="JSON_FILE", default=None,
+                        help="Like --sweep, but reads a list of assignments {\"NODE.PARAM\": value, ...} from a file.")
+    parser.add_argument("--sweep-workers", type=int, default=1, metavar="N",
+                        help="Number of sweep assignments evaluated at the same time (default: 1).")
+    parser.add_argument("--table", metavar="CSV", default=None, help="Writes the sweep results to a CSV file.")
+    parser.add_argument("--profile", metavar="TRACE_JSON", default=None,
+                        help="Profiles the run, writes a Chrome trace to the given file and prints a summary.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the headless runner.
+
+    :param argv: The command line arguments (defaults to sys.argv).
+    :return: The exit code: 0 on success, 1 if loading or executing the graph failed.
+    """
+    args = build_parser().parse_args(argv)
+
+    editor = NodeEditor()
+    try:
+        editor.set_execution_mode(args.executor, args.workers)
+        if args.result_cache is not None:
+            editor.enable_result_cache(args.result_cache or None)
+        profiler = editor.enable_profiling() if args.profile else None
+        if args.release_outputs:
+            editor.enable_output_release()
+        if args.memory_budget is not None:
+            editor.enable_spilling(int(args.memory_budget * 1024 ** 2))
+
+        editor.load_graph_from_file(args.graph)
+        apply_overrides(editor, args.overrides)
+        for reference in args.pinned:
+            for node in editor.find_nodes(reference):
+                editor.pin_output(node)
+
+        targets: Optional[List[Node]] = None
+        if args.outputs:
+            targets = [node for reference in args.outputs for node in editor.find_nodes(reference)]
+
+        if args.sweeps or args.assignments:
+            assignments = expand_grid(parse_sweep(args.sweeps))
+            if args.assignments:
+                with open(args.assignments, "r", encoding="utf-8") as f:
+                    assignments = [dict(grid, **listed) for listed in json.load(f) for grid in assignments]
+            result = editor.sweep(assignments, targets, args.sweep_workers)
+            print(result.format())
+            if args.table:
+                result.to_csv(args.table)
+        else:
+            editor.execute(targets)
+    except NodeExecutionError as e:
+        logger.error(str(e))
+        return 1
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Could not run graph {args.graph}: {e}")
+        return 1
+    finally:
+        editor.executor.shutdown()
+
+    if profiler is not None:
+        profiler.export_chrome_trace(args.profile)
+        print(profiler.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
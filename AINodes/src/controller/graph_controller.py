@@ -1,23 +1,34 @@
-import json
-from typing import Dict
+import logging
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer, Signal
 
+from AINodes.src.controller.graph_run_thread import GraphRunThread
 from AINodes.src.core.node import Node
 from AINodes.src.core.node_editor import NodeEditor
+from AINodes.src.execution.execution_plan import ExecutionPlan
 from AINodes.src.sockets.input_socket import InputSocket
 from AINodes.src.ui.main_window import MainWindow
 from AINodes.src.ui.node_scene import NodeScene
 from AINodes.src.utils.logger import logger
 
+# Wartezeit nach der letzten Parameteränderung, bevor der Live-Modus neu rechnet (in Millisekunden)
+LIVE_DEBOUNCE_MS = 50
+
 
 class GraphController(QObject):
     """
     Zentrale Controller-Klasse für das Node-Editor-System.
     - Vermittelt zwischen Model (NodeEditor) und View (GraphView).
     - Behandelt Benutzerinteraktionen (z. B. Hinzufügen/Verbinden von Nodes).
+    - Führt den Graphen in einem Hintergrund-Thread aus (siehe GraphRunThread).
+    - Im Live-Modus werden Parameteränderungen gesammelt und nach einer kurzen Pause nur die betroffenen
+      Output-Nodes neu berechnet; ein veralteter Lauf wird dabei abgebrochen.
     """
 
+    # Log-Meldungen können aus dem Ausführungs-Thread kommen, das Signal stellt sie in den GUI-Thread zu
+    log_message = Signal(str)
+
     def __init__(self):
         """
         Initialisiert den GraphController.
@@ -25,9 +36,11 @@ class GraphController(QObject):
         :param graph_scene: Die grafische Oberfläche für den Node-Graphen.
         :param node_editor: Das Model für den Node-Editor.
         """
+        super().__init__()
         self.node_editor = NodeEditor(self)
         self.main_window = MainWindow(self)
 
+        self.log_message.connect(self.main_window.log)
         handler = UILogHandler(self)
         handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
         logger.addHandler(handler)
@@ -36,8 +49,20 @@ class GraphController(QObject):
 
         self.start_socket = None
 
+        self._run_thread: Optional[GraphRunThread] = None  # Der laufende Hintergrund-Lauf
+        self._run_pending = False  # Run wurde während eines Laufs erneut angefordert
+        self._run_superseded = False  # Der laufende Lauf wurde durch eine neuere Änderung abgebrochen
+
+        self.live_mode = False
+        self._live_nodes: Dict[Node, None] = {}  # Seit dem letzten Live-Lauf geänderte Nodes
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self._live_timer.timeout.connect(self._run_live)
+
     def forward_log_to_ui(self, message: str) -> None:
-        self.main_window.log(message)
+        # Thread-sicher: wird über eine queued connection im GUI-Thread ausgeführt
+        self.log_message.emit(message)
 
     def create_node(self, node_type: str, x: float = None, y: float = None) -> None:
         """
@@ -62,29 +87,27 @@ class GraphController(QObject):
 
         node = self.node_editor.get_node_by_id(node_id)
         if node:
-            print("Trying to delete node by id:", node_id)
+            self._stop_run_for_edit()
             self.node_editor.remove_node(node)
             self.graph_scene.remove_node_view(node_id)
 
-    def create_connection(self, output_socket_id: str, input_socket_id: str) -> None:
+    def create_connection(self, output_socket_id: int, input_socket_id: int) -> None:
         """
         Erstellt eine Verbindung zwischen einem Output- und einem Input-Socket.
 
         :param output_socket_id: Die ID des Output-Sockets.
         :param input_socket_id: Die ID des Input-Sockets.
         """
-        print("Lets try in controller")
-
+        self._stop_run_for_edit()
         try:
             self.node_editor.connect_sockets_by_id(output_socket_id, input_socket_id)
-            print(f"Connnection worked!")
-        except:
-            print(f"Connection failed: {output_socket_id}, {input_socket_id}")
+        except Exception as e:
+            logger.warning(f"Verbindung {output_socket_id} -> {input_socket_id} fehlgeschlagen: {e}")
             return
         self.graph_scene.add_connection_view(output_socket_id, input_socket_id)
         self.start_socket = None
 
-    def delete_connection(self, output_socket_id: str, input_socket_id: str) -> None:
+    def delete_connection(self, output_socket_id: int, input_socket_id: int) -> None:
         """
         Entfernt eine Verbindung zwischen einem Output- und einem Input-Socket.
 
@@ -94,60 +117,202 @@ class GraphController(QObject):
         input_socket = self.node_editor.get_socket_by_id(input_socket_id)
 
         if isinstance(input_socket, InputSocket) and input_socket.connected_socket:
-            input_socket.connected_socket = None
+            self._stop_run_for_edit()
+            input_socket.remove_connection()
             self.graph_scene.remove_connection_view(output_socket_id, input_socket_id)
 
     def get_available_nodes(self):
+        """
+        Liefert alle registrierten Node-Typen, ohne deren Module zu importieren.
+        """
+        return self.node_editor.node_factory
 
-        nodes_list_path = "AINodes/src/data/nodes.json"
-        with open(nodes_list_path, "r", encoding="utf-8") as file:
-            nodes_list = json.load(file)
-
-        return nodes_list
+    def refresh_available_nodes(self):
+        """
+        Sucht erneut nach Node-Dateien, aktualisiert nodes.json und liefert die neuen Node-Typen.
+        """
+        return self.node_editor.refresh_node_factory()
 
     def set_graph_view(self, scene):
         self.graph_scene = scene
 
-    def connect_socket(self, socket_id: str) -> None:
+    def connect_socket(self, socket_id: int) -> None:
         if self.start_socket is None:
             self.start_socket = socket_id
         else:
             self.create_connection(self.start_socket, socket_id)
 
-    def run(self):
-        self.node_editor.execute_all()
+    @property
+    def is_running(self) -> bool:
+        return self._run_thread is not None
+
+    def run(self) -> None:
+        """
+        Startet die Ausführung aller Output-Nodes in einem Hintergrund-Thread.
+        - Der Ausführungsplan wird hier im GUI-Thread kompiliert.
+        - Läuft bereits ein Lauf, wird genau ein weiterer Lauf vorgemerkt (mehrfache Klicks werden zusammengefasst),
+          der nach dem aktuellen Lauf mit dem dann aktuellen Graphen startet.
+        """
+        if self._run_thread is not None:
+            self._run_pending = True
+            self.main_window.set_run_state(True, pending=True)
+            return
+
+        self._live_nodes.clear()  # Ein vollständiger Lauf enthält alle Live-Änderungen
+        self._start_run(None)
+
+    def _start_run(self, targets: Optional[List[Node]]) -> None:
+        """
+        Kompiliert den Ausführungsplan im GUI-Thread und startet ihn in einem GraphRunThread.
+
+        :param targets: Die auszuführenden Nodes, None für alle Output-Nodes.
+        """
+        try:
+            plan = self.node_editor.get_execution_plan(targets)
+        except ValueError as e:
+            logger.error(str(e))
+            return
+
+        thread = GraphRunThread(self.node_editor, plan, self)
+        thread.node_finished.connect(self._on_node_finished)
+        thread.run_failed.connect(self._on_run_failed)
+        thread.run_cancelled.connect(self._on_run_cancelled)
+        thread.finished.connect(self._on_run_finished)
+        self._run_thread = thread
+        self.main_window.set_run_state(True, pending=False)
+        thread.start()
+
+    def set_live_mode(self, enabled: bool) -> None:
+        """
+        Schaltet den Live-Modus ein oder aus.
+
+        :param enabled: True, damit Parameteränderungen automatisch neu berechnet werden.
+        """
+        self.live_mode = enabled
+        if not enabled:
+            self._live_timer.stop()
+            self._live_nodes.clear()
+
+    def parameter_changed(self, node: Node) -> None:
+        """
+        Wird von der View nach jeder Parameteränderung aufgerufen.
+        - Im Live-Modus wird der Node vorgemerkt und der Debounce-Timer neu gestartet.
+        - Ein laufender Lauf rechnet mit veralteten Parametern und wird abgebrochen.
+
+        :param node: Der geänderte Node.
+        """
+        if not self.live_mode:
+            return
+        self._live_nodes[node] = None
+        if self._run_thread is not None and not self._run_pending:
+            self._run_superseded = True
+            self._run_thread.cancel()
+        self._live_timer.start()
+
+    def _run_live(self) -> None:
+        """
+        Berechnet die Output-Nodes neu, die von den seit dem letzten Live-Lauf geänderten Nodes abhängen.
+        - Alle anderen Nodes sind noch gültig und werden vom Executor übersprungen.
+        """
+        if not self._live_nodes:
+            return
+        if self._run_thread is not None:
+            return  # Wird nach dem Ende des (abgebrochenen) Laufs in _on_run_finished nachgeholt
+
+        targets: Dict[Node, None] = {}
+        for node in self._live_nodes:
+            if self.node_editor.get_node_by_id(node.get_id()) is not node:
+                continue  # Inzwischen gelöscht
+            for affected in [node] + self.node_editor.get_downstream_nodes(node):
+                if not ExecutionPlan.downstream_nodes(affected):
+                    targets[affected] = None
+        self._live_nodes.clear()
+
+        if targets:
+            self._start_run(list(targets))
+
+    def cancel_run(self) -> None:
+        """
+        Bricht den laufenden Lauf vor dem nächsten Node ab und verwirft einen vorgemerkten Lauf.
+        """
+        self._run_pending = False
+        if self._run_thread is not None:
+            self._run_thread.cancel()
+
+    def _stop_run_for_edit(self) -> None:
+        """
+        Bricht einen laufenden Lauf ab und wartet auf sein Ende, bevor Nodes oder Verbindungen geändert werden.
+        - Der Ausführungs-Thread liest den kompilierten Plan und die Socket-Verbindungen ohne Sperre,
+          Strukturänderungen dürfen daher nur ohne laufenden Lauf passieren.
+        - Der Lauf wird danach mit dem geänderten Graphen neu gestartet.
+        """
+        if self._run_thread is None or not self._run_thread.isRunning():
+            return
+        logger.info("Graph wird geändert, laufende Ausführung wird abgebrochen und neu gestartet.")
+        self._run_superseded = True
+        self._run_thread.cancel()
+        self._run_thread.wait()
+        self._run_pending = True
+
+    def shutdown(self) -> None:
+        """
+        Bricht einen laufenden Lauf ab und wartet auf das Ende des Threads (z. B. beim Schließen des Fensters).
+        """
+        self.cancel_run()
+        if self._run_thread is not None:
+            self._run_thread.wait()
+
+    def _on_node_finished(self, node_id: str, node_type: str, finished: int, total: int) -> None:
+        self.main_window.show_run_progress(f"{finished}/{total}: {node_type}")
+
+    def _on_run_failed(self, message: str) -> None:
+        logger.error(message)
+
+    def _on_run_cancelled(self) -> None:
+        if self._run_superseded:
+            logger.debug("Veralteter Live-Lauf abgebrochen.")
+        else:
+            logger.info("Ausführung abgebrochen.")
+
+    def _on_run_finished(self) -> None:
+        thread, self._run_thread = self._run_thread, None
+        if thread is not None:
+            thread.deleteLater()
+        self._run_superseded = False
+        self.main_window.set_run_state(False)
+
+        if self._run_pending:
+            self._run_pending = False
+            self.run()
+        elif self._live_nodes and not self._live_timer.isActive():
+            self._run_live()
 
     def get_graph_position(self, id: str) -> (float, float):
-        nodes = self.graph_scene.nodes
-        for node in nodes:
-            if node.node_id == id:
-                position = node.pos()
-                return position.x(), position.y()
+        node = self.graph_scene.get_node_view(id)
+        if node is not None:
+            position = node.pos()
+            return position.x(), position.y()
 
     def save(self, filepath: str):
         self.node_editor.save_graph_to_file(filepath)
 
     def get_position(self, node_id):
-        for node in self.graph_scene.nodes:
-            print(f"Node id: {node.node_id}, position: {node.pos()}")
-            print(f"Searching for: {node_id}")
-            if node.node_id == node_id:
-                return {"x": node.pos().x(), "y": node.pos().y()}
+        node = self.graph_scene.get_node_view(node_id)
+        if node is not None:
+            return {"x": node.pos().x(), "y": node.pos().y()}
 
         raise Exception(f"Node {node_id} not found.")
 
     def load_graph(self, filepath: str):
+        self._stop_run_for_edit()
         self.node_editor.load_graph_from_file(filepath)
 
     def add_node(self, node: Node, x: float = 0, y: float = 0) -> None:
-        self.node_editor.nodes.append(node)
+        self.node_editor.add_node(node)
         if node:
             self.graph_scene.add_node_view(node, x, y)
 
 
-import logging
-
-
 class UILogHandler(logging.Handler):
     def __init__(self, controller):
         super().__init__()
@@ -0,0 +1,56 @@
+import threading
+
+from PySide6.QtCore import QThread, Signal
+
+from AINodes.src.core.node import Node
+from AINodes.src.core.node_editor import NodeEditor
+from AINodes.src.execution.execution_plan import ExecutionPlan
+from AINodes.src.execution.graph_executor import NodeExecutionError, RunCancelled
+
+
+class GraphRunThread(QThread):
+    """
+    Führt einen kompilierten Ausführungsplan in einem eigenen Thread aus, damit die Oberfläche bedienbar bleibt.
+    - Fortschritt, Fehler und Abbruch werden über Signale gemeldet. Die Empfänger leben im GUI-Thread,
+      daher stellt Qt die Signale automatisch in dessen Event-Queue (queued connection).
+    - Abgebrochen wird vor dem nächsten Node; ein laufender Node (z. B. ein Modell-Fit) läuft zu Ende.
+    """
+
+    node_finished = Signal(str, str, int, int)  # Node-ID, Node-Typ, fertige Nodes, Nodes gesamt
+    run_failed = Signal(str)  # Fehlermeldung
+    run_cancelled = Signal()
+    run_succeeded = Signal()
+
+    def __init__(self, node_editor: NodeEditor, plan: ExecutionPlan, parent=None):
+        """
+        :param node_editor: Das Model, dessen Executor den Plan ausführt.
+        :param plan: Der im GUI-Thread kompilierte Ausführungsplan.
+        :param parent: Das Qt-Elternobjekt.
+        """
+        super().__init__(parent)
+        self.node_editor = node_editor
+        self.plan = plan
+        self.cancel_event = threading.Event()
+        self._finished_nodes = 0
+
+    def cancel(self) -> None:
+        """
+        Fordert den Abbruch des Laufs an (thread-sicher).
+        """
+        self.cancel_event.set()
+
+    def _on_node_finished(self, node: Node) -> None:
+        self._finished_nodes += 1
+        self.node_finished.emit(node.node_id, node.node_type, self._finished_nodes, len(self.plan))
+
+    def run(self) -> None:
+        try:
+            self.node_editor.run_plan(self.plan, self.cancel_event, self._on_node_finished)
+        except RunCancelled:
+            self.run_cancelled.emit()
+        except NodeExecutionError as e:
+            self.run_failed.emit(str(e))
+        except Exception as e:
+            self.run_failed.emit(f"Unerwarteter Fehler beim Ausführen des Graphen: {e!r}")
+        else:
+            self.run_succeeded.emit()
@@ -14,6 +14,8 @@ class BasicNode(Node, ABC):
     - This class is intended to be inherited by more specific node types.
     """
 
+    __slots__ = ()
+
     def __init__(self, node_type: str):
         """
         Initializes a basic node with input and output socket lists.
@@ -12,6 +12,8 @@ class InputNode(Node, ABC):
     - They can only have output sockets (not input sockets).
     """
 
+    __slots__ = ()
+
     def __init__(self, node_type: str):
         """
         Initializes an input node with a unique identifier.
@@ -0,0 +1,114 @@
+from __future__ import annotations  # Enables forward type declarations
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:
+    from AINodes.src.core.node import Node  # Only imported for type hints
+
+
+class LazyOutput:
+    """
+    A value that is only computed when it is first requested.
+    - Nodes return it in the result dictionary of `compute()` for outputs that are expensive to build;
+      `OutputSocket.pass_data` evaluates it when a connected socket actually reads the output.
+    - Work shared by several outputs can be wrapped in a LazyOutput as well and requested from their producers,
+      it is still computed only once.
+    - Evaluation is thread-safe, the producer runs at most once.
+    """
+
+    __slots__ = ("_producer", "_value", "_lock")
+
+    _PENDING = object()
+
+    def __init__(self, producer: Callable[[], Any]):
+        """
+        :param producer: Computes the value, called without arguments.
+        """
+        self._producer = producer
+        self._value = LazyOutput._PENDING
+        self._lock = threading.Lock()
+
+    @property
+    def is_evaluated(self) -> bool:
+        return self._value is not LazyOutput._PENDING
+
+    def get(self) -> Any:
+        """
+        Returns the value, computing it on the first call.
+        """
+        if self._value is LazyOutput._PENDING:
+            with self._lock:
+                if self._value is LazyOutput._PENDING:
+                    self._value = self._producer()
+                    self._producer = None  # Release everything the producer holds on to
+        return self._value
+
+    def __reduce__(self):
+        # Values crossing a process boundary or going into the result cache are evaluated first
+        return _evaluated, (self.get(),)
+
+    def __repr__(self) -> str:
+        return f"<LazyOutput {'evaluated' if self.is_evaluated else 'pending'}>"
+
+
+def _evaluated(value: Any) -> Any:
+    return value
+
+
+class NotEvaluated:
+    """
+    Marks an output that was left out when a node result was transported or persisted, because no socket
+    was reading it at that time. It is recomputed locally if a socket requests it later.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<NotEvaluated>"
+
+
+def materialize(result: Any, names: Iterable[str]) -> Any:
+    """
+    Prepares a node result for transport or persistence.
+    - Lazy outputs listed in `names` are evaluated, all other lazy outputs are replaced by NotEvaluated.
+
+    :param result: The result of `compute()`.
+    :param names: The output socket names that are requested.
+    :return: The result without LazyOutput values (non-dictionary results are returned unchanged).
+    """
+    if not isinstance(result, dict):
+        return result.get() if isinstance(result, LazyOutput) else result
+
+    names = set(names)
+    materialized = {}
+    for key, value in result.items():
+        if isinstance(value, LazyOutput):
+            value = value.get() if key in names else NotEvaluated()
+        materialized[key] = value
+    return materialized
+
+
+def evaluate_output(node: Node, result: dict, name: str) -> Any:
+    """
+    Returns the value of one output of a node result, evaluating a LazyOutput or recomputing an output
+    that was not evaluated (see NotEvaluated).
+
+    :param node: The node the result belongs to.
+    :param result: The cached result dictionary of the node.
+    :param name: The name of the output.
+    :return: The value of the output.
+    """
+    value = result[name]
+    if isinstance(value, NotEvaluated):
+        # Recompute the node without storing the result, its inputs and output version stay the same
+        value = LazyOutput(lambda: _output_value(node.compute(), name))
+        result[name] = value
+    if isinstance(value, LazyOutput):
+        value = value.get()
+    return value
+
+
+def _output_value(result: Any, name: str) -> Any:
+    if isinstance(result, dict) and name in result:
+        result = result[name]
+    return result.get() if isinstance(result, LazyOutput) else result
@@ -10,8 +10,13 @@ class MlNode(BasicNode, ABC):
     Abstract base class for all machine learning nodes.
     - Ensures `X` is always 2D and `y` is always 1D.
     - Provides a common interface for ML-related nodes.
+    - ML nodes are CPU-heavy and process-safe, so they can be routed to worker processes.
     """
 
+    __slots__ = ()
+
+    process_safe = True
+
     def __init__(self, node_type: str):
         """
         Initializes a machine learning node.
@@ -33,14 +38,15 @@ class MlNode(BasicNode, ABC):
         Validates and reshapes input data:
         - Ensures `X` is always a 2D array of shape (n_samples, n_features).
         - Ensures `y` is always a 1D array of shape (n_samples,).
+        - Arrays that already have dtype float64 are not copied.
 
         :param X: Feature matrix (list, NumPy array, or similar).
         :param y: Target vector (list, NumPy array, or similar).
         :return: Tuple (X, y) in the correct shape.
         :raises ValueError: If X or y is empty or invalid.
         """
-        X = np.array(X, dtype=np.float64)  # Convert to NumPy array (force float for ML)
-        y = np.array(y, dtype=np.float64)  # Convert to NumPy array (force float for ML)
+        X = np.asarray(X, dtype=np.float64)  # Convert to NumPy array (force float for ML)
+        y = np.asarray(y, dtype=np.float64)  # Convert to NumPy array (force float for ML)
 
         if X.size == 0 or y.size == 0:
             raise ValueError("X and y cannot be empty.")
@@ -62,7 +68,7 @@ class MlNode(BasicNode, ABC):
         :return: X in the correct shape.
         :raises ValueError: If X is empty or invalid.
         """
-        X = np.array(X, dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64)
 
         if X.size == 0:
             raise ValueError("X cannot be empty.")
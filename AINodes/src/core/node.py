@@ -1,3 +1,5 @@
+import itertools
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, Optional, List
 
@@ -5,25 +7,53 @@ from AINodes.src.sockets.input_socket import InputSocket
 from AINodes.src.sockets.output_socket import OutputSocket
 from AINodes.src.utils.logger import logger
 
+# Global source of output versions. Versions are never reused, so a stale version can not match by accident.
+_output_versions = itertools.count(1)
+
+# Serializes the on-demand recomputation of released outputs (see `release_output`)
+_restore_lock = threading.RLock()
+
+
 class Node(ABC):
     """
     Abstract base class for all nodes in the system.
     - Provides core functionalities such as execution, caching, and socket management.
     - Must be extended by specific node types.
+    - The common attributes live in __slots__. Subclasses declare their parameters and sockets in their own
+      __slots__ (empty for classes without attributes), otherwise every instance gets a dictionary again.
     """
 
+    __slots__ = ("node_type", "node_id", "output_cache", "has_output", "output_version", "content_key",
+                 "outputs", "inputs", "dirty", "parameter_revision", "external_state_seen", "pinned",
+                 "released_state")
+
+    # Whether `compute()` may run in a separate worker process. Process-safe nodes must be
+    # reconstructible from `serialize_parameters()` and only depend on the values of their inputs.
+    process_safe: bool = False
+
+    # Whether the same parameters and inputs always produce the same output. Non-deterministic
+    # nodes (e.g. random value generators) are recomputed on every run.
+    deterministic: bool = True
+
     def __init__(self, node_type: str, node_id: str = None):
         """
         Initializes a node with a unique identifier and an output cache.
 
         :param node_type: A unique identifier for the node.
         """
-        print("Backend Node has been created: " + node_type)
         self.node_type: str = node_type  # Unique identifier for the node
         self.node_id = node_id
         self.output_cache: Optional[Any] = None  # Cache for the last computed output
+        self.has_output: bool = False  # Whether output_cache holds a computed result (which may be None)
+        self.output_version: int = 0  # Increases every time a new output is stored
+        self.content_key: Optional[str] = None  # Key of the current output in the persistent result cache
         self.outputs: List[OutputSocket] = []  # List of output sockets
         self.inputs: List[InputSocket] = []  # List of input sockets
+        self.dirty: bool = True  # Set when parameters or inbound connections change
+        self.parameter_revision: int = 0  # Increases with every `mark_dirty`, see `store_output`
+        self.external_state_seen: Optional[Any] = None  # external_state() when the output was stored
+        self.pinned: bool = False  # Pinned outputs are never released, see `release_output`
+        self.released_state: Optional[tuple] = None  # Input state of a released output, see `release_output`
 
 
 
@@ -42,23 +72,153 @@ class Node(ABC):
     def execute(self) -> Any:
         """
         Executes the node's computation.
-        - If the node has already been executed, returns the cached output.
+        - If the cached output is still valid, returns it.
         - Otherwise, computes the result and stores it in the cache.
 
+        - A released output that is read outside of a planned run (see `GraphExecutor.find_restores`)
+          is recomputed on demand; concurrent readers wait for the first one.
+
         :return: The computed output or cached value.
         """
-        if self.output_cache is not None:
+        if self.is_cache_valid():
             return self.output_cache  # Return cached result if available
 
+        if self.released_state is not None:
+            with _restore_lock:
+                if self.is_cache_valid():
+                    return self.output_cache
+                revision = self.parameter_revision
+                result = self.compute()
+                self.store_output(result, revision)
+                return result
+
+        revision = self.parameter_revision  # Parameters may change on another thread while computing
         result = self.compute()  # Perform computation
-        self.output_cache = result  # Store result in cache
+        self.store_output(result, revision)  # Store result in cache
         return result
 
+    def is_cache_valid(self) -> bool:
+        """
+        Checks in O(number of inputs) whether the cached output can be reused.
+        - The node must have a stored output and must not be dirty.
+        - Every connected input must still see the output version it read during the last computation.
+        - `external_state()` must not have changed since the output was stored.
+
+        :return: True if the cached output is valid.
+        """
+        return self.has_output and self.is_state_current()
+
+    def is_state_current(self) -> bool:
+        """
+        Checks whether the node is unchanged since its output was stored, regardless of whether the output
+        is still held (see `release_output`).
+
+        :return: True if neither the parameters, nor the inputs, nor the external state have changed.
+        """
+        if self.dirty:
+            return False
+
+        if self.external_state() != self.external_state_seen:
+            return False
+
+        for input_socket in self.inputs:
+            if not input_socket.is_current():
+                return False
+        return True
+
+    def store_output(self, result: Any, revision: Optional[int] = None) -> None:
+        """
+        Stores a computed result in the cache, assigns it a new output version and marks the node as clean.
+        - A deterministic node that recomputes a released output from the same inputs keeps its output version,
+          so the nodes downstream of it stay valid.
+        - If the parameters were changed while `compute()` was running (e.g. in the editor during a background run),
+          the node stays dirty and is recomputed on the next run.
+
+        :param result: The output of `compute()`.
+        :param revision: `parameter_revision` read before `compute()` was called, None if it can not have changed.
+        """
+        changed = revision is not None and revision != self.parameter_revision
+        external_state = self.external_state()
+        restored = (self.released_state is not None and self.deterministic and not self.dirty and not changed
+                    and self.released_state == (self._seen_versions(), external_state))
+
+        self.output_cache = result
+        self.has_output = True
+        if not restored:
+            self.output_version = next(_output_versions)
+            self.content_key = None
+        self.dirty = changed
+        self.external_state_seen = external_state
+        self.released_state = None
+
+    def release_output(self) -> None:
+        """
+        Drops the cached output to free its memory, but remembers the inputs it was computed from.
+        - Used by the executor once every downstream consumer has read the output (see `GraphExecutor.release_outputs`).
+        - The output version is kept: downstream nodes stay valid and the output is only recomputed
+          when a run needs it again (see `GraphExecutor.find_restores`) or when it is read outside of a run.
+        - Pinned nodes keep their output.
+        """
+        if self.pinned or not self.has_output:
+            return
+        self.released_state = (self._seen_versions(), self.external_state_seen)
+        self.output_cache = None
+        self.has_output = False
+
+    @property
+    def is_released(self) -> bool:
+        return self.released_state is not None
+
+    def _seen_versions(self) -> tuple:
+        return tuple(input_socket.seen_version for input_socket in self.inputs)
+
+    def external_state(self) -> Optional[Any]:
+        """
+        Describes state outside of the graph that the output depends on, e.g. the modification time and size of a file.
+        - The cached output is recomputed when the returned value changes, and the value is part of the result cache key.
+        - Called on every run, so it must be cheap. Must be JSON serializable (or have a stable repr).
+
+        :return: A comparable value, or None if the node only depends on its parameters and inputs.
+        """
+        return None
+
+    def requested_outputs(self) -> List[str]:
+        """
+        Returns the names of the output sockets that are connected to at least one input socket.
+        - Lazy outputs (see LazyOutput) of the other sockets are not evaluated when the result leaves the process.
+
+        :return: The socket names.
+        """
+        return [output_socket.socket_name for output_socket in self.outputs if output_socket.consumers]
+
     def reset_cache(self) -> None:
         """
         Clears the cached output so that the node will recompute its value on the next execution.
         """
         self.output_cache = None
+        self.has_output = False
+        self.released_state = None
+
+    def mark_dirty(self) -> None:
+        """
+        Marks the node as changed, so that it and all nodes downstream of it are recomputed on the next run.
+        """
+        self.dirty = True
+        self.parameter_revision += 1
+
+    def set_parameter(self, key: str, value: Any) -> None:
+        """
+        Changes a parameter of the node and marks the node as dirty.
+
+        :param key: The name of the parameter (as returned by `serialize_parameters()`).
+        :param value: The new value.
+        :raises AttributeError: If the node has no such parameter.
+        """
+        if not hasattr(self, key):
+            raise AttributeError(f"Node {self.node_type} has no parameter '{key}'.")
+
+        setattr(self, key, value)
+        self.mark_dirty()
 
     @abstractmethod
     def compute(self) -> Any:
@@ -0,0 +1,385 @@
+import ast
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from AINodes.src.utils.logger import logger
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+NODES_DIR = os.path.join(SRC_DIR, "nodes")
+CORE_DIR = os.path.join(SRC_DIR, "core")
+BASE_PACKAGE = "AINodes.src"
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "ainodes", "node_discovery.json")
+
+# Bump when the structure of the extracted file information changes, old caches are then ignored
+DISCOVERY_CACHE_VERSION = 1
+
+# Entry point group under which third-party packages register their nodes, e.g. in pyproject.toml:
+#   [project.entry-points."ainodes.nodes"]
+#   my_nodes = "my_package.nodes"                 (a module or package that is scanned for nodes)
+#   MyNode = "my_package.nodes.my_node:MyNode"    (a single node class)
+NODE_ENTRY_POINT_GROUP = "ainodes.nodes"
+
+NODE_BASE_CLASS = f"{BASE_PACKAGE}.core.node.Node"
+
+# Class attributes that are copied into the metadata
+NODE_FLAGS = ("process_safe", "deterministic")
+
+
+def _literal(node: Optional[ast.AST]) -> Any:
+    """
+    Evaluates a constant expression of the source code, everything else becomes its source text.
+    """
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return ast.unparse(node)
+
+
+def parse_module(filepath: str, module_name: str) -> Dict[str, Any]:
+    """
+    Extracts the classes of a Python file without importing it.
+
+    :param filepath: The path of the source file.
+    :param module_name: The import path of the module.
+    :return: A JSON-serializable dictionary with the module name and, per class, its resolved base classes,
+             sockets (from `self.add_socket(...)` calls in `__init__`), constructor parameters and flags.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=filepath)
+
+    package = module_name.rsplit(".", 1)[0]
+    if os.path.basename(filepath) == "__init__.py":
+        package = module_name
+
+    imports: Dict[str, str] = {}
+    for statement in tree.body:
+        if isinstance(statement, ast.ImportFrom):
+            base = statement.module or ""
+            if statement.level:  # Relative import
+                parent = package.rsplit(".", statement.level - 1)[0] if statement.level > 1 else package
+                base = f"{parent}.{base}" if base else parent
+            for alias in statement.names:
+                imports[alias.asname or alias.name] = f"{base}.{alias.name}"
+
+    classes = {}
+    for statement in tree.body:
+        if not isinstance(statement, ast.ClassDef):
+            continue
+
+        bases = []
+        for base in statement.bases:
+            name = ast.unparse(base)
+            if name in imports:
+                bases.append(imports[name])
+            elif any(isinstance(other, ast.ClassDef) and other.name == name for other in tree.body):
+                bases.append(f"{module_name}.{name}")
+            else:
+                bases.append(name)
+
+        flags = {}
+        abstract = "ABC" in bases or "abc.ABC" in bases
+        sockets = []
+        parameters = None  # Only set if the class defines its own constructor
+        for item in statement.body:
+            if isinstance(item, ast.Assign) and len(item.targets) == 1 and isinstance(item.targets[0], ast.Name):
+                if item.targets[0].id in NODE_FLAGS:
+                    flags[item.targets[0].id] = _literal(item.value)
+            elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name) and item.value is not None:
+                if item.target.id in NODE_FLAGS:
+                    flags[item.target.id] = _literal(item.value)
+            elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if any(ast.unparse(decorator).endswith("abstractmethod") for decorator in item.decorator_list):
+                    abstract = True
+                if item.name == "__init__":
+                    sockets = _extract_sockets(item)
+                    parameters = _extract_parameters(item)
+
+        docstring = ast.get_docstring(statement) or ""
+        classes[statement.name] = {
+            "bases": bases,
+            "abstract": abstract,
+            "description": docstring.strip().splitlines()[0] if docstring.strip() else "",
+            "sockets": sockets,
+            "parameters": parameters,
+            "flags": flags,
+        }
+
+    return {"module": module_name, "classes": classes}
+
+
+def _extract_sockets(function: ast.FunctionDef) -> List[Dict[str, str]]:
+    sockets = []
+    for call in ast.walk(function):
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                and call.func.attr == "add_socket" and len(call.args) == 3):
+            continue
+        values = [_literal(arg) for arg in call.args]
+        if all(isinstance(value, str) for value in values):
+            socket_type, data_type, name = values
+            sockets.append({"type": socket_type, "data_type": data_type, "name": name})
+    return sockets
+
+
+def _extract_parameters(function: ast.FunctionDef) -> Dict[str, Dict[str, Any]]:
+    arguments = function.args.args[2:]  # Skip self and node_type
+    defaults = [None] * (len(arguments) - len(function.args.defaults)) + function.args.defaults
+    parameters = {}
+    for argument, default in zip(arguments, defaults):
+        parameters[argument.arg] = {
+            "type": ast.unparse(argument.annotation) if argument.annotation is not None else None,
+            "default": _literal(default),
+        }
+    for argument, default in zip(function.args.kwonlyargs, function.args.kw_defaults):
+        parameters[argument.arg] = {
+            "type": ast.unparse(argument.annotation) if argument.annotation is not None else None,
+            "default": _literal(default),
+        }
+    return parameters
+
+
+def iter_source_files(root_dir: str, root_module: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields all Python files below a directory together with their module names.
+
+    :param root_dir: The directory of the package.
+    :param root_module: The import path of the package.
+    :return: Tuples (file path, module name).
+    """
+    for root, dirs, files in os.walk(root_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__" and not d.startswith("."))
+        for filename in sorted(files):
+            if not filename.endswith(".py"):
+                continue
+            relative = os.path.relpath(os.path.join(root, filename), root_dir)[:-3]
+            parts = [part for part in relative.split(os.sep) if part != "__init__"]
+            yield os.path.join(root, filename), ".".join([root_module] + parts)
+
+
+class NodeDiscovery:
+    """
+    Finds node classes by parsing source files with `ast`, so no node module has to be imported.
+    - Only concrete subclasses of Node are registered, helper classes are ignored.
+    - The extracted information of each file is cached on disk keyed by its mtime and size,
+      unchanged files are not parsed again.
+    - Nodes of third-party packages are found through the "ainodes.nodes" entry point group.
+    """
+
+    def __init__(self, cache_file: Optional[str] = DEFAULT_CACHE_FILE):
+        """
+        :param cache_file: The file holding the parse cache, None to disable the disk cache.
+        """
+        self.cache_file = cache_file
+        self._files: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_file is None or not os.path.isfile(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != DISCOVERY_CACHE_VERSION:
+            return {}
+        return cache.get("files", {})
+
+    def save_cache(self) -> None:
+        """
+        Writes the parse cache to disk if it has changed. Failures (e.g. a read-only home) are ignored.
+        """
+        if self.cache_file is None or not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(self.cache_file))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": DISCOVERY_CACHE_VERSION, "files": self._files}, f)
+            os.replace(temp_path, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write node discovery cache {self.cache_file}: {e}")
+
+    def scan_file(self, filepath: str, module_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the class information of a file, parsing it only if it changed since the last scan.
+
+        :param filepath: The path of the source file.
+        :param module_name: The import path of the module.
+        :return: The information as returned by `parse_module`, or None if the file can not be parsed.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._files.get(filepath)
+            if cached is not None and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size \
+                    and cached["info"]["module"] == module_name:
+                return cached["info"]
+
+        try:
+            info = parse_module(filepath, module_name)
+        except (OSError, SyntaxError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping {filepath} during node discovery: {e}")
+            return None
+
+        with self._lock:
+            self._files[filepath] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "info": info}
+            self._dirty = True
+        return info
+
+    def scan_package(self, root_dir: str, root_module: str) -> List[Dict[str, Any]]:
+        """
+        Scans all files of a package.
+
+        :param root_dir: The directory of the package.
+        :param root_module: The import path of the package.
+        :return: The information of every parsable file.
+        """
+        infos = []
+        for filepath, module_name in iter_source_files(root_dir, root_module):
+            info = self.scan_file(filepath, module_name)
+            if info is not None:
+                infos.append(info)
+        return infos
+
+    def discover(self, nodes_dir: str = NODES_DIR, nodes_module: str = f"{BASE_PACKAGE}.nodes",
+                 include_entry_points: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Finds all concrete node classes of the built-in node package (and optionally of installed plugins).
+
+        :param nodes_dir: The directory of the node package.
+        :param nodes_module: The import path of the node package.
+        :param include_entry_points: Whether to also scan packages registered under NODE_ENTRY_POINT_GROUP.
+        :return: A dictionary mapping node names to their registry entries (see `build_entries`).
+        """
+        # The base classes (Node, BasicNode, ...) are needed to resolve inheritance, but are never registered
+        base_infos = self.scan_package(CORE_DIR, f"{BASE_PACKAGE}.core")
+        node_infos = self.scan_package(nodes_dir, nodes_module)
+        entries = build_entries(node_infos, base_infos + node_infos)
+
+        if include_entry_points:
+            for name, entry in self.discover_entry_points(base_infos).items():
+                entries.setdefault(name, entry)
+
+        self.save_cache()
+        return entries
+
+    def discover_entry_points(self, base_infos: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Finds the nodes of third-party packages registered under NODE_ENTRY_POINT_GROUP.
+        - The plugin packages are located through their distribution metadata and parsed, never imported.
+
+        :param base_infos: The scanned information of the built-in base classes.
+        :return: A dictionary mapping node names to their registry entries.
+        """
+        import importlib.metadata
+
+        entries = {}
+        for entry_point in importlib.metadata.entry_points(group=NODE_ENTRY_POINT_GROUP):
+            module_name, _, class_name = entry_point.value.partition(":")
+            module_name = module_name.strip()
+            class_name = class_name.strip()
+
+            infos = []
+            for filepath, scanned_module in self._locate_entry_point(entry_point, module_name):
+                info = self.scan_file(filepath, scanned_module)
+                if info is not None:
+                    infos.append(info)
+
+            found = build_entries(infos, base_infos + infos)
+            if class_name:
+                class_path = f"{module_name}.{class_name}"
+                entry = next((entry for entry in found.values() if entry["class"] == class_path), {"class": class_path})
+                entries[entry_point.name] = entry
+            else:
+                entries.update(found)
+        return entries
+
+    @staticmethod
+    def _locate_entry_point(entry_point, module_name: str) -> List[Tuple[str, str]]:
+        """
+        Finds the source files of an entry point module (or package) in its distribution without importing it.
+        """
+        distribution = getattr(entry_point, "dist", None)
+        if distribution is None or not distribution.files:
+            return []
+
+        module_path = module_name.replace(".", "/")
+        for file in distribution.files:
+            path = str(file).replace("\\", "/")
+            if path == f"{module_path}.py":
+                return [(str(distribution.locate_file(file)), module_name)]
+            if path == f"{module_path}/__init__.py":
+                package_dir = os.path.dirname(str(distribution.locate_file(file)))
+                return list(iter_source_files(package_dir, module_name))
+        return []
+
+
+def build_entries(node_infos: List[Dict[str, Any]], all_infos: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Turns the scanned class information into registry entries for every concrete Node subclass.
+
+    :param node_infos: The information of the files whose nodes should be registered.
+    :param all_infos: The information of all known files, used to resolve base classes.
+    :return: A dictionary mapping node names to entries with the class path and the node metadata.
+    """
+    classes = {f"{info['module']}.{name}": cls for info in all_infos for name, cls in info["classes"].items()}
+
+    # Bases that could not be resolved to a module (e.g. star imports) are looked up by their simple name
+    by_name: Dict[str, str] = {}
+    for class_path in classes:
+        by_name.setdefault(class_path.rsplit(".", 1)[1], class_path)
+
+    def resolve(base: str) -> Optional[str]:
+        if base in classes:
+            return base
+        return by_name.get(base.rsplit(".", 1)[-1])
+
+    def lineage(class_path: str, seen: Tuple[str, ...] = ()) -> List[str]:
+        """The class and all of its known ancestors, most basic first."""
+        result = []
+        for base in classes[class_path]["bases"]:
+            base_path = resolve(base)
+            if base_path is not None and base_path not in seen:
+                for ancestor in lineage(base_path, seen + (class_path,)):
+                    if ancestor not in result:
+                        result.append(ancestor)
+        result.append(class_path)
+        return result
+
+    entries = {}
+    for info in node_infos:
+        for name, cls in info["classes"].items():
+            class_path = f"{info['module']}.{name}"
+            ancestors = lineage(class_path)
+            if NODE_BASE_CLASS not in ancestors or cls["abstract"]:
+                continue
+
+            # Sockets and flags are inherited from the base classes, the parameters come from the nearest constructor
+            sockets, parameters, flags = [], {}, {}
+            for ancestor in ancestors:
+                ancestor_info = classes[ancestor]
+                sockets.extend(ancestor_info["sockets"])
+                flags.update(ancestor_info["flags"])
+                if ancestor_info["parameters"] is not None:
+                    parameters = ancestor_info["parameters"]
+
+            entries[name] = {
+                "class": class_path,
+                "description": cls["description"],
+                "inputs": [{"name": s["name"], "data_type": s["data_type"]} for s in sockets if s["type"] == "input"],
+                "outputs": [{"name": s["name"], "data_type": s["data_type"]} for s in sockets if s["type"] == "output"],
+                "parameters": parameters,
+                **flags,
+            }
+    return entries
@@ -1,22 +1,30 @@
 import json
-import os
+import threading
 import uuid
+from collections import deque
 from pprint import pprint
-from typing import Dict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, ValuesView
 
 from AINodes.src.core.node import Node
-from AINodes.src.core.output_node import OutputNode
+from AINodes.src.core.node_registry import NODES_JSON_PATH, LazyNodeClass, load_node_registry
+from AINodes.src.execution.execution_plan import ExecutionPlan
+from AINodes.src.execution.graph_executor import GraphExecutor
+from AINodes.src.execution.memory_monitor import PeakRssMonitor
+from AINodes.src.execution.sequential_executor import SequentialExecutor
+from AINodes.src.execution.thread_pool_executor import ThreadPoolGraphExecutor
 from AINodes.src.scripts import generate_nodes_json
+from AINodes.src.sockets.input_socket import InputSocket
+from AINodes.src.sockets.output_socket import OutputSocket
 from AINodes.src.sockets.socket import Socket
+from AINodes.src.utils.logger import logger
 
-# Path to nodes.json in the data folder
-DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
-NODES_JSON_PATH = os.path.join(DATA_DIR, "nodes.json")
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from AINodes.src.controller.graph_controller import GraphController
+    from AINodes.src.execution.execution_profiler import ExecutionProfiler
+    from AINodes.src.execution.parameter_sweep import SweepResult
 
 
 class NodeEditor:
@@ -26,42 +34,61 @@ class NodeEditor:
     - Handles cache resets when needed.
     """
 
-    def __init__(self, controller, json_file="nodes.json"):
+    def __init__(self, controller: Optional["GraphController"] = None, json_file="nodes.json"):
         """
         Initializes the NodeEditor and loads the node factory.
 
-        If the JSON file does not exist or is empty, it will automatically generate a new one.
+        Added or changed node files are picked up automatically (see `refresh_node_factory`).
 
+        :param controller: The GraphController that owns the views. Without a controller the editor runs headless.
         :param json_file: The filename of the node configuration JSON file.
         """
-        if not os.path.exists(NODES_JSON_PATH) or os.stat(NODES_JSON_PATH).st_size == 0:
-            print("⚠ `nodes.json` is missing or empty – Generating a new file...")
-            generate_nodes_json.find_nodes()  # Automatically generate the JSON file
-
         self.controller = controller
 
-        self.nodes = []
-        self.node_factory = self.load_node_factory(NODES_JSON_PATH)
+        # Indexes for O(1) lookups by id, kept consistent by add_node and remove_node
+        self._nodes_by_id: Dict[str, Node] = {}  # Insertion-ordered, also the list of all nodes
+        self._sockets_by_id: Dict[int, Socket] = {}
+        self.node_positions: Dict[str, Dict[str, float]] = {}  # Positions of loaded nodes, used when headless
+        self.node_factory: Dict[str, LazyNodeClass] = {}
+        self.refresh_node_factory()
+
+        # Compiled execution plan, rebuilt only when nodes or connections change
+        self._nodes_revision = 0
+        self._execution_plan: ExecutionPlan = None
+        self.executor: GraphExecutor = SequentialExecutor()
+        self.last_run_memory: Optional[PeakRssMonitor] = None  # Peak RSS of the last run
+
+    @property
+    def nodes(self) -> ValuesView[Node]:
+        """
+        All nodes of the editor, in the order they were added.
+        - A live, read-only view of the node index, no list is built per access.
+          Take `tuple(editor.nodes)` if the graph may change while iterating.
+        """
+        return self._nodes_by_id.values()
 
     @staticmethod
-    def load_node_factory(json_file) -> {}:
+    def load_node_factory(json_file) -> Dict[str, LazyNodeClass]:
         """
         Loads the node factory dictionary from a JSON file.
+        - The node modules are not imported here but on first instantiation of each node type.
 
         :param json_file: The path to the JSON file containing node mappings.
-        :return: A dictionary mapping node names to their respective classes.
+        :return: A dictionary mapping node names to their (lazily imported) classes.
         """
-        with open(json_file, "r") as f:
-            node_mapping = json.load(f)
+        return load_node_registry(json_file)
 
-        factory = {}
-        for node_name, class_path in node_mapping.items():
-            module_name, class_name = class_path.rsplit(".", 1)
-            module = __import__(module_name, fromlist=[class_name])
-            node_class = getattr(module, class_name)
-            factory[node_name] = node_class
+    def refresh_node_factory(self) -> Dict[str, LazyNodeClass]:
+        """
+        Scans the node files again, updates nodes.json and reloads the node factory.
+        - Cheap if nothing changed: unchanged node files are not parsed again (the discovery cache is keyed by
+          modification time and size) and nodes.json is only written if its content changes.
 
-        return factory
+        :return: The new node factory.
+        """
+        generate_nodes_json.find_nodes(verbose=False)
+        self.node_factory = self.load_node_factory(NODES_JSON_PATH)
+        return self.node_factory
 
     def create_node(self, node_type: str, id=None, parameters: Dict ={}) -> Node:
         """
@@ -92,95 +119,376 @@ class NodeEditor:
         :return: The newly created node.
         """
         new_node = self.create_node(node_type)
-        print(new_node)
-        self.nodes.append(new_node)
+        self.add_node(new_node)
         return new_node
 
     def add_node(self, node: Node) -> None:
         """
         Adds an existing node to the editor.
+        - Nodes without an id get a new UUID.
 
         :param node: The node instance to be added.
+        :raises ValueError: If another node with the same id already exists.
+        """
+        if node.get_id() is None:
+            node.set_id(str(uuid.uuid4()))
+        existing = self._nodes_by_id.get(node.get_id())
+        if existing is node:
+            return
+        if existing is not None:
+            raise ValueError(f"A node with id {node.get_id()} already exists.")
+
+        self._nodes_by_id[node.get_id()] = node
+        for socket in node.inputs + node.outputs:
+            self._sockets_by_id[socket.socket_id] = socket
+        self._nodes_revision += 1
+
+    def add_nodes(self, nodes: Iterable[Node]) -> List[Node]:
+        """
+        Adds many nodes at once, e.g. for programmatically generated graphs.
+        - Nodes without an id get "<batch UUID>-<index>", so only one UUID is generated per call.
+        - The execution plan is invalidated once instead of once per node.
+        - Nothing is added if any id is already taken.
+
+        :param nodes: The node instances to be added.
+        :return: The added nodes.
+        :raises ValueError: If a node id is used twice or already exists.
         """
-        self.nodes.append(node)
+        nodes = list(nodes)
+        batch = uuid.uuid4().hex
+        new_ids = set()
+        for index, node in enumerate(nodes):
+            if node.get_id() is None:
+                node.set_id(f"{batch}-{index}")
+            if node.get_id() in self._nodes_by_id or node.get_id() in new_ids:
+                raise ValueError(f"A node with id {node.get_id()} already exists.")
+            new_ids.add(node.get_id())
+
+        nodes_by_id = self._nodes_by_id
+        sockets_by_id = self._sockets_by_id
+        for node in nodes:
+            nodes_by_id[node.node_id] = node
+            for socket in node.inputs:
+                sockets_by_id[socket.socket_id] = socket
+            for socket in node.outputs:
+                sockets_by_id[socket.socket_id] = socket
+        self._nodes_revision += 1
+        return nodes
+
+    def build_graph(self, nodes: Iterable[Node],
+                    connections: Iterable[Tuple[OutputSocket, InputSocket]] = ()) -> List[Node]:
+        """
+        Adds a batch of nodes and connects them, see `add_nodes`.
+
+        :param nodes: The node instances to be added.
+        :param connections: Pairs of (output socket, input socket) to connect.
+        :return: The added nodes.
+        :raises ValueError: If a node id is used twice or already exists.
+        :raises TypeError: If a connection joins sockets of different data types or of the same node.
+        """
+        added = self.add_nodes(nodes)
+        for output_socket, input_socket in connections:
+            input_socket.connect(output_socket)
+        return added
 
     def remove_node(self, node: "Node") -> None:
-        if node not in self.nodes:
+        if self._nodes_by_id.get(node.get_id()) is not node:
             return
 
         # 1. Alle Eingänge des Nodes trennen
         for input_socket in node.inputs:
             input_socket.remove_connection()
 
-        # 2. Alle anderen Nodes durchgehen und prüfen, ob ihre Inputs zu diesem Node zeigen
-        for other_node in self.nodes:
-            for input_socket in other_node.inputs:
-                if input_socket.connected_socket and input_socket.connected_socket.parent_node == node:
-                    input_socket.remove_connection()
+        # 2. Alle Inputs trennen, die von diesem Node lesen (über die Consumer-Listen, O(Grad))
+        for output_socket in node.outputs:
+            for input_socket in list(output_socket.consumers):
+                input_socket.remove_connection()
 
-        # 3. Node aus Liste entfernen
-        self.nodes.remove(node)
+        # 3. Node und seine Sockets aus den Indizes entfernen
+        del self._nodes_by_id[node.get_id()]
+        for socket in node.inputs + node.outputs:
+            self._sockets_by_id.pop(socket.socket_id, None)
+        self.node_positions.pop(node.get_id(), None)
+        self._nodes_revision += 1
 
     def clear_all_caches(self) -> None:
         """
         Clears the cache of all nodes to ensure fresh computations.
         """
-        for node in self.nodes:
+        for node in self._nodes_by_id.values():
             node.reset_cache()
 
+    def get_execution_plan(self, targets: Optional[List[Node]] = None) -> ExecutionPlan:
+        """
+        Returns the compiled execution plan for all output nodes.
+        - The plan is cached and only recompiled after nodes or connections have changed.
+        - Plans for an explicit selection of targets are compiled on every call.
+
+        :param targets: The nodes that should be executed. Defaults to all output nodes.
+        :return: The current execution plan.
+        :raises ValueError: If the graph contains a cycle.
+        """
+        revision = (self._nodes_revision, Socket.topology_revision)
+        if targets is not None:
+            return ExecutionPlan.compile(self._nodes_by_id.values(), targets, revision=revision)
+        if self._execution_plan is None or self._execution_plan.revision != revision:
+            self._execution_plan = ExecutionPlan.compile(self._nodes_by_id.values(), revision=revision)
+        return self._execution_plan
+
+    def set_execution_mode(self, mode: str = "sequential", max_workers: Optional[int] = None) -> None:
+        """
+        Selects the backend used by `execute_all`.
+
+        :param mode: "sequential" (default), "threads" to run independent branches in parallel or
+                     "processes" to additionally run process-safe nodes in worker processes.
+        :param max_workers: Maximum number of worker threads/processes for the parallel modes.
+        :raises ValueError: If the mode is unknown.
+        """
+        if mode == "sequential":
+            executor = SequentialExecutor()
+        elif mode == "threads":
+            executor = ThreadPoolGraphExecutor(max_workers)
+        elif mode == "processes":
+            # Imported lazily, the process backend pulls in multiprocessing and NumPy
+            from AINodes.src.execution.process_pool_executor import ProcessPoolGraphExecutor
+            executor = ProcessPoolGraphExecutor(max_workers)
+        else:
+            raise ValueError("Invalid execution mode. Valid modes: 'sequential', 'threads' or 'processes'.")
+
+        executor.result_cache = self.executor.result_cache
+        executor.profiler = self.executor.profiler
+        executor.release_outputs = self.executor.release_outputs
+        executor.spill_manager, self.executor.spill_manager = self.executor.spill_manager, None
+        self.executor.shutdown()
+        self.executor = executor
+
+    def enable_result_cache(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        """
+        Enables the persistent, content-addressed cache for node outputs.
+        - Unchanged nodes are then served from disk, even across sessions.
+
+        :param cache_dir: The cache directory (defaults to ~/.cache/ainodes/results).
+        :param max_bytes: The maximum size of the cache; least recently used entries are evicted.
+        """
+        from AINodes.src.execution.result_cache import ResultCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+
+        self.executor.result_cache = ResultCache(cache_dir or DEFAULT_CACHE_DIR, max_bytes or DEFAULT_MAX_BYTES)
+
+    def disable_result_cache(self) -> None:
+        """
+        Disables the persistent result cache. Stored entries are kept on disk.
+        """
+        self.executor.result_cache = None
+
+    def enable_profiling(self) -> "ExecutionProfiler":
+        """
+        Attaches a profiler to the executor that measures every node execution.
+        - Export the results with `profiler.export_chrome_trace(path)` or print `profiler.summary()`.
+
+        :return: The attached profiler (an existing one is kept).
+        """
+        from AINodes.src.execution.execution_profiler import ExecutionProfiler
+
+        if self.executor.profiler is None:
+            self.executor.profiler = ExecutionProfiler()
+        return self.executor.profiler
+
+    def disable_profiling(self) -> None:
+        """
+        Detaches the profiler from the executor.
+        """
+        self.executor.profiler = None
+
+    def enable_output_release(self) -> None:
+        """
+        Releases every intermediate output as soon as its last downstream consumer has read it, to cut peak memory.
+        - Only the outputs of the executed targets and of pinned nodes (see `pin_output`) are kept.
+        - Unchanged nodes stay valid; a released output is recomputed only if a consumer has to read it again.
+        """
+        self.executor.release_outputs = True
+
+    def disable_output_release(self) -> None:
+        """
+        Keeps all outputs in memory again (the default).
+        """
+        self.executor.release_outputs = False
+
+    def enable_spilling(self, budget_bytes: int, spill_dir: Optional[str] = None) -> None:
+        """
+        Limits the memory used by node outputs: once their arrays exceed the budget, the oldest ones are moved
+        to memory-mapped temporary files. Consumers then read `np.memmap` views, no node needs to change.
+
+        :param budget_bytes: The maximum size of the output arrays kept in memory.
+        :param spill_dir: The directory for the spill files (defaults to a temporary directory).
+        """
+        from AINodes.src.execution.spill_manager import SpillManager
+
+        self.disable_spilling()
+        self.executor.spill_manager = SpillManager(budget_bytes, spill_dir)
+
+    def disable_spilling(self) -> None:
+        """
+        Keeps all output arrays in memory again (the default). Already spilled outputs stay memory-mapped.
+        """
+        if self.executor.spill_manager is not None:
+            self.executor.spill_manager.close()
+            self.executor.spill_manager = None
+
+    def pin_output(self, node: Node, pinned: bool = True) -> None:
+        """
+        Keeps the output of a node in memory for inspection, even if output release is enabled.
+
+        :param node: The node.
+        :param pinned: False to unpin the node.
+        """
+        node.pinned = pinned
+
     def execute_all(self) -> None:
         """
         Executes all output nodes to process the computation graph.
 
         Steps:
-        1. Clears all caches to ensure a fresh execution.
-        2. Identifies all output nodes in the system.
-        3. Executes each output node to process data.
+        1. Fetches the (cached) topologically sorted execution plan.
+        2. Clears the caches of non-deterministic nodes.
+        3. Lets the configured executor run the plan, so every input is already cached when it is read.
+           Nodes that are dirty or whose inputs have a newer output version are recomputed,
+           all other nodes reuse their cached outputs.
+
+        Call `clear_all_caches()` first to force a full recomputation.
+
+        :raises NodeExecutionError: If a node fails.
+        """
+        self.execute(None)
+
+    def execute(self, targets: Optional[List[Node]]) -> None:
         """
-        self.clear_all_caches()
+        Executes the given nodes and everything they depend on.
 
-        for node in self.nodes:
-            if isinstance(node, OutputNode):
-                node.execute()
+        :param targets: The nodes to execute, None for all output nodes.
+        :raises NodeExecutionError: If a node fails.
+        """
+        self.run_plan(self.get_execution_plan(targets))
+
+    def run_plan(self, plan: ExecutionPlan, cancel_event: Optional[threading.Event] = None,
+                 progress: Optional[Callable[[Node], None]] = None) -> None:
+        """
+        Runs a compiled execution plan, e.g. on a background thread after compiling it on the GUI thread.
+        - Cancellation is checked before every node; a running node is not interrupted.
+        - The peak RSS of the run is logged and kept in `last_run_memory`.
+
+        :param plan: The plan from `get_execution_plan`.
+        :param cancel_event: Cancels the run when set.
+        :param progress: Called with every finished (or still valid) node, on the thread running the plan.
+        :raises NodeExecutionError: If a node fails.
+        :raises RunCancelled: If the run was cancelled.
+        """
+        plan.reset_nondeterministic_caches()
+
+        executor = self.executor
+        executor.cancel_event = cancel_event
+        executor.progress_callback = progress
+        with PeakRssMonitor() as monitor:
+            try:
+                executor.run(plan)
+            finally:
+                executor.cancel_event = None
+                executor.progress_callback = None
+                self.last_run_memory = monitor
+        logger.info(f"Executed {len(plan)} nodes. {monitor.describe()}")
 
     def connect_sockets(self, start_socket: Socket, end_socket: Socket) -> None:
         start_socket.connect(end_socket)
 
-    def connect_sockets_by_id(self, output_socket_id: str, input_socket_id: str) -> None:
+    def connect_sockets_by_id(self, output_socket_id: int, input_socket_id: int) -> None:
         output_socket = self.get_socket_by_id(output_socket_id)
         input_socket = self.get_socket_by_id(input_socket_id)
 
         output_socket.connect(input_socket)
 
+    def get_downstream_nodes(self, node: Node) -> List[Node]:
+        """
+        Returns all nodes that directly or indirectly read from the given node.
+        - Follows the consumer lists of the output sockets, so only the affected subgraph is visited.
+
+        :param node: The node whose downstream nodes are requested.
+        :return: The downstream nodes in breadth-first order, without the node itself.
+        """
+        downstream = []
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            for consumer in ExecutionPlan.downstream_nodes(queue.popleft()):
+                if consumer not in seen:
+                    seen.add(consumer)
+                    downstream.append(consumer)
+                    queue.append(consumer)
+        return downstream
+
     def get_node_by_id(self, node_id: str) -> Node:
-        for node in self.nodes:
-            if node.node_id == node_id:
-                return node
-        return None
+        return self._nodes_by_id.get(node_id)
 
     def remove_node_by_id(self, node_id: str) -> None:
         """Entfernt einen Node anhand seiner ID."""
-        self.nodes = [node for node in self.nodes if node.node_id != node_id]
+        node = self._nodes_by_id.get(node_id)
+        if node is not None:
+            self.remove_node(node)
+
+    def find_nodes(self, reference: str) -> List[Node]:
+        """
+        Resolves a node reference as used on the command line and in parameter sweeps.
+
+        :param reference: A node id or a node type; a node type addresses every node of that type.
+        :return: The matching nodes.
+        :raises ValueError: If no node matches.
+        """
+        node = self.get_node_by_id(reference)
+        if node is not None:
+            return [node]
+
+        nodes = [node for node in self._nodes_by_id.values() if node.node_type == reference]
+        if not nodes:
+            raise ValueError(f"No node with id or type '{reference}' in the graph.")
+        return nodes
+
+    def sweep(self, assignments: List[Dict[str, object]], targets: Optional[List[Node]] = None,
+              max_workers: int = 1) -> "SweepResult":
+        """
+        Runs the graph once per parameter assignment and collects the values reaching the output nodes.
+        - Work that does not depend on the swept parameters is done once, see ParameterSweep.
+        - The nodes of the graph keep their parameters.
+
+        :param assignments: One dictionary per run, mapping "<node>.<parameter>" to a value
+                            (`parameter_sweep.expand_grid` builds them from a grid).
+        :param targets: The output nodes to collect, None for all output nodes.
+        :param max_workers: Number of assignments evaluated at the same time.
+        :return: The result table with one row per assignment.
+        :raises ValueError: If an assignment addresses an unknown node or parameter.
+        :raises NodeExecutionError: If a node fails.
+        """
+        from AINodes.src.execution.parameter_sweep import ParameterSweep
+
+        return ParameterSweep(self, targets).run(assignments, max_workers)
 
     def get_node_types(self) -> list:
         return list(self.node_factory.keys())
 
     def get_socket_by_id(self, socket_id):
         """Sucht einen Socket anhand seiner ID."""
-        for node in self.nodes:
-            for socket in node.inputs + node.outputs:
-                if socket.socket_id == socket_id:
-                    return socket
-        return None
+        return self._sockets_by_id.get(socket_id)
 
     def serialize_graph(self) -> dict:
         data = {
             "nodes": []
         }
 
-        for node in self.nodes:
+        for node in self._nodes_by_id.values():
+            if self.controller is not None:
+                position = self.controller.get_position(node.get_id())
+            else:
+                position = self.node_positions.get(node.get_id(), {"x": 0, "y": 0})
+
             node_data = {
-                "position": self.controller.get_position(node.get_id()),
+                "position": position,
                 "id": node.get_id(),
                 "type": node.__class__.__name__,
                 "params": node.serialize_parameters(),
@@ -192,46 +500,70 @@ class NodeEditor:
 
     def save_graph_to_file(self, filepath: str):
         graph_data = self.serialize_graph()
-        print(graph_data)
+        logger.debug(f"Saving graph with {len(graph_data['nodes'])} nodes to {filepath}")
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(graph_data, f, indent=4)
 
-    def load_graph_from_file(self, filepath: str):
-        node_registry = self.load_node_factory(NODES_JSON_PATH)
+    def load_graph_from_file(self, filepath: str) -> Dict[str, Node]:
+        """
+        Loads a graph saved with `save_graph_to_file` and adds it to the editor.
 
+        :param filepath: The path of the graph JSON file.
+        :return: A dictionary mapping the node ids to the loaded nodes.
+        """
         with open(filepath, "r", encoding="utf-8") as f:
             graph_data = json.load(f)
 
+        return self.load_graph(graph_data)
+
+    def load_graph(self, graph_data: dict) -> Dict[str, Node]:
+        """
+        Builds the nodes and connections of a serialized graph.
+        - With a controller, nodes and connections are added through it, so the views are created as well.
+        - Headless, they are added to the model directly and the node positions are kept for saving.
+
+        :param graph_data: The graph as returned by `serialize_graph`.
+        :return: A dictionary mapping the node ids to the loaded nodes.
+        """
         id_to_node = {}
 
         for node_data in graph_data["nodes"]:
-            if node_data["type"] in node_registry:
-                parameters = node_data.get("parameters", {})
-                new_node = self.create_node(node_data["type"], id = node_data["id"], parameters =  parameters)
-                x = node_data["position"]["x"]
-                y = node_data["position"]["y"]
+            if node_data["type"] not in self.node_factory:
+                logger.warning(f"Skipping node {node_data['id']} of unknown type {node_data['type']}")
+                continue
 
-                self.controller.add_node(new_node, x, y)
-                id_to_node[node_data["id"]] = new_node
+            parameters = node_data.get("parameters", {})
+            new_node = self.create_node(node_data["type"], id=node_data["id"], parameters=parameters)
+            position = node_data.get("position") or {"x": 0, "y": 0}
+
+            if self.controller is not None:
+                self.controller.add_node(new_node, position["x"], position["y"])
+            else:
+                self.add_node(new_node)
+                self.node_positions[new_node.get_id()] = {"x": position["x"], "y": position["y"]}
+            id_to_node[node_data["id"]] = new_node
 
         for node_data in graph_data["nodes"]:
             this_node = id_to_node.get(node_data["id"])
+            if this_node is None:
+                continue
             input_conns = node_data.get("input_connections", {})
 
             for input_key, conn in input_conns.items():
                 if conn is None:
-
                     continue
 
                 from_node = id_to_node.get(conn["connected_node"])
                 if not from_node:
-
                     continue
 
-
                 out_socket = next((s for s in from_node.outputs if s.socket_name == conn["connected_socket"]), None)
                 in_socket = next((s for s in this_node.inputs if s.socket_name == input_key), None)
 
                 if out_socket and in_socket:
-                    print("Weiter gegeben an Controller")
-                    self.controller.create_connection(out_socket.socket_id, in_socket.socket_id)
+                    if self.controller is not None:
+                        self.controller.create_connection(out_socket.socket_id, in_socket.socket_id)
+                    else:
+                        out_socket.connect(in_socket)
+
+        return id_to_node
@@ -0,0 +1,132 @@
+import importlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+from AINodes.src.core.node_discovery import BASE_PACKAGE, CORE_DIR, NodeDiscovery
+
+# Path to nodes.json in the data folder
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+NODES_JSON_PATH = os.path.join(DATA_DIR, "nodes.json")
+
+
+class LazyNodeClass:
+    """
+    Stands in for a node class listed in nodes.json.
+    - The module of the class is imported on first instantiation (or first attribute access),
+      so heavy dependencies like scikit-learn are only loaded when a node of that type is actually used.
+    - Calling the proxy creates an instance of the real class.
+    """
+
+    def __init__(self, node_name: str, class_path: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        :param node_name: The name under which the node is registered.
+        :param class_path: The full import path of the class ("package.module.ClassName").
+        :param metadata: Sockets, parameters and flags found by the node discovery (may be empty).
+        """
+        self.node_name = node_name
+        self.class_path = class_path
+        self.metadata: Dict[str, Any] = metadata or {}
+        self.module_name, self.class_name = class_path.rsplit(".", 1)
+        self._node_class = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._node_class is not None
+
+    def resolve(self) -> type:
+        """
+        Imports the module once and returns the real node class.
+
+        :return: The node class.
+        :raises ImportError: If the module can not be imported.
+        :raises AttributeError: If the module has no such class.
+        """
+        node_class = self._node_class
+        if node_class is None:
+            with self._lock:
+                if self._node_class is None:
+                    module = importlib.import_module(self.module_name)
+                    self._node_class = getattr(module, self.class_name)
+                node_class = self._node_class
+        return node_class
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the proxy does not have itself, e.g. `process_safe`
+        if name.startswith("__") or name in ("_node_class", "_lock", "metadata"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyNodeClass {self.node_name} -> {self.class_path} ({state})>"
+
+
+def _make_node_class(node_name: str, entry: Union[str, Dict[str, Any]]) -> LazyNodeClass:
+    """
+    Creates the proxy for a registry entry. Entries are either the class path or a dictionary
+    with the class path under "class" and the node metadata.
+    """
+    if isinstance(entry, str):
+        return LazyNodeClass(node_name, entry)
+    metadata = {key: value for key, value in entry.items() if key != "class"}
+    return LazyNodeClass(node_name, entry["class"], metadata)
+
+
+_registries: Dict[Tuple[str, float], Dict[str, LazyNodeClass]] = {}
+_plugin_nodes: Optional[Dict[str, LazyNodeClass]] = None
+_registries_lock = threading.Lock()
+
+
+def load_plugin_nodes() -> Dict[str, LazyNodeClass]:
+    """
+    Returns the nodes that installed packages register through the "ainodes.nodes" entry point group.
+    - Looked up once per process; the plugin modules are parsed, not imported.
+
+    :return: A dictionary mapping node names to lazily resolved node classes.
+    """
+    global _plugin_nodes
+
+    with _registries_lock:
+        if _plugin_nodes is None:
+            discovery = NodeDiscovery()
+            base_infos = discovery.scan_package(CORE_DIR, f"{BASE_PACKAGE}.core")
+            entries = discovery.discover_entry_points(base_infos)
+            discovery.save_cache()
+            _plugin_nodes = {node_name: _make_node_class(node_name, entry) for node_name, entry in entries.items()}
+        return _plugin_nodes
+
+
+def load_node_registry(json_file: str = NODES_JSON_PATH, include_plugins: bool = True) -> Dict[str, LazyNodeClass]:
+    """
+    Returns the node registry described by a nodes.json file.
+    - The registry is built once per process (and rebuilt only if the file changes).
+    - No node module is imported here, see LazyNodeClass.
+
+    :param json_file: The path to the JSON file containing node mappings.
+    :param include_plugins: Whether to add the nodes of installed plugin packages (see `load_plugin_nodes`).
+    :return: A dictionary mapping node names to lazily resolved node classes.
+    """
+    json_file = os.path.abspath(json_file)
+    key = (json_file, os.path.getmtime(json_file))
+
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            with open(json_file, "r", encoding="utf-8") as f:
+                node_mapping = json.load(f)
+
+            registry = {node_name: _make_node_class(node_name, entry) for node_name, entry in node_mapping.items()}
+            _registries[key] = registry
+
+    # Callers may add or remove entries without affecting other editors
+    registry = dict(registry)
+    if include_plugins:
+        for node_name, node_class in load_plugin_nodes().items():
+            registry.setdefault(node_name, node_class)
+    return registry
@@ -12,6 +12,8 @@ class OutputNode(Node, ABC):
     - They can only have input sockets (not output sockets).
     """
 
+    __slots__ = ()
+
     def __init__(self, node_type: str):
         """
         Initializes an output node with a unique identifier.
@@ -0,0 +1,130 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from AINodes.src.core.node import Node
+from AINodes.src.core.output_node import OutputNode
+
+
+class ExecutionPlan:
+    """
+    A compiled, topologically sorted view of the node graph.
+    - Contains every node that at least one target (output) node depends on.
+    - Upstream nodes always appear before the nodes that consume their outputs.
+    - Is built once and reused until nodes or connections change.
+    """
+
+    def __init__(self, order: List[Node], dependencies: Dict[Node, List[Node]],
+                 dependents: Dict[Node, List[Node]], revision: Tuple[int, int] = (0, 0)):
+        """
+        Initializes an execution plan. Use `ExecutionPlan.compile` to build one from a graph.
+
+        :param order: The nodes in a valid execution order.
+        :param dependencies: Maps each node to the distinct upstream nodes it reads from.
+        :param dependents: Maps each node to the distinct downstream nodes reading from it.
+        :param revision: The graph revision the plan was compiled for.
+        """
+        self.order: List[Node] = order
+        self.dependencies: Dict[Node, List[Node]] = dependencies
+        self.dependents: Dict[Node, List[Node]] = dependents
+        self.revision: Tuple[int, int] = revision
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def reset_nondeterministic_caches(self) -> None:
+        """
+        Prepares a run by clearing the caches of all non-deterministic nodes in the plan.
+        - All other nodes are validated through their output versions when they are executed,
+          so changes only propagate downstream and clean nodes keep their cached outputs.
+        """
+        for node in self.order:
+            if not node.deterministic:
+                node.reset_cache()
+
+    @staticmethod
+    def upstream_nodes(node: Node) -> List[Node]:
+        """
+        Returns the distinct nodes connected to the inputs of the given node.
+
+        :param node: The node whose upstream neighbours are requested.
+        :return: A list of upstream nodes in input socket order.
+        """
+        upstream = []
+        for input_socket in node.inputs:
+            connected = input_socket.connected_socket
+            if connected is not None and connected.parent_node not in upstream:
+                upstream.append(connected.parent_node)
+        return upstream
+
+    @staticmethod
+    def downstream_nodes(node: Node) -> List[Node]:
+        """
+        Returns the distinct nodes reading from the outputs of the given node, in O(number of connections).
+
+        :param node: The node whose downstream neighbours are requested.
+        :return: A list of downstream nodes in output socket and connection order.
+        """
+        downstream = []
+        seen = set()
+        for output_socket in node.outputs:
+            for input_socket in output_socket.consumers:
+                consumer = input_socket.parent_node
+                if consumer not in seen:
+                    seen.add(consumer)
+                    downstream.append(consumer)
+        return downstream
+
+    @classmethod
+    def compile(cls, nodes: Iterable[Node], targets: Optional[Iterable[Node]] = None,
+                revision: Tuple[int, int] = (0, 0)) -> "ExecutionPlan":
+        """
+        Compiles the graph into an execution plan.
+
+        Steps:
+        1. Collects all nodes the targets depend on (iteratively, no recursion).
+        2. Sorts them topologically using Kahn's algorithm.
+        3. Rejects graphs that contain a cycle.
+
+        :param nodes: All nodes of the graph.
+        :param targets: The nodes that should be executed. Defaults to all output nodes.
+        :param revision: The graph revision the plan is compiled for.
+        :return: The compiled execution plan.
+        :raises ValueError: If the graph contains a cycle.
+        """
+        if targets is None:
+            targets = [node for node in nodes if isinstance(node, OutputNode)]
+
+        # 1. Collect every node reachable upstream from the targets
+        dependencies: Dict[Node, List[Node]] = {}
+        stack = list(targets)
+        while stack:
+            node = stack.pop()
+            if node in dependencies:
+                continue
+            upstream = cls.upstream_nodes(node)
+            dependencies[node] = upstream
+            stack.extend(upstream)
+
+        dependents: Dict[Node, List[Node]] = {node: [] for node in dependencies}
+        for node, upstream in dependencies.items():
+            for upstream_node in upstream:
+                dependents[upstream_node].append(node)
+
+        # 2. Kahn's algorithm
+        remaining = {node: len(upstream) for node, upstream in dependencies.items()}
+        ready = deque(node for node, count in remaining.items() if count == 0)
+        order: List[Node] = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for dependent in dependents[node]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        # 3. Every node that was never released is part of (or behind) a cycle
+        if len(order) != len(dependencies):
+            blocked = [node.node_type for node, count in remaining.items() if count > 0]
+            raise ValueError(f"The node graph contains a cycle. Unresolved nodes: {', '.join(blocked)}")
+
+        return cls(order, dependencies, dependents, revision)
@@ -0,0 +1,181 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from AINodes.src.core.lazy_output import LazyOutput
+from AINodes.src.core.node import Node
+
+
+def payload_nbytes(value: Any) -> int:
+    """
+    Estimates the memory used by a node output.
+    - ndarrays report their buffer size, containers are summed up, everything else uses `sys.getsizeof`.
+    - Lazy outputs only count once they are evaluated (the executor evaluates the requested ones while measuring).
+
+    :param value: The node output.
+    :return: The estimated size in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, LazyOutput):
+        return payload_nbytes(value.get()) if value.is_evaluated else 0
+    if isinstance(value, dict):
+        return sum(payload_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(item, (int, float)) for item in value[:16]):
+            return sys.getsizeof(value) + len(value) * sys.getsizeof(value[0])
+        return sys.getsizeof(value) + sum(payload_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class NodeProfile:
+    """
+    Measurements of a single node execution.
+    """
+
+    def __init__(self, node: Node):
+        self.node_id: str = node.node_id
+        self.node_type: str = node.node_type
+        self.node_class: str = type(node).__name__
+        self.start: float = 0.0  # Seconds since the profiler was created
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        # "hit" (in memory), "disk" (persistent result cache), "released" (skipped, see `Node.release_output`),
+        # "restored" (released output recomputed for a consumer), "miss" or "error"
+        self.cache: str = "miss"
+        self.payload_bytes: int = 0
+        self.pid: int = os.getpid()
+        self.thread_id: int = threading.get_ident()
+        self.thread_name: str = threading.current_thread().name
+
+
+class ExecutionProfiler:
+    """
+    Records wall time, CPU time, cache status, payload size and the executing thread/process for every node.
+    - Executors only call into the profiler if one is attached, so profiling costs nothing when turned off.
+    - Lazy outputs (see LazyOutput) that a connected socket reads are evaluated while their node is measured,
+      so a lazily loaded dataset is charged to the loading node and not to its first consumer.
+    - Results can be exported as a Chrome/Perfetto trace (chrome://tracing, ui.perfetto.dev) or as a text summary.
+    """
+
+    def __init__(self):
+        self.records: List[NodeProfile] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self) -> None:
+        """
+        Discards all recorded measurements.
+        """
+        with self._lock:
+            self.records = []
+            self._origin = time.perf_counter()
+
+    def report_remote(self, cpu_time: float, pid: int) -> None:
+        """
+        Reports that the node currently measured on this thread was computed in another process.
+
+        :param cpu_time: The CPU time spent in the worker process.
+        :param pid: The process id of the worker.
+        """
+        self._local.remote = (cpu_time, pid)
+
+    @contextmanager
+    def measure(self, node: Node) -> Iterator[NodeProfile]:
+        """
+        Measures the execution of a node. The executor sets `cache` on the yielded record.
+
+        :param node: The node being executed.
+        :return: The record of the execution.
+        """
+        record = NodeProfile(node)
+        self._local.remote = None
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record.cache = "error"
+            raise
+        finally:
+            record.wall_time = time.perf_counter() - wall_start
+            record.cpu_time = time.thread_time() - cpu_start
+            record.start = wall_start - self._origin
+            remote = self._local.remote
+            if remote is not None:
+                record.cpu_time += remote[0]
+                record.pid = remote[1]
+            if record.cache != "error":
+                record.payload_bytes = payload_nbytes(node.output_cache)
+            with self._lock:
+                self.records.append(record)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Converts the measurements into the Chrome trace event format.
+
+        :return: The trace as a JSON-serializable dictionary.
+        """
+        events = []
+        threads = {}
+        for record in self.records:
+            threads[(record.pid, record.thread_id)] = record.thread_name
+            events.append({
+                "name": record.node_type,
+                "cat": record.cache,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.wall_time * 1e6,
+                "pid": record.pid,
+                "tid": record.thread_id,
+                "args": {
+                    "node_id": record.node_id,
+                    "class": record.node_class,
+                    "cpu_ms": round(record.cpu_time * 1e3, 3),
+                    "cache": record.cache,
+                    "payload_bytes": record.payload_bytes,
+                },
+            })
+
+        for (pid, thread_id), thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, filepath: str) -> None:
+        """
+        Writes the measurements as a Chrome/Perfetto trace JSON file.
+
+        :param filepath: The target file.
+        """
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def summary(self, limit: Optional[int] = None) -> str:
+        """
+        Returns a text table of all measurements, sorted by wall time (slowest first).
+
+        :param limit: Show at most this many rows.
+        :return: The formatted summary.
+        """
+        records = sorted(self.records, key=lambda record: record.wall_time, reverse=True)
+        if limit is not None:
+            records = records[:limit]
+
+        total_wall = sum(record.wall_time for record in self.records)
+        lines = [f"{'node':<32} {'wall ms':>10} {'cpu ms':>10} {'cache':>8} {'payload':>12}  thread"]
+        for record in records:
+            lines.append(
+                f"{record.node_type[:32]:<32} {record.wall_time * 1e3:>10.3f} {record.cpu_time * 1e3:>10.3f} "
+                f"{record.cache:>8} {record.payload_bytes:>12,}  {record.thread_name} (pid {record.pid})"
+            )
+        lines.append(f"{len(self.records)} node executions, {total_wall * 1e3:.3f} ms total wall time")
+        return "\n".join(lines)
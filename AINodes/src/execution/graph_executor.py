@@ -0,0 +1,196 @@
+from abc import ABC, abstractmethod
+import threading
+from typing import Any, Callable, Dict, Optional, Set, TYPE_CHECKING
+
+from AINodes.src.core.lazy_output import materialize
+from AINodes.src.core.node import Node
+from AINodes.src.execution.execution_plan import ExecutionPlan
+
+if TYPE_CHECKING:
+    from AINodes.src.execution.execution_profiler import ExecutionProfiler, NodeProfile
+    from AINodes.src.execution.result_cache import ResultCache
+    from AINodes.src.execution.spill_manager import SpillManager
+
+
+class NodeExecutionError(RuntimeError):
+    """
+    Raised when a node fails during the execution of a plan.
+    - Keeps a reference to the failing node.
+    - The original exception is available as `__cause__`.
+    """
+
+    def __init__(self, node: Node, error: BaseException):
+        super().__init__(f"Node '{node.node_type}' ({node.node_id}) failed: {error!r}")
+        self.node = node
+        self.error = error
+
+
+class RunCancelled(Exception):
+    """
+    Raised by `GraphExecutor.run` when the run was cancelled through `cancel_event`.
+    - Nodes that were already executed keep their outputs, so the next run continues from there.
+    """
+
+
+class GraphExecutor(ABC):
+    """
+    Abstract base class for all execution backends of the NodeEditor.
+    - Receives a compiled execution plan and runs its nodes.
+    - Subclasses decide how (sequentially, on threads, ...) the nodes are scheduled.
+    """
+
+    def __init__(self):
+        self.result_cache: Optional["ResultCache"] = None  # Optional persistent cache for node outputs
+        self.profiler: Optional["ExecutionProfiler"] = None  # Optional per-node profiler, off by default
+        # Drop every output as soon as its last downstream consumer in the plan has read it
+        self.release_outputs: bool = False
+        # Optional memory budget for node outputs, large arrays beyond it are moved to memory-mapped files
+        self.spill_manager: Optional["SpillManager"] = None
+        # Set for a single run (see `NodeEditor.run_plan`): cancellation is checked before every node,
+        # the callback is called on the thread that called `run` after every finished node
+        self.cancel_event: Optional[threading.Event] = None
+        self.progress_callback: Optional[Callable[[Node], None]] = None
+        # Released nodes the running plan recomputes, see `find_restores`
+        self.restores: Set[Node] = set()
+
+    @abstractmethod
+    def run(self, plan: ExecutionPlan) -> None:
+        """
+        Executes every node of the plan, respecting its dependencies.
+
+        :param plan: The compiled execution plan.
+        :raises NodeExecutionError: If a node raises an exception.
+        :raises RunCancelled: If `cancel_event` is set during the run.
+        """
+        pass
+
+    def execute_node(self, node: Node) -> Any:
+        """
+        Executes a single node whose upstream nodes have already been executed.
+        - Returns the cached output if it is still valid.
+        - Skips unchanged nodes whose output was released, unless the plan needs them again (see `find_restores`).
+        - Otherwise consults the persistent result cache (if enabled) before computing the node.
+        - While profiling, the lazy outputs that connected sockets will read are evaluated inside the measurement,
+          so their cost and size are attributed to this node instead of to the first consumer.
+
+        :param node: The node to execute.
+        :return: The node's output.
+        :raises NodeExecutionError: If the node raises an exception.
+        :raises RunCancelled: If `cancel_event` is set.
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise RunCancelled()
+        if self.profiler is None:
+            return self._execute_node(node)
+        with self.profiler.measure(node) as record:
+            result = self._execute_node(node, record)
+            if record.cache != "released":
+                try:
+                    materialize(node.output_cache, node.requested_outputs())
+                except Exception as e:
+                    raise NodeExecutionError(node, e) from e
+            return result
+
+    def _execute_node(self, node: Node, record: Optional["NodeProfile"] = None) -> Any:
+        try:
+            if node.is_cache_valid():
+                if record is not None:
+                    record.cache = "hit"
+                return node.output_cache
+            if node.is_released and node.is_state_current():
+                if node not in self.restores:
+                    if record is not None:
+                        record.cache = "released"
+                    return None
+                if record is not None:
+                    record.cache = "restored"
+            if self.result_cache is not None:
+                result, hit = self.result_cache.execute(node, self.compute_node)
+                if hit and record is not None:
+                    record.cache = "disk"
+                return result
+            return self.compute_node(node)
+        except NodeExecutionError:
+            raise
+        except Exception as e:
+            raise NodeExecutionError(node, e) from e
+
+    def find_restores(self, plan: ExecutionPlan) -> Set[Node]:
+        """
+        Finds the released nodes (see `Node.release_output`) whose output is read again during a run.
+        - A released node is restored if a node downstream of it in the plan is computed, or if it is a target.
+        - Restored nodes are executed in plan order like every other node, so a consumer never recomputes
+          its released inputs recursively while reading them.
+        - Conservative: a node counts as computed if it or any of its upstream nodes is not current.
+
+        :param plan: The plan that is about to run.
+        :return: The released nodes to recompute.
+        """
+        if not any(node.is_released for node in plan.order):
+            return set()
+
+        changes: Dict[Node, bool] = {}
+        for node in plan.order:
+            changes[node] = (not node.is_state_current() or (not node.has_output and not node.is_released)
+                             or any(changes[upstream] for upstream in plan.dependencies[node]))
+
+        restores: Set[Node] = set()
+        for node in reversed(plan.order):
+            if not node.is_released or changes[node]:
+                continue
+            dependents = plan.dependents[node]
+            if not dependents or any(changes[dependent] or dependent in restores for dependent in dependents):
+                restores.add(node)
+        return restores
+
+    def count_consumers(self, plan: ExecutionPlan) -> Optional[Dict[Node, int]]:
+        """
+        Prepares the reference counts for releasing outputs during a run.
+
+        :param plan: The plan that is about to run.
+        :return: The number of downstream nodes in the plan per node, or None if outputs are not released.
+        """
+        if not self.release_outputs:
+            return None
+        return {node: len(plan.dependents[node]) for node in plan.order}
+
+    def finish_node(self, plan: ExecutionPlan, node: Node, consumers: Optional[Dict[Node, int]]) -> None:
+        """
+        Called by `run` (on the calling thread) after a node has been executed or found valid.
+        - Releases the outputs of the upstream nodes that have no consumers left in this run
+          (see `Node.release_output`). Nodes without consumers in the plan (the targets) and pinned nodes
+          keep their outputs.
+        - Lets the spill manager (if enabled) move outputs to disk when the memory budget is exceeded.
+        - Reports the node to `progress_callback`.
+
+        :param plan: The running plan.
+        :param node: The node that has been executed.
+        :param consumers: The reference counts from `count_consumers`.
+        """
+        if consumers is not None:
+            for upstream in plan.dependencies[node]:
+                consumers[upstream] -= 1
+                if consumers[upstream] == 0:
+                    upstream.release_output()
+
+        if self.spill_manager is not None:
+            self.spill_manager.finish_node(node, plan.dependencies[node])
+
+        if self.progress_callback is not None:
+            self.progress_callback(node)
+
+    def compute_node(self, node: Node) -> Any:
+        """
+        Computes a node whose cached output is invalid and stores the result.
+
+        :param node: The node to compute.
+        :return: The node's output.
+        """
+        return node.execute()
+
+    def shutdown(self) -> None:
+        """
+        Releases all resources (e.g. worker threads, spill files) held by the executor.
+        """
+        if self.spill_manager is not None:
+            self.spill_manager.close()
@@ -0,0 +1,97 @@
+import os
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def _read_status_kb(field: str) -> Optional[int]:
+    try:
+        with open(_PROC_STATUS, "r") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def current_rss() -> Optional[int]:
+    """
+    Returns the current resident set size of this process in bytes, or None if it can not be determined.
+    """
+    kilobytes = _read_status_kb("VmRSS")
+    return kilobytes * 1024 if kilobytes is not None else None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Returns the peak resident set size of this process in bytes (since start or since the last `reset_peak_rss`).
+    """
+    kilobytes = _read_status_kb("VmHWM")
+    if kilobytes is not None:
+        return kilobytes * 1024
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes everywhere else
+    return max_rss if os.uname().sysname == "Darwin" else max_rss * 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the peak resident set size to the current one (Linux only).
+
+    :return: True if the peak was reset, False if `peak_rss()` keeps reporting the peak since process start.
+    """
+    try:
+        with open(_PROC_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class PeakRssMonitor:
+    """
+    Measures the peak resident set size of this process while a block runs:
+
+        with PeakRssMonitor() as monitor:
+            ...
+        print(monitor.peak_bytes)
+
+    - Only covers the current process, not worker processes.
+    - Where the peak can not be reset (other systems than Linux), `per_run` is False and
+      `peak_bytes` is the peak since process start.
+    """
+
+    def __init__(self):
+        self.start_bytes: Optional[int] = None
+        self.peak_bytes: Optional[int] = None
+        self.per_run: bool = False
+
+    def __enter__(self) -> "PeakRssMonitor":
+        self.per_run = reset_peak_rss()
+        self.start_bytes = current_rss()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.peak_bytes = peak_rss()
+
+    def describe(self) -> str:
+        """
+        Formats the measurement for the log.
+        """
+        if self.peak_bytes is None:
+            return "Peak RSS not available on this system"
+        text = f"Peak RSS {self.peak_bytes / 1024 ** 2:.1f} MiB"
+        if self.start_bytes is not None:
+            text += f" (+{max(self.peak_bytes - self.start_bytes, 0) / 1024 ** 2:.1f} MiB during the run)"
+        if not self.per_run:
+            text += ", measured since process start"
+        return text
@@ -0,0 +1,272 @@
+import csv
+import itertools
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from AINodes.src.core.node import Node
+from AINodes.src.execution.execution_plan import ExecutionPlan
+from AINodes.src.execution.graph_executor import GraphExecutor
+from AINodes.src.execution.sequential_executor import SequentialExecutor
+from AINodes.src.execution.thread_pool_executor import ThreadPoolGraphExecutor
+
+if TYPE_CHECKING:
+    from AINodes.src.core.node_editor import NodeEditor
+
+
+def expand_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expands a parameter grid into the list of all combinations.
+
+    :param grid: Maps "<node>.<parameter>" to the values to try.
+    :return: One assignment per combination, e.g. [{"A.x": 1, "B.y": 3}, {"A.x": 1, "B.y": 4}, ...].
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+class SweepResult:
+    """
+    The results of a parameter sweep as a table: one row per assignment, one column per swept parameter
+    followed by one column per input of every output node.
+    """
+
+    def __init__(self, columns: List[str], rows: List[List[Any]]):
+        self.columns: List[str] = columns
+        self.rows: List[List[Any]] = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        :return: The rows as dictionaries mapping column names to values.
+        """
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def to_csv(self, path: str) -> None:
+        """
+        Writes the table to a CSV file. Values are written as text.
+
+        :param path: The path of the CSV file.
+        """
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(self.rows)
+
+    def format(self, max_width: int = 40) -> str:
+        """
+        Formats the table as aligned text.
+
+        :param max_width: Longer cell values are cut off.
+        :return: The table.
+        """
+        def cell(value: Any) -> str:
+            text = f"{value:.6g}" if isinstance(value, float) else str(value)
+            text = " ".join(text.split())
+            return text if len(text) <= max_width else text[:max_width - 1] + "…"
+
+        table = [self.columns] + [[cell(value) for value in row] for row in self.rows]
+        widths = [max(len(row[index]) for row in table) for index in range(len(self.columns))]
+        lines = ["  ".join(text.ljust(width) for text, width in zip(row, widths)).rstrip() for row in table]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+
+class ParameterSweep:
+    """
+    Runs a graph for a list of parameter assignments and collects the values reaching the output nodes.
+    - Nodes that do not depend on any swept parameter are executed once and shared by all assignments.
+    - The varying subgraph (the swept nodes and everything downstream of them) is cloned per assignment;
+      the clones read the shared outputs directly, nothing is copied. The graph itself is not changed,
+      the clones are not registered as consumers of the shared nodes (see `InputSocket.read_from`).
+    - The clones run on executors of the sweep that never release outputs, so the shared nodes keep theirs
+      for all assignments. In parallel, every worker thread uses its own sequential executor; the parallelism
+      comes from the assignments. Otherwise one executor of the editor's kind runs all assignments.
+    """
+
+    def __init__(self, editor: "NodeEditor", targets: Optional[List[Node]] = None):
+        """
+        :param editor: The editor holding the graph.
+        :param targets: The output nodes whose inputs are collected (defaults to all output nodes).
+        """
+        self.editor = editor
+        self.targets = targets
+
+    def _resolve(self, assignments: List[Dict[str, Any]]) -> List[Dict[Node, Dict[str, Any]]]:
+        """
+        Resolves "<node>.<parameter>" keys, a node is referenced by its id or its type.
+
+        :raises ValueError: If a key is malformed or addresses an unknown node or parameter.
+        """
+        resolved = []
+        for assignment in assignments:
+            overrides: Dict[Node, Dict[str, Any]] = {}
+            for target, value in assignment.items():
+                reference, _, key = target.rpartition(".")
+                if not reference or not key:
+                    raise ValueError(f"Invalid sweep parameter '{target}', expected <node>.<parameter>.")
+                for node in self.editor.find_nodes(reference):
+                    if key not in node.serialize_parameters():
+                        raise ValueError(f"Node {node.node_id} ({node.node_type}) has no parameter '{key}'.")
+                    overrides.setdefault(node, {})[key] = value
+            resolved.append(overrides)
+        return resolved
+
+    @staticmethod
+    def _varying_nodes(plan: ExecutionPlan, swept: Set[Node]) -> List[Node]:
+        """
+        Returns the nodes of the plan that depend on a swept node (including the swept nodes), in plan order.
+        """
+        varying = set()
+        stack = [node for node in swept if node in plan.dependents]
+        while stack:
+            node = stack.pop()
+            if node not in varying:
+                varying.add(node)
+                stack.extend(plan.dependents[node])
+        return [node for node in plan.order if node in varying]
+
+    @staticmethod
+    def _columns(targets: List[Node]) -> List[Tuple[str, Node, int]]:
+        """
+        Names one column per connected input of every target: "<type>" or "<type>.<socket>",
+        prefixed with the node id where the type alone is ambiguous.
+        """
+        type_counts: Dict[str, int] = {}
+        for node in targets:
+            type_counts[node.node_type] = type_counts.get(node.node_type, 0) + 1
+
+        columns = []
+        for node in targets:
+            label = node.node_type if type_counts[node.node_type] == 1 else f"{node.node_type}[{node.node_id}]"
+            connected = [index for index, socket in enumerate(node.inputs) if socket.connected_socket is not None]
+            for index in connected:
+                name = label if len(connected) == 1 else f"{label}.{node.inputs[index].socket_name}"
+                columns.append((name, node, index))
+        return columns
+
+    def run(self, assignments: List[Dict[str, Any]], max_workers: int = 1) -> SweepResult:
+        """
+        Runs the sweep.
+
+        :param assignments: One dictionary per run, mapping "<node>.<parameter>" to a value (see `expand_grid`).
+        :param max_workers: Number of assignments evaluated at the same time.
+        :return: The result table, in the order of the assignments.
+        :raises ValueError: If an assignment addresses an unknown node or parameter.
+        :raises NodeExecutionError: If a node fails.
+        """
+        resolved = self._resolve(assignments)
+        swept = {node for overrides in resolved for node in overrides}
+
+        plan = self.editor.get_execution_plan(self.targets)
+        targets = [node for node in plan.order if not plan.dependents[node]]
+        varying = self._varying_nodes(plan, swept)
+        varying_set = set(varying)
+
+        # 1. Everything that does not depend on a swept parameter runs once
+        boundary = []
+        for node in varying:
+            for upstream in plan.dependencies[node]:
+                if upstream not in varying_set and upstream not in boundary:
+                    boundary.append(upstream)
+        shared_targets = [node for node in targets if node not in varying_set]
+        if boundary or shared_targets:
+            self.editor.execute(boundary + shared_targets)
+
+        columns = self._columns(targets)
+        parameter_names = list(dict.fromkeys(key for assignment in assignments for key in assignment))
+
+        # 2. The varying subgraph runs once per assignment
+        parallel = max_workers > 1 and len(assignments) > 1
+        worker_state = threading.local()
+        worker_executors: List[GraphExecutor] = []
+
+        def executor() -> GraphExecutor:
+            worker_executor = getattr(worker_state, "executor", None)
+            if worker_executor is None:
+                worker_executor = worker_state.executor = self._worker_executor(parallel)
+                worker_executors.append(worker_executor)
+            return worker_executor
+
+        def run_assignment(index: int) -> List[Any]:
+            clones = self._clone(varying, varying_set, resolved[index])
+            try:
+                clone_targets = [clones[node] for node in targets if node in varying_set]
+                if clone_targets:
+                    executor().run(ExecutionPlan.compile(clones.values(), clone_targets))
+                values = [clones.get(node, node).inputs[socket_index].pass_data()
+                          for _, node, socket_index in columns]
+            finally:
+                self._discard(clones)
+            return [assignments[index].get(name) for name in parameter_names] + values
+
+        try:
+            if parallel:
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AINodesSweep") as pool:
+                    rows = list(pool.map(run_assignment, range(len(assignments))))
+            else:
+                rows = [run_assignment(index) for index in range(len(assignments))]
+        finally:
+            for worker_executor in worker_executors:
+                worker_executor.shutdown()
+
+        return SweepResult(parameter_names + [name for name, _, _ in columns], rows)
+
+    def _worker_executor(self, parallel: bool) -> GraphExecutor:
+        """
+        Creates the executor that runs the clones of one worker thread (or of the whole sweep).
+        - Outputs are not released: the plans of the clones contain the shared nodes, which must keep their outputs
+          for the other assignments, and the clone targets are read after the plan has run.
+        - Shares the result cache and the profiler of the editor's executor.
+
+        :param parallel: Whether assignments run on several threads; each thread then runs sequentially.
+        """
+        editor_executor = self.editor.executor
+        if not parallel and isinstance(editor_executor, ThreadPoolGraphExecutor):
+            worker_executor = type(editor_executor)(editor_executor.max_workers)
+        else:
+            worker_executor = SequentialExecutor()
+        worker_executor.result_cache = editor_executor.result_cache
+        worker_executor.profiler = editor_executor.profiler
+        return worker_executor
+
+    def _clone(self, varying: List[Node], varying_set: Set[Node],
+               overrides: Dict[Node, Dict[str, Any]]) -> Dict[Node, Node]:
+        """
+        Creates a copy of the varying subgraph with the parameters of one assignment.
+        - Inputs reading from a shared node read that node's output sockets without being registered as their
+          consumers, so neither the shared nodes nor the compiled plans of the editor change.
+
+        :return: Maps every original node to its clone.
+        """
+        clones: Dict[Node, Node] = {}
+        for node in varying:
+            parameters = dict(node.serialize_parameters())
+            parameters.update(overrides.get(node, {}))
+            clone = type(node)(node.node_type, **parameters)  # node_type need not be a registry key
+            clone.set_id(str(uuid.uuid4()))
+            for input_socket, clone_input in zip(node.inputs, clone.inputs):
+                connected = input_socket.connected_socket
+                if connected is None:
+                    continue
+                source = connected.parent_node
+                if source in varying_set:
+                    connected = clones[source].outputs[source.outputs.index(connected)]
+                    clone_input.read_from(connected, register=True)
+                else:
+                    clone_input.read_from(connected)
+            clones[node] = clone
+        return clones
+
+    @staticmethod
+    def _discard(clones: Dict[Node, Node]) -> None:
+        """
+        Drops the outputs of the clones and their references to the shared nodes.
+        """
+        for clone in clones.values():
+            for clone_input in clone.inputs:
+                clone_input.connected_socket = None
+            clone.reset_cache()
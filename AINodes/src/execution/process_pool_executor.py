@@ -0,0 +1,190 @@
+import importlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from AINodes.src.core.lazy_output import materialize
+from AINodes.src.core.node import Node
+from AINodes.src.execution.shared_array import share_arrays, restore_arrays, release_segments
+from AINodes.src.execution.thread_pool_executor import ThreadPoolGraphExecutor
+from AINodes.src.sockets.output_socket import OutputSocket
+
+# Modules every worker imports once at start-up, so the first task does not pay for them
+WARM_MODULES = (
+    "numpy",
+    "sklearn.linear_model",
+    "sklearn.model_selection",
+    "sklearn.metrics",
+)
+
+# On Windows a shared memory segment disappears as soon as its creator closes it, so results are pickled there
+RETURN_VIA_SHARED_MEMORY = os.name != "nt"
+
+
+class _ValueSource:
+    """
+    Stands in for the upstream node of a _ValueSocket. Its output never changes.
+    """
+
+    output_version = 0
+
+
+class _ValueSocket(OutputSocket):
+    """
+    An output socket without a real parent node that provides a fixed value.
+    - Used inside worker processes to feed the transported input values into a node.
+    """
+
+    def __init__(self, data_type: str, value: Any):
+        super().__init__(_ValueSource(), data_type, "value")
+        self.value = value
+
+    def pass_data(self) -> Any:
+        return self.value
+
+
+_node_classes: Dict[Tuple[str, str], type] = {}
+
+
+def _warm_up_worker(module_names: Tuple[str, ...]) -> None:
+    """
+    Initializer of every worker process. Imports the heavy modules up front.
+
+    :param module_names: The modules to import.
+    """
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+def _compute_in_worker(module_name: str, class_name: str, node_type: str, parameters: dict,
+                       data_types: Dict[str, str], inputs: Dict[str, Any], requested: List[str]) -> Any:
+    """
+    Rebuilds a node inside a worker process and runs its `compute()`.
+
+    :param module_name: The module of the node class.
+    :param class_name: The name of the node class.
+    :param node_type: The node type passed to the constructor.
+    :param parameters: The node parameters as returned by `serialize_parameters()`.
+    :param data_types: Maps input socket names to their data types.
+    :param inputs: Maps input socket names to their (shared) values.
+    :param requested: The outputs that are read in the parent process, only these lazy outputs are evaluated.
+    :return: A tuple (result of `compute()` with large arrays moved to shared memory, CPU time, worker pid).
+    """
+    cpu_start = time.process_time()
+    node_class = _node_classes.get((module_name, class_name))
+    if node_class is None:
+        node_class = getattr(importlib.import_module(module_name), class_name)
+        _node_classes[(module_name, class_name)] = node_class
+
+    input_segments = []
+    value_sockets = []
+    try:
+        values = restore_arrays(inputs, input_segments)
+        node = node_class(node_type, **parameters)
+        for input_socket in node.inputs:
+            if input_socket.socket_name in values:
+                value_socket = _ValueSocket(data_types[input_socket.socket_name], values[input_socket.socket_name])
+                input_socket.connect(value_socket)
+                value_sockets.append(value_socket)
+        del values
+
+        result = materialize(node.compute(), requested)
+        if not RETURN_VIA_SHARED_MEMORY:
+            return result, time.process_time() - cpu_start, os.getpid()
+
+        # The parent process unlinks the result segments after copying them
+        result_segments = []
+        shared_result = share_arrays(result, result_segments)
+        release_segments(result_segments)
+        return shared_result, time.process_time() - cpu_start, os.getpid()
+    finally:
+        for value_socket in value_sockets:
+            value_socket.value = None
+        release_segments(input_segments)
+
+
+class ProcessPoolGraphExecutor(ThreadPoolGraphExecutor):
+    """
+    Executes process-safe nodes (see `Node.process_safe`) in a pool of warm worker processes.
+    - Scheduling works like in ThreadPoolGraphExecutor; a coordinating thread waits for each worker task.
+    - Nodes that are not process-safe are executed on the coordinating thread.
+    - Large ndarrays travel through `multiprocessing.shared_memory` instead of being pickled.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initializes the executor. The worker processes are started lazily on the first run.
+
+        :param max_workers: Maximum number of worker processes and coordinating threads.
+        """
+        super().__init__(max_workers)
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up_worker,
+                initargs=(WARM_MODULES,),
+            )
+        return self._process_pool
+
+    def compute_node(self, node: Node) -> Any:
+        """
+        Computes a node, routing process-safe nodes to a worker process.
+
+        :param node: The node to compute.
+        :return: The node's output.
+        """
+        if not node.process_safe:
+            return super().compute_node(node)
+
+        revision = node.parameter_revision
+        result = self.compute_in_process(node)
+        node.store_output(result, revision)
+        return result
+
+    def compute_in_process(self, node: Node) -> Any:
+        """
+        Runs `compute()` of a node in a worker process.
+        - The input values are read from the (already executed) upstream nodes and shared with the worker.
+
+        :param node: The process-safe node.
+        :return: The result of `compute()`.
+        """
+        inputs = {}
+        data_types = {}
+        for input_socket in node.inputs:
+            if input_socket.connected_socket is not None:
+                inputs[input_socket.socket_name] = input_socket.pass_data()
+                data_types[input_socket.socket_name] = input_socket.data_type
+
+        node_class = type(node)
+        input_segments = []
+        result_segments = []
+        try:
+            shared_inputs = share_arrays(inputs, input_segments)
+            future = self.process_pool.submit(
+                _compute_in_worker, node_class.__module__, node_class.__name__, node.node_type,
+                node.serialize_parameters(), data_types, shared_inputs, node.requested_outputs()
+            )
+            shared_result, cpu_time, pid = future.result()
+            if self.profiler is not None:
+                self.profiler.report_remote(cpu_time, pid)
+            return restore_arrays(shared_result, result_segments, copy=True)
+        finally:
+            release_segments(input_segments, unlink=True)
+            release_segments(result_segments, unlink=True)
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the coordinating threads and the worker processes.
+        """
+        super().shutdown()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
@@ -0,0 +1,274 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from AINodes.src.core.lazy_output import materialize
+from AINodes.src.core.node import Node
+from AINodes.src.utils.logger import logger
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ainodes", "results")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+# Bump when the key derivation or the entry layout changes, old entries are then ignored
+CACHE_FORMAT_VERSION = 2
+
+RESULT_FILE = "result.pkl"
+
+
+class _ArrayRef:
+    """
+    Placeholder for an ndarray that is stored in a separate .npy file of a cache entry.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+
+def hash_value(value: Any) -> Optional[str]:
+    """
+    Computes a content hash of a socket value.
+
+    :param value: The value (ndarrays are hashed by dtype, shape and raw bytes, everything else by its pickle).
+    :return: The hex digest, or None if the value can not be hashed.
+    """
+    digest = hashlib.sha256()
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        digest.update(f"ndarray:{value.dtype.str}:{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).data)
+        return digest.hexdigest()
+
+    try:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return None
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Opt-in persistent, content-addressed cache for node outputs.
+    - The key hashes the node class, its `serialize_parameters()`, its `external_state()` and the content of its inputs.
+      Inputs coming from a cached node are identified by that node's key, so large upstream
+      values do not have to be hashed again.
+    - Each entry is a directory with a pickle of the result; ndarrays are stored as separate .npy files.
+      Lazy outputs are only evaluated and stored if a socket reads them.
+    - The total size is limited, the least recently used entries are evicted first.
+    - Non-deterministic nodes and nodes without outputs (which only exist for their side effects) are never cached.
+    - Nodes with an external state (e.g. file inputs) get a key for their downstream nodes, but their output
+      is not stored: the file they read already is on disk.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the cache. Existing entries in the directory are reused.
+
+        :param cache_dir: The directory holding the cache entries.
+        :param max_bytes: The maximum total size of all entries.
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Tuple[int, float]]] = None  # key -> (size, last access), loaded lazily
+
+    def make_key(self, node: Node) -> Optional[str]:
+        """
+        Computes the content key of a node from its class, parameters, external state and inputs.
+        - Must be called after all upstream nodes have been executed.
+
+        :param node: The node.
+        :return: The key, or None if the node must not be cached.
+        """
+        if not node.deterministic or not node.outputs:
+            return None
+
+        node_class = type(node)
+        try:
+            parameters = json.dumps(node.serialize_parameters(), sort_keys=True, default=repr)
+            external_state = json.dumps(node.external_state(), sort_keys=True, default=repr)
+        except (TypeError, ValueError):
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_FORMAT_VERSION}:{node_class.__module__}.{node_class.__qualname__}:"
+                      f"{parameters}:{external_state}".encode())
+        for input_socket in node.inputs:
+            connected = input_socket.connected_socket
+            if connected is None:
+                input_key = "unconnected"
+            elif connected.parent_node.content_key is not None:
+                input_key = f"{connected.parent_node.content_key}/{connected.socket_name}"
+            else:
+                input_key = hash_value(connected.pass_data())
+                if input_key is None:
+                    return None
+            digest.update(f"|{input_socket.socket_name}={input_key}".encode())
+        return digest.hexdigest()
+
+    def execute(self, node: Node, compute: Callable[[Node], Any]) -> Tuple[Any, bool]:
+        """
+        Serves a node's output from the cache or computes and stores it.
+
+        :param node: The node to execute (its upstream nodes must already be executed).
+        :param compute: Computes the node and stores its output, used on a cache miss.
+        :return: A tuple (output, served from the cache).
+        """
+        revision = node.parameter_revision  # The key is built from the parameters at this point
+        key = self.make_key(node)
+        if key is None:
+            return compute(node), False
+
+        if node.external_state() is not None:
+            result = compute(node)
+            node.content_key = key
+            return result, False
+
+        found, value = self.load(key)
+        if found:
+            self.hits += 1
+            for input_socket in node.inputs:
+                input_socket.mark_current()
+            node.store_output(value, revision)
+            node.content_key = key
+            return value, True
+
+        self.misses += 1
+        result = compute(node)
+        self.store(key, materialize(result, node.requested_outputs()))
+        node.content_key = key
+        return result, False
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _load_index(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Scans the cache directory once to learn the size and last access time of all entries.
+        """
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isdir(self.cache_dir):
+                for prefix in os.listdir(self.cache_dir):
+                    prefix_dir = os.path.join(self.cache_dir, prefix)
+                    if not os.path.isdir(prefix_dir):
+                        continue
+                    for key in os.listdir(prefix_dir):
+                        entry_dir = os.path.join(prefix_dir, key)
+                        if os.path.isfile(os.path.join(entry_dir, RESULT_FILE)):
+                            self._entries[key] = (self._dir_size(entry_dir), os.path.getmtime(entry_dir))
+        return self._entries
+
+    @staticmethod
+    def _dir_size(path: str) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+    def load(self, key: str) -> Tuple[bool, Any]:
+        """
+        Loads an entry from the cache.
+
+        :param key: The content key.
+        :return: A tuple (found, value).
+        """
+        with self._lock:
+            entries = self._load_index()
+            if key not in entries:
+                return False, None
+
+            entry_dir = self._entry_dir(key)
+            try:
+                with open(os.path.join(entry_dir, RESULT_FILE), "rb") as f:
+                    payload = pickle.load(f)
+                value = self._restore_arrays(payload, entry_dir)
+                os.utime(entry_dir)  # Mark as recently used
+            except Exception as e:
+                logger.warning(f"Dropping unreadable result cache entry {key}: {e}")
+                entries.pop(key, None)
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                return False, None
+
+            entries[key] = (entries[key][0], os.path.getmtime(entry_dir))
+            return True, value
+
+    def store(self, key: str, value: Any) -> None:
+        """
+        Stores a value under the given key and evicts old entries if the size limit is exceeded.
+        - Values that can not be pickled are silently not cached.
+
+        :param key: The content key.
+        :param value: The node output.
+        """
+        with self._lock:
+            entries = self._load_index()
+            if key in entries:
+                return
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir)
+            try:
+                arrays: List[np.ndarray] = []
+                payload = self._extract_arrays(value, arrays)
+                for index, array in enumerate(arrays):
+                    np.save(os.path.join(temp_dir, f"{index}.npy"), array, allow_pickle=False)
+                with open(os.path.join(temp_dir, RESULT_FILE), "wb") as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+                entry_dir = self._entry_dir(key)
+                os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+                os.replace(temp_dir, entry_dir)
+            except Exception as e:
+                logger.debug(f"Result for cache key {key} is not cacheable: {e}")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return
+
+            entries[key] = (self._dir_size(entry_dir), os.path.getmtime(entry_dir))
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries until the total size is within the limit.
+        """
+        total = sum(size for size, _ in self._entries.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            del self._entries[key]
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._entries = {}
+
+    def _extract_arrays(self, value: Any, arrays: List[np.ndarray]) -> Any:
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            arrays.append(value)
+            return _ArrayRef(f"{len(arrays) - 1}.npy")
+        if isinstance(value, dict):
+            return {key: self._extract_arrays(item, arrays) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._extract_arrays(item, arrays) for item in value)
+        return value
+
+    def _restore_arrays(self, payload: Any, entry_dir: str) -> Any:
+        if isinstance(payload, _ArrayRef):
+            return np.load(os.path.join(entry_dir, payload.filename), allow_pickle=False)
+        if isinstance(payload, dict):
+            return {key: self._restore_arrays(item, entry_dir) for key, item in payload.items()}
+        if isinstance(payload, (list, tuple)):
+            return type(payload)(self._restore_arrays(item, entry_dir) for item in payload)
+        return payload
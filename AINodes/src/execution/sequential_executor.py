@@ -0,0 +1,22 @@
+from AINodes.src.execution.execution_plan import ExecutionPlan
+from AINodes.src.execution.graph_executor import GraphExecutor
+
+
+class SequentialExecutor(GraphExecutor):
+    """
+    Executes the nodes of a plan one after another on the calling thread.
+    """
+
+    def run(self, plan: ExecutionPlan) -> None:
+        """
+        Executes the nodes in topological order.
+        - Releases outputs that are no longer needed if `release_outputs` is set.
+
+        :param plan: The compiled execution plan.
+        :raises NodeExecutionError: If a node raises an exception.
+        """
+        consumers = self.count_consumers(plan)
+        self.restores = self.find_restores(plan)
+        for node in plan.order:
+            self.execute_node(node)
+            self.finish_node(plan, node, consumers)
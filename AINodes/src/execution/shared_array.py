@@ -0,0 +1,117 @@
+import threading
+from multiprocessing import shared_memory
+from typing import Any, List
+
+import numpy as np
+
+# Arrays smaller than this are cheaper to pickle than to copy into a shared memory segment
+MIN_SHARED_BYTES = 64 * 1024
+
+# Segments that could not be closed yet because an array view still uses them
+_deferred_segments: List[shared_memory.SharedMemory] = []
+_deferred_lock = threading.Lock()
+
+
+class SharedArrayHandle:
+    """
+    A picklable reference to an ndarray stored in a `multiprocessing.shared_memory` segment.
+    - Only the segment name, shape and dtype cross the process boundary.
+    """
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        """
+        Initializes a handle.
+
+        :param name: The name of the shared memory segment.
+        :param shape: The shape of the stored array.
+        :param dtype: The dtype of the stored array as a string.
+        """
+        self.name: str = name
+        self.shape: tuple = shape
+        self.dtype: str = dtype
+
+
+def share_arrays(payload: Any, segments: List[shared_memory.SharedMemory], min_bytes: int = MIN_SHARED_BYTES) -> Any:
+    """
+    Replaces every large ndarray inside the payload with a SharedArrayHandle.
+    - Dictionaries, lists and tuples are traversed; all other values are left untouched.
+    - The created segments are appended to `segments`, the caller is responsible for releasing them.
+
+    :param payload: The value to transport.
+    :param segments: Collects the shared memory segments created for the payload.
+    :param min_bytes: Arrays below this size are left in place and will be pickled.
+    :return: The payload with arrays replaced by handles.
+    """
+    if isinstance(payload, np.ndarray):
+        if payload.nbytes < min_bytes or payload.dtype.hasobject:
+            return payload
+        segment = shared_memory.SharedMemory(create=True, size=payload.nbytes)
+        segments.append(segment)
+        np.ndarray(payload.shape, dtype=payload.dtype, buffer=segment.buf)[...] = payload
+        return SharedArrayHandle(segment.name, payload.shape, payload.dtype.str)
+    if isinstance(payload, dict):
+        return {key: share_arrays(value, segments, min_bytes) for key, value in payload.items()}
+    if isinstance(payload, (list, tuple)):
+        return type(payload)(share_arrays(value, segments, min_bytes) for value in payload)
+    return payload
+
+
+def restore_arrays(payload: Any, segments: List[shared_memory.SharedMemory], copy: bool = False) -> Any:
+    """
+    Replaces every SharedArrayHandle inside the payload with an ndarray.
+
+    :param payload: A payload produced by `share_arrays`.
+    :param segments: Collects the shared memory segments attached while restoring.
+    :param copy: If False, the arrays are read-only views on the shared memory (the segments must stay open
+                 while they are in use). If True, the data is copied into regular arrays.
+    :return: The payload with handles replaced by arrays.
+    """
+    if isinstance(payload, SharedArrayHandle):
+        segment = shared_memory.SharedMemory(name=payload.name)
+        segments.append(segment)
+        view = np.ndarray(payload.shape, dtype=np.dtype(payload.dtype), buffer=segment.buf)
+        if copy:
+            return view.copy()
+        view.flags.writeable = False
+        return view
+    if isinstance(payload, dict):
+        return {key: restore_arrays(value, segments, copy) for key, value in payload.items()}
+    if isinstance(payload, (list, tuple)):
+        return type(payload)(restore_arrays(value, segments, copy) for value in payload)
+    return payload
+
+
+def release_segments(segments: List[shared_memory.SharedMemory], unlink: bool = False) -> None:
+    """
+    Closes (and optionally unlinks) shared memory segments.
+    - Segments that are still referenced by a live array view cannot be closed yet; closing them is
+      retried on the next call.
+
+    :param segments: The segments to release. The list is emptied.
+    :param unlink: If True, the segments are also removed from the system.
+    """
+    with _deferred_lock:
+        retry = list(_deferred_segments)
+        _deferred_segments.clear()
+
+    still_in_use = []
+    for segment in retry:
+        try:
+            segment.close()
+        except BufferError:
+            still_in_use.append(segment)
+
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            still_in_use.append(segment)  # A view is still alive
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+    segments.clear()
+
+    with _deferred_lock:
+        _deferred_segments.extend(still_in_use)
@@ -0,0 +1,179 @@
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from AINodes.src.core.lazy_output import LazyOutput
+from AINodes.src.core.node import Node
+from AINodes.src.utils.logger import logger
+
+# Arrays below this size are never spilled, the file handling would cost more than it saves
+DEFAULT_MIN_SPILL_BYTES = 1024 ** 2
+
+
+class SpillManager:
+    """
+    Keeps the node outputs held in memory below a budget by moving large arrays to memory-mapped files.
+    - The executor reports every finished node (see `GraphExecutor.finish_node`); when the in-memory arrays
+      of all reported outputs exceed the budget, the arrays of the oldest outputs are written to temporary
+      .npy files and replaced by read-only `np.memmap` views of them.
+    - Consumers read the memmap through `pass_data` like any other array, so nodes need no changes.
+    - The content does not change, so output versions and result cache keys stay the same.
+    - Lazy outputs are spilled once they have been evaluated.
+    - The in-memory size is kept as a running total, a finished node only measures itself and its inputs.
+    """
+
+    def __init__(self, budget_bytes: int, spill_dir: Optional[str] = None,
+                 min_bytes: int = DEFAULT_MIN_SPILL_BYTES):
+        """
+        :param budget_bytes: The maximum size of the arrays kept in memory.
+        :param spill_dir: The directory for the spill files (defaults to a new temporary directory).
+        :param min_bytes: Arrays smaller than this stay in memory.
+        """
+        self.budget_bytes = budget_bytes
+        self.min_bytes = min_bytes
+        self.spill_dir = spill_dir
+        self.spilled_bytes = 0  # Total size of all arrays spilled so far
+        self._own_dir = spill_dir is None
+        # Nodes holding spillable arrays, oldest first -> (id of the measured output, size of its arrays)
+        self._nodes: Dict[Node, Tuple[int, int]] = {}
+        self._total = 0  # Sum of the sizes in _nodes
+        self._file_counter = 0
+        self._lock = threading.Lock()
+
+    def _spillable_arrays(self, value: Any, arrays: Dict[int, np.ndarray]) -> None:
+        if isinstance(value, LazyOutput):
+            if value.is_evaluated:
+                self._spillable_arrays(value.get(), arrays)
+        elif isinstance(value, np.memmap):
+            return
+        elif isinstance(value, np.ndarray):
+            if value.nbytes >= self.min_bytes and not value.dtype.hasobject:
+                arrays[id(value)] = value
+        elif isinstance(value, dict):
+            for item in value.values():
+                self._spillable_arrays(item, arrays)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._spillable_arrays(item, arrays)
+
+    def _replace_arrays(self, value: Any, spilled: Dict[int, np.memmap]) -> Any:
+        if isinstance(value, LazyOutput):
+            if not value.is_evaluated:
+                return value
+            replaced = self._replace_arrays(value.get(), spilled)
+            return replaced if replaced is not value.get() else value
+        if isinstance(value, np.ndarray):
+            return spilled.get(id(value), value)
+        if isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self._replace_arrays(item, spilled)
+            return value
+        if isinstance(value, list):
+            value[:] = [self._replace_arrays(item, spilled) for item in value]
+            return value
+        if isinstance(value, tuple):
+            return type(value)(self._replace_arrays(item, spilled) for item in value)
+        return value
+
+    def _write(self, array: np.ndarray) -> np.memmap:
+        """
+        Writes an array to a new spill file and maps it read-only.
+        """
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="ainodes-spill-")
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+        self._file_counter += 1
+        path = os.path.join(self.spill_dir, f"{self._file_counter}.npy")
+        target = np.lib.format.open_memmap(path, mode="w+", dtype=array.dtype, shape=array.shape)
+        target[...] = array
+        target.flush()
+        del target
+
+        spilled = np.load(path, mmap_mode="r")
+        if os.name != "nt":
+            os.unlink(path)  # The mapping stays valid; the disk space is freed once the view is gone
+        return spilled
+
+    def _measure(self, node: Node) -> Dict[int, np.ndarray]:
+        arrays: Dict[int, np.ndarray] = {}
+        if node.has_output:
+            self._spillable_arrays(node.output_cache, arrays)
+        return arrays
+
+    def _untrack(self, node: Node) -> None:
+        entry = self._nodes.pop(node, None)
+        if entry is not None:
+            self._total -= entry[1]
+
+    def _track(self, node: Node, newest: bool) -> None:
+        """
+        Measures the output of a node again and updates the running total.
+
+        :param node: The node to measure.
+        :param newest: Moves the node to the end of the spill order; otherwise it keeps its position.
+        """
+        nbytes = sum(array.nbytes for array in self._measure(node).values())
+        entry = self._nodes.get(node)
+        if nbytes == 0 or newest:
+            self._untrack(node)
+        elif entry is not None:
+            self._total -= entry[1]
+        if nbytes:
+            self._nodes[node] = (id(node.output_cache), nbytes)
+            self._total += nbytes
+
+    def _is_current(self, node: Node, entry: Tuple[int, int]) -> bool:
+        return node.has_output and id(node.output_cache) == entry[0]
+
+    def finish_node(self, node: Node, upstream: Iterable[Node] = ()) -> None:
+        """
+        Registers the output of a finished node and spills the oldest outputs if the budget is exceeded.
+        - Costs O(number of inputs) unless the budget is exceeded.
+
+        :param node: The node that has just been executed.
+        :param upstream: The nodes whose outputs it has read. They are measured again, since their outputs may
+                         have been released or their lazy outputs evaluated.
+        """
+        with self._lock:
+            for upstream_node in upstream:
+                self._track(upstream_node, newest=False)
+            self._track(node, newest=True)
+            if self._total <= self.budget_bytes:
+                return
+
+            # Outputs that were released or replaced outside of a run are no longer held
+            for tracked, entry in list(self._nodes.items()):
+                if not self._is_current(tracked, entry):
+                    self._untrack(tracked)
+
+            for tracked in list(self._nodes):
+                if self._total <= self.budget_bytes:
+                    break
+                arrays = self._measure(tracked)
+                try:
+                    spilled = {key: self._write(array) for key, array in arrays.items()}
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not spill the output of {tracked.node_type} to disk: {e}")
+                    return
+                tracked.output_cache = self._replace_arrays(tracked.output_cache, spilled)
+                spilled_bytes = sum(array.nbytes for array in arrays.values())
+                self.spilled_bytes += spilled_bytes
+                self._untrack(tracked)  # Only memory-mapped arrays are left
+                logger.debug(f"Spilled {spilled_bytes / 1024 ** 2:.1f} MiB of {tracked.node_type} to {self.spill_dir}")
+
+    def close(self) -> None:
+        """
+        Forgets all outputs and removes the spill directory if it was created by the manager.
+        - Spilled arrays that are still referenced stay readable on POSIX systems.
+        """
+        with self._lock:
+            self._nodes.clear()
+            self._total = 0
+            if self._own_dir and self.spill_dir is not None:
+                shutil.rmtree(self.spill_dir, ignore_errors=True)
+                self.spill_dir = None
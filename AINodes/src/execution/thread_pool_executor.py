@@ -0,0 +1,109 @@
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional
+
+from AINodes.src.core.node import Node
+from AINodes.src.execution.execution_plan import ExecutionPlan
+from AINodes.src.execution.graph_executor import GraphExecutor, NodeExecutionError, RunCancelled
+
+
+class ThreadPoolGraphExecutor(GraphExecutor):
+    """
+    Executes independent branches of a plan in parallel on a thread pool.
+    - A node is submitted as soon as all of its upstream nodes have finished.
+    - NumPy and scikit-learn release the GIL, so wide graphs can use multiple cores.
+    - If a node fails, no further nodes are scheduled; running nodes are awaited and the error is raised.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initializes the executor. The thread pool itself is created lazily on the first run.
+
+        :param max_workers: Maximum number of worker threads (defaults to the ThreadPoolExecutor default).
+        """
+        super().__init__()
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="AINodes")
+        return self._pool
+
+    def submit(self, node: Node) -> Future:
+        """
+        Schedules a node whose upstream nodes are all resolved.
+
+        :param node: The node to execute.
+        :return: A future that completes when the node has been executed.
+        """
+        return self.pool.submit(self.execute_node, node)
+
+    def run(self, plan: ExecutionPlan) -> None:
+        """
+        Executes the plan, scheduling every node as soon as it becomes ready.
+        - Nodes with a valid cached output are executed on the calling thread without being submitted
+          (still through `execute_node`, so cancellation and profiling apply to them as well).
+        - Outputs are released on the calling thread once all their consumers are done (if `release_outputs` is set).
+
+        :param plan: The compiled execution plan.
+        :raises NodeExecutionError: The first error raised by a node (after all running nodes have finished).
+        :raises RunCancelled: If `cancel_event` is set during the run (after all running nodes have finished).
+        """
+        remaining: Dict[Node, int] = {node: len(plan.dependencies[node]) for node in plan.order}
+        running: Dict[Future, Node] = {}
+        errors: List[Exception] = []
+        consumers = self.count_consumers(plan)
+        self.restores = self.find_restores(plan)
+
+        def schedule(ready: List[Node]) -> None:
+            while ready and not errors:
+                node = ready.pop()
+                if not node.is_cache_valid():
+                    running[self.submit(node)] = node
+                    continue
+                try:
+                    self.execute_node(node)  # Cheap, but checks for cancellation and is profiled like the others
+                except (NodeExecutionError, RunCancelled) as e:
+                    errors.append(e)
+                    return
+                self.finish_node(plan, node, consumers)
+                for dependent in plan.dependents[node]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.append(dependent)
+
+        schedule([node for node in plan.order if remaining[node] == 0])
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    if not isinstance(error, (NodeExecutionError, RunCancelled)):
+                        error = NodeExecutionError(node, error)
+                    errors.append(error)
+                    continue
+                if errors:
+                    continue  # Do not start new work after a failure, only drain running nodes
+
+                self.finish_node(plan, node, consumers)
+                ready = []
+                for dependent in plan.dependents[node]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.append(dependent)
+                schedule(ready)
+
+        if errors:
+            raise errors[0]
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the worker threads.
+        """
+        super().shutdown()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -1,5 +1,7 @@
 from typing import Optional, Dict, List
 
+import numpy as np
+
 from AINodes.src.core.basic_node import BasicNode
 
 
@@ -10,6 +12,8 @@ class ArrayToStringBasicNode(BasicNode):
     - Uses a specified separator to join array elements.
     """
 
+    __slots__ = ("separator", "input_array", "output_string")
+
     def __init__(self, node_type: str, separator: str = ", "):
         """
         Initializes an array-to-string conversion node.
@@ -42,6 +46,9 @@ class ArrayToStringBasicNode(BasicNode):
         if array_data is None:
             return None  # Return None if no array data is provided
 
+        if isinstance(array_data, np.ndarray):
+            array_data = array_data.tolist()  # Arrays are only converted here, for display
+
         return {"string_output": self.separator.join(map(str, array_data))}  # Convert array to string
 
     def serialize_parameters(self) -> dict:
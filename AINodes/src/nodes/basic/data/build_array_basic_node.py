@@ -10,6 +10,8 @@ class BuildArrayBasicNode(BasicNode):
     - The length input determines the size of the generated array.
     """
 
+    __slots__ = ("random_input", "length_input", "output")
+
     def __init__(self, node_type: str):
         """
         Initializes an array-building node.
@@ -0,0 +1,60 @@
+from typing import Optional, Dict
+
+import numpy as np
+
+from AINodes.src.core.basic_node import BasicNode
+from AINodes.src.utils.chunk_stream import iter_chunks
+
+
+class ColumnMeanBasicNode(BasicNode):
+    """
+    A node that calculates the mean of every column of a data set.
+    - Accepts the chunk stream of a file input node as well as a full array.
+    - Reads the data block by block, so files larger than the memory can be processed.
+    """
+
+    __slots__ = ("input_data", "output_mean")
+
+    def __init__(self, node_type: str):
+        """
+        Initializes a column mean node.
+
+        :param node_type: A unique identifier for the node.
+        """
+        super().__init__(node_type)
+
+        # Input: The rows as a chunk stream or array
+        self.input_data = self.add_socket("input", "chunks", "data")
+
+        # Output: One mean per column
+        self.output_mean = self.add_socket("output", "array", "mean")
+
+    def compute(self) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Sums up the rows block by block and divides by the number of rows.
+
+        :return: A dictionary containing:
+                 - "mean": A 1D array with the mean of every column.
+                 Returns None if the input is missing or contains no rows.
+        """
+        data = self.input_data.pass_data()
+        if data is None:
+            print("Missing input for ColumnMeanBasicNode")
+            return None
+
+        total = None
+        rows = 0
+        for block in iter_chunks(data):
+            if block.ndim < 2:
+                block = block.reshape(-1, 1)  # A 1D array is a single column
+            block_sum = block.sum(axis=0, dtype=float)
+            total = block_sum if total is None else total + block_sum
+            rows += len(block)
+
+        if rows == 0:
+            print("ColumnMeanBasicNode received no rows")
+            return None
+        return {"mean": total / rows}
+
+    def serialize_parameters(self) -> dict:
+        return {}
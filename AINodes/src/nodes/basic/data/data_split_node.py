@@ -2,6 +2,7 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 
 from AINodes.src.core.basic_node import BasicNode
+from AINodes.src.core.lazy_output import LazyOutput
 
 
 class DataSplitNode(BasicNode):
@@ -10,8 +11,14 @@ class DataSplitNode(BasicNode):
     - Takes in features (`X`) and target labels (`y`).
     - Accepts an optional random seed input.
     - Outputs `X_train`, `X_test`, `y_train`, `y_test`, and `random_state`.
+    - Only the split indices are computed up front; each output array is built when a connected socket reads it.
     """
 
+    __slots__ = ("test_size", "random_state", "input_X", "input_y", "input_random_state", "output_X_train",
+                 "output_X_test", "output_y_train", "output_y_test", "output_random_state")
+
+    process_safe = True
+
     def __init__(self, node_type: str, test_size: float = 0.1, random_state: int = 42):
         """
         Initializes the DataSplitNode.
@@ -22,7 +29,7 @@ class DataSplitNode(BasicNode):
         """
         super().__init__(node_type)
         self.test_size = test_size
-        self.default_random_state = random_state  # Default seed
+        self.random_state = random_state  # Default seed
 
         # Input Sockets
         self.input_X = self.add_socket("input", "array", "features")  # Feature matrix
@@ -40,7 +47,7 @@ class DataSplitNode(BasicNode):
         """
         Splits the dataset into training and testing sets.
 
-        :return: A dictionary with `X_train`, `X_test`, `y_train`, `y_test`, and `random_state`.
+        :return: A dictionary with `X_train`, `X_test`, `y_train`, `y_test` (as LazyOutput), and `random_state`.
         """
         X = self.input_X.pass_data()
         y = self.input_y.pass_data()
@@ -51,29 +58,33 @@ class DataSplitNode(BasicNode):
             return None
 
         # Use the provided seed or fall back to the default
-        random_state = random_seed if random_seed is not None else self.default_random_state
+        random_state = random_seed if random_seed is not None else self.random_state
 
-        # Convert to NumPy arrays
-        X = np.array(X)
-        y = np.array(y)
+        # Convert to NumPy arrays (no copy if the inputs already are arrays)
+        X = np.asarray(X)
+        y = np.asarray(y)
 
-        # Split the dataset
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=self.test_size, random_state=random_state
+        if len(X) != len(y):
+            raise ValueError(f"Found input variables with inconsistent numbers of samples: [{len(X)}, {len(y)}]")
+
+        # Split the row indices, this selects the same rows as splitting X and y directly
+        train_idx, test_idx = train_test_split(
+            np.arange(len(X)), test_size=self.test_size, random_state=random_state
         )
 
-        print(f"X_train size: {len(X_train)}, X_test size: {len(X_test)}")
-        print(f"y_train size: {len(y_train)}, y_test size: {len(y_test)}")
+        print(f"X_train size: {len(train_idx)}, X_test size: {len(test_idx)}")
+        print(f"y_train size: {len(train_idx)}, y_test size: {len(test_idx)}")
 
         return {
-            "X_train": X_train.tolist(),
-            "X_test": X_test.tolist(),
-            "y_train": y_train.tolist(),
-            "y_test": y_test.tolist(),
+            "X_train": LazyOutput(lambda: X[train_idx]),
+            "X_test": LazyOutput(lambda: X[test_idx]),
+            "y_train": LazyOutput(lambda: y[train_idx]),
+            "y_test": LazyOutput(lambda: y[test_idx]),
             "random_state": random_state  # Output the used seed
         }
 
     def serialize_parameters(self) -> dict:
         return {
-
+            "test_size": self.test_size,
+            "random_state": self.random_state,
         }
\ No newline at end of file
@@ -9,6 +9,8 @@ class FloatToStringBasicNode(BasicNode):
     - Takes a float input and outputs a string representation with a specified precision.
     """
 
+    __slots__ = ("precision", "input_float", "output_string")
+
     def __init__(self, node_type: str, precision: int = 2):
         """
         Initializes a float-to-string conversion node.
@@ -10,6 +10,8 @@ class AddAndMultiplyBasicNode(BasicNode):
     - Outputs their sum and product.
     """
 
+    __slots__ = ("input1", "input2", "output1", "output2")
+
     def __init__(self, node_type: str):
         """
         Initializes an addition and multiplication node.
@@ -10,6 +10,8 @@ class AddBasicNode(BasicNode):
     - Takes two float inputs and outputs their sum.
     """
 
+    __slots__ = ("input1", "input2", "output")
+
     def __init__(self, node_type: str):
         """
         Initializes an addition node.
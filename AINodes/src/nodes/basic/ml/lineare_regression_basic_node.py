@@ -22,6 +22,8 @@ class LinearRegressionNode(MlNode):
     - `predictions` (array): Predicted values for X_test.
     """
 
+    __slots__ = ("model", "input_x_train", "input_y_train", "input_x_test", "output_model", "output_predictions")
+
     def __init__(self, node_type: str):
         """
         Initializes a linear regression node.
@@ -53,7 +55,7 @@ class LinearRegressionNode(MlNode):
 
         :return: Dictionary with keys:
                  - `"model"`: Trained LinearRegression model.
-                 - `"predictions"`: List of predicted values.
+                 - `"predictions"`: Array of predicted values.
         """
         X_train = self.input_x_train.pass_data()
         y_train = self.input_y_train.pass_data()
@@ -75,7 +77,7 @@ class LinearRegressionNode(MlNode):
 
         return {
             "model": self.model,
-            "predictions": predictions.tolist()
+            "predictions": predictions
         }
 
     def serialize_parameters(self)-> dict:
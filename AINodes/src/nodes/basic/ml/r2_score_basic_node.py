@@ -12,6 +12,8 @@ class R2ScoreBasicNode(BasicNode):
     - Compares predicted values with actual values to evaluate model performance.
     """
 
+    __slots__ = ("input_y_true", "input_y_pred", "output_score")
+
     def __init__(self, node_type: str):
         """
         Initializes an R² score node.
@@ -40,9 +42,9 @@ class R2ScoreBasicNode(BasicNode):
             print("Missing inputs for R2ScoreBasicNode")
             return None
 
-        # Convert to NumPy arrays
-        y_true = np.array(y_true)
-        y_pred = np.array(y_pred)
+        # Convert to NumPy arrays (no copy if the inputs already are arrays)
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
 
         # Compute the R² score
         score = r2_score(y_true, y_pred)
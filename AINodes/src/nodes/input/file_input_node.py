@@ -0,0 +1,87 @@
+import os
+from typing import Dict, Optional, Tuple, Union
+
+from AINodes.src.core.input_node import InputNode
+from AINodes.src.core.lazy_output import LazyOutput
+from AINodes.src.utils.chunk_stream import ChunkStream
+
+
+class FileInputNode(InputNode):
+    """
+    A node that reads numeric data from a .npy or CSV file.
+    - Outputs the data in two forms:
+      1️⃣ The full array (a read-only memory map for .npy files; CSV files are only parsed completely if it is read)
+      2️⃣ A chunk stream yielding blocks of `chunk_size` rows, for files that do not fit into memory
+         (consumed by "chunks" inputs such as ColumnMeanBasicNode, which also accept the full array)
+    - The output is only invalidated when the modification time or the size of the file changes.
+    """
+
+    __slots__ = ("file_path", "chunk_size", "delimiter", "skip_header", "output_data", "output_chunks")
+
+    def __init__(self, node_type: str, file_path: str = "", chunk_size: int = 10000,
+                 delimiter: str = ",", skip_header: int = 0):
+        """
+        Initializes the file input node.
+
+        :param node_type: A unique identifier for the node.
+        :param file_path: The path of the .npy or CSV file.
+        :param chunk_size: The number of rows per block of the chunk stream.
+        :param delimiter: The column delimiter of CSV files.
+        :param skip_header: The number of header lines to skip in CSV files.
+        """
+        super().__init__(node_type)
+        self.file_path: str = file_path
+        self.chunk_size: int = chunk_size
+        self.delimiter: str = delimiter
+        self.skip_header: int = skip_header
+
+        # Define output sockets
+        self.output_data = self.add_socket("output", "array", "data")  # Full array
+        self.output_chunks = self.add_socket("output", "chunks", "chunks")  # Stream of row blocks
+
+    def external_state(self) -> Optional[Tuple[str, int, int]]:
+        """
+        Identifies the current version of the input file.
+
+        :return: A tuple (absolute path, modification time in ns, size in bytes), or None if the file does not exist.
+        """
+        if not self.file_path:
+            return None
+        path = os.path.abspath(os.path.expanduser(self.file_path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def compute(self) -> Optional[Dict[str, Union[LazyOutput, ChunkStream]]]:
+        """
+        Opens the file.
+
+        :return: A dictionary containing:
+                 - "data": The full content as a read-only array (as LazyOutput)
+                 - "chunks": A ChunkStream over the rows of the file
+                 Returns None if the file does not exist or cannot be read.
+        """
+        state = self.external_state()
+        if state is None:
+            print(f"Error: File '{self.file_path}' does not exist.")
+            return None
+
+        try:
+            stream = ChunkStream(state[0], self.chunk_size, self.delimiter, self.skip_header)
+            return {
+                "data": LazyOutput(stream.to_array),
+                "chunks": stream,
+            }
+        except Exception as e:
+            print(f"Error reading file '{self.file_path}': {e}")
+            return None
+
+    def serialize_parameters(self) -> dict:
+        return {
+            "file_path": self.file_path,
+            "chunk_size": self.chunk_size,
+            "delimiter": self.delimiter,
+            "skip_header": self.skip_header,
+        }
@@ -6,6 +6,8 @@ class SingleFloatInputNode(InputNode):
     - This node generates a predefined float value when executed.
     """
 
+    __slots__ = ("value", "output")
+
     def __init__(self, node_type: str, value: float = 0.0):
         """
         Initializes a single-float input node with a fixed value.
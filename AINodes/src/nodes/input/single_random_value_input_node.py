@@ -7,8 +7,13 @@ class SingleRandomValueInputNode(InputNode):
     """
     A node that generates a random floating-point value.
     - The value is randomly selected from a specified range (min_value to max_value).
+    - A new value is drawn on every run, so the node is never served from a cache.
     """
 
+    __slots__ = ("min_value", "max_value", "output")
+
+    deterministic = False
+
     def __init__(self, node_type: str, min_value: float = 0.0, max_value: float = 1.0):
         """
         Initializes a single random value input node.
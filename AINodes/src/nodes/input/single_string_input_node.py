@@ -7,6 +7,8 @@ class SingleStringInputNode(InputNode):
     - This node generates a predefined string when executed.
     """
 
+    __slots__ = ("value", "output")
+
     def __init__(self, node_type: str, value: str = ""):
         """
         Initializes a single-string input node with a fixed value.
@@ -1,8 +1,10 @@
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, Tuple
 
-from sklearn import datasets
+import numpy as np
 
 from AINodes.src.core.input_node import InputNode
+from AINodes.src.core.lazy_output import LazyOutput
+from AINodes.src.utils.dataset_store import get_dataset_store
 
 
 class SklearnDatasetInputNode(InputNode):
@@ -12,12 +14,17 @@ class SklearnDatasetInputNode(InputNode):
       1️⃣ The full dataset as a dictionary: {"features": X, "targets": y}
       2️⃣ Only the feature matrix (X)
       3️⃣ Only the target labels (y)
+    - Datasets come from the process-wide dataset store: they are loaded from sklearn once, cached
+      as .npy files and shared as read-only memory maps by all nodes and runs.
     """
 
+    __slots__ = ("dataset_name", "output_dict", "output_X", "output_y")
+
+    # Dataset name -> loader function in sklearn.datasets (sklearn is only imported if the dataset is not cached)
     AVAILABLE_DATASETS = {
-        "iris": datasets.load_iris,
-        "wine": datasets.load_wine,
-        "california_housing": datasets.fetch_california_housing,
+        "iris": "load_iris",
+        "wine": "load_wine",
+        "california_housing": "fetch_california_housing",
     }
 
     def __init__(self, node_type: str, dataset_name: str = "iris"):
@@ -35,37 +42,45 @@ class SklearnDatasetInputNode(InputNode):
         self.output_X = self.add_socket("output", "array", "features")  # Feature matrix (X)
         self.output_y = self.add_socket("output", "array", "targets")  # Target labels (y)
 
-    def compute(self) -> Optional[Dict[str, Union[Dict[str, List[Union[float, int]]], List[List[float]], List[int]]]]:
+    def compute(self) -> Optional[Dict[str, LazyOutput]]:
         """
-        Loads the selected dataset and returns its features (X), targets (y), and full dataset dictionary.
+        Returns the features (X), targets (y), and full dataset dictionary of the selected dataset.
+        - All three outputs share the same read-only arrays, nothing is copied.
+        - The arrays are memory-mapped from the dataset cache, repeated runs do not load the dataset again.
+        - The dataset is only loaded when a connected socket reads one of the outputs.
 
-        :return: A dictionary containing:
+        :return: A dictionary containing (as LazyOutput):
                  - "dataset_dict": A dictionary with {"features": X, "targets": y}
-                 - "features": The feature matrix (X) as a list of lists
-                 - "targets": The target labels (y) as a list
-                 Returns None if the dataset is invalid or cannot be loaded.
+                 - "features": The feature matrix (X) as a 2D array
+                 - "targets": The target labels (y) as a 1D array
+                 Returns None if the dataset is invalid, the outputs are None if it cannot be loaded.
         """
-        if self.dataset_name not in self.AVAILABLE_DATASETS:
-            print(f"Error: Dataset '{self.dataset_name}' is not supported.")
+        name = self.dataset_name  # Read now: the parameter may change before the outputs are read
+        if name not in self.AVAILABLE_DATASETS:
+            print(f"Error: Dataset '{name}' is not supported.")
             return None
 
-        try:
-            # Load dataset
-            dataset = self.AVAILABLE_DATASETS[self.dataset_name]()
-
-            # Convert NumPy arrays to Python lists
-            X: List[List[float]] = dataset.data.tolist()
-            y: List[Union[int, float]] = dataset.target.tolist()
+        dataset = LazyOutput(lambda: self._load_dataset(name))  # Shared by all three outputs
 
-            return {
-                "dataset_dict": {"features": X, "targets": y},  # Full dataset dictionary
-                "features": X,  # Features only
-                "targets": y  # Labels only
-            }
+        return {
+            "dataset_dict": LazyOutput(lambda: self._as_dict(*dataset.get())),  # Full dataset dictionary
+            "features": LazyOutput(lambda: dataset.get()[0]),  # Features only
+            "targets": LazyOutput(lambda: dataset.get()[1])  # Labels only
+        }
 
+    def _load_dataset(self, name: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        try:
+            # Load dataset (memoized per process)
+            return get_dataset_store().get(name, self.AVAILABLE_DATASETS[name])
         except Exception as e:
-            print(f"Error loading dataset '{self.dataset_name}': {e}")
+            print(f"Error loading dataset '{name}': {e}")
+            return None, None
+
+    @staticmethod
+    def _as_dict(X: Optional[np.ndarray], y: Optional[np.ndarray]) -> Optional[Dict[str, np.ndarray]]:
+        if X is None or y is None:
             return None
+        return {"features": X, "targets": y}
 
     def serialize_parameters(self) -> dict:
         return {
@@ -10,6 +10,8 @@ class PrintOutputNode(OutputNode):
     - Accepts a single input socket of type "string".
     """
 
+    __slots__ = ()
+
     def __init__(self, node_type: str):
         """
         Initializes a print output node.
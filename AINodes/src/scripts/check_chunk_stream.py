@@ -0,0 +1,47 @@
+"""
+Prüft, dass ChunkStream beim Lesen von CSV-Dateien mit Leerzeilen keine Zeilen verliert.
+
+Ein Block, der nur aus Leerzeilen besteht, darf das Lesen nicht beenden: Alle Zeilen danach müssen
+weiterhin geliefert werden. Schlägt mit Exit-Code 1 fehl, wenn Zeilen fehlen oder falsch gelesen werden.
+
+    python -m AINodes.src.scripts.check_chunk_stream
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from AINodes.src.utils.chunk_stream import ChunkStream
+
+# Zwei Leerzeilen hintereinander füllen bei chunk_size=2 einen ganzen Block
+CSV_CONTENT = "1,2\n3,4\n\n\n5,6\n\n7,8\n"
+EXPECTED = np.array([[1, 2], [3, 4], [5, 6], [7, 8]], dtype=float)
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "blank_lines.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(CSV_CONTENT)
+
+        for chunk_size in (1, 2, 3, 10):
+            stream = ChunkStream(path, chunk_size)
+            blocks = list(stream)
+            if any(len(block) > chunk_size for block in blocks):
+                print(f"FEHLER: chunk_size={chunk_size}: Ein Block ist größer als chunk_size.")
+                return 1
+            rows = np.concatenate(blocks)
+            if not np.array_equal(rows, EXPECTED):
+                print(f"FEHLER: chunk_size={chunk_size}: Erwartet {EXPECTED.tolist()}, gelesen {rows.tolist()}.")
+                return 1
+            if not np.array_equal(stream.to_array(), EXPECTED):
+                print(f"FEHLER: chunk_size={chunk_size}: to_array() liefert {stream.to_array().tolist()}.")
+                return 1
+
+    print("OK: Alle Zeilen wurden trotz Leerzeilen gelesen.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
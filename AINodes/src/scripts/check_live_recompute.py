@@ -0,0 +1,90 @@
+"""
+Prüft, dass eine Parameteränderung während eines laufenden Hintergrund-Laufs nicht verloren geht.
+
+Das Skript spielt den Ablauf des Live-Modus (GraphController.parameter_changed) ohne Oberfläche nach:
+Ein langsamer Node rechnet in einem Hintergrund-Thread, währenddessen wird sein Parameter geändert und der
+Lauf abgebrochen. Der anschließende Live-Lauf muss den Node neu berechnen. Schlägt mit Exit-Code 1 fehl,
+wenn der Node mit dem alten Ergebnis als gültig gilt.
+
+    python -m AINodes.src.scripts.check_live_recompute
+"""
+import sys
+import threading
+import time
+
+from AINodes.src.core.node_editor import NodeEditor
+from AINodes.src.execution.graph_executor import RunCancelled
+from AINodes.src.nodes.basic.data.float_to_string_basic_node import FloatToStringBasicNode
+from AINodes.src.nodes.input.single_float_input_node import SingleFloatInputNode
+from AINodes.src.nodes.output.print_output_node import PrintOutputNode
+
+COMPUTE_SECONDS = 0.3
+
+
+class SlowFloatToStringNode(FloatToStringBasicNode):
+    """
+    Wie FloatToStringBasicNode, meldet den Start von compute() und rechnet absichtlich langsam.
+    """
+
+    def __init__(self, node_type: str, precision: int = 2):
+        super().__init__(node_type, precision)
+        self.started = threading.Event()
+
+    def compute(self):
+        precision = self.precision  # Wird vor der Änderung gelesen
+        self.started.set()
+        time.sleep(COMPUTE_SECONDS)
+        value = self.input_float.pass_data()
+        return {"string_output": f"{value:.{precision}f}"}
+
+
+def main() -> int:
+    editor = NodeEditor()
+    source = SingleFloatInputNode("SingleFloatInputNode", 0.93)
+    converter = SlowFloatToStringNode("FloatToStringBasicNode", precision=2)
+    output = PrintOutputNode("PrintOutputNode")
+    for node in (source, converter, output):
+        editor.add_node(node)
+    source.outputs[0].connect(converter.inputs[0])
+    converter.outputs[0].connect(output.inputs[0])
+
+    # 1. Lauf im Hintergrund, Parameteränderung und Abbruch während compute() (wie im Live-Modus)
+    cancel_event = threading.Event()
+    errors = []
+
+    def run() -> None:
+        try:
+            editor.run_plan(editor.get_execution_plan(), cancel_event)
+        except RunCancelled:
+            pass
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    converter.started.wait()
+    converter.set_parameter("precision", 6)
+    cancel_event.set()
+    worker.join()
+    if errors:
+        print(f"FEHLER: Lauf fehlgeschlagen: {errors[0]!r}")
+        return 1
+
+    if converter.is_cache_valid():
+        print(f"FEHLER: Node gilt nach der Änderung als gültig (Ergebnis {converter.output_cache!r}).")
+        return 1
+
+    # 2. Der Live-Lauf für die betroffenen Output-Nodes muss den Node neu berechnen
+    editor.run_plan(editor.get_execution_plan([output]))
+    result = converter.output_cache
+    expected = {"string_output": "0.930000"}
+    if result != expected:
+        print(f"FEHLER: Erwartet {expected!r}, berechnet wurde {result!r}.")
+        return 1
+
+    print(f"OK: Änderung während compute() wurde neu berechnet ({result['string_output']}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,51 @@
-import os
 import json
-import re
-
-# Basisverzeichnis, wo deine Nodes gespeichert sind
-BASE_PACKAGE = "AINodes.src.nodes"
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "nodes"))
-
-# Neuer Speicherort für nodes.json
-DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
-NODES_JSON_PATH = os.path.join(DATA_DIR, "nodes.json")
-
-def find_nodes():
-    """Sucht automatisch nach allen Nodes und speichert sie in einer JSON-Datei."""
-    if not os.path.exists(BASE_DIR):
-        raise FileNotFoundError(f"❌ Fehler: Der Nodes-Ordner wurde nicht gefunden: {BASE_DIR}")
-
-    print(f"🔍 Scanne Nodes in: {BASE_DIR}")
-
-    nodes = {}
-
-    # Rekursiv alle Python-Dateien in Unterordnern durchsuchen
-    for root, _, files in os.walk(BASE_DIR):
-        for filename in files:
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_path = os.path.relpath(os.path.join(root, filename), BASE_DIR)  # Relativer Pfad
-                module_name = module_path.replace(os.sep, ".")[:-3]  # Ersetze / durch . und entferne ".py"
-
-                full_module_path = f"{BASE_PACKAGE}.{module_name}"  # Kompletter Import-Pfad
-
-                print(f"📂 Gefundene Datei: {filename} -> {full_module_path}")  # Debugging
-
-                # Versuche die Datei zu öffnen und nach Node-Klassen zu suchen
-                with open(os.path.join(root, filename), "r", encoding="utf-8") as f:
-                    for line in f:
-                        match = re.match(r"class (\w+)\(", line)
-                        if match:
-                            class_name = match.group(1)  # Klassennamen extrahieren
-                            nodes[class_name] = f"{full_module_path}.{class_name}"
-                            print(f"✅ Node gefunden: {class_name} -> {full_module_path}")  # Debugging
+import os
 
-    # Stelle sicher, dass der Ordner existiert
-    os.makedirs(DATA_DIR, exist_ok=True)
+from AINodes.src.core.node_discovery import NodeDiscovery, NODES_DIR
+from AINodes.src.core.node_registry import DATA_DIR, NODES_JSON_PATH
+from AINodes.src.utils.logger import logger
+
+
+def find_nodes(verbose: bool = True) -> dict:
+    """
+    Sucht automatisch nach allen Nodes und speichert sie in einer JSON-Datei.
+    - Die Node-Dateien werden mit `ast` geparst und nicht importiert.
+    - Unveränderte Dateien werden dank des Discovery-Caches nicht erneut geparst.
+    - nodes.json wird nur geschrieben, wenn sich der Inhalt geändert hat.
+
+    :param verbose: Gibt die gefundenen Nodes auf der Konsole aus.
+    :return: Die gefundenen Nodes (Name -> Eintrag mit Klassenpfad und Metadaten).
+    """
+    if not os.path.exists(NODES_DIR):
+        raise FileNotFoundError(f"❌ Fehler: Der Nodes-Ordner wurde nicht gefunden: {NODES_DIR}")
+
+    nodes = NodeDiscovery().discover()
+    if verbose:
+        print(f"🔍 Scanne Nodes in: {NODES_DIR}")
+        for node_name, entry in nodes.items():
+            print(f"✅ Node gefunden: {node_name} -> {entry['class']}")
+
+    content = json.dumps(nodes, indent=4)
+    try:
+        with open(NODES_JSON_PATH, "r", encoding="utf-8") as json_file:
+            if json_file.read() == content:
+                return nodes
+    except OSError:
+        pass
 
     # Speichere die gefundenen Nodes als JSON
-    with open(NODES_JSON_PATH, "w", encoding="utf-8") as json_file:
-        json.dump(nodes, json_file, indent=4)
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(NODES_JSON_PATH, "w", encoding="utf-8") as json_file:
+            json_file.write(content)
+    except OSError as e:
+        logger.warning(f"nodes.json konnte nicht aktualisiert werden: {e}")
+        return nodes
+
+    if verbose:
+        print(f"✅ {len(nodes)} Nodes gefunden und in {NODES_JSON_PATH} gespeichert!")
+    return nodes
 
-    print(f"✅ {len(nodes)} Nodes gefunden und in {NODES_JSON_PATH} gespeichert!")
 
 if __name__ == "__main__":
     find_nodes()
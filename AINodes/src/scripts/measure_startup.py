@@ -0,0 +1,128 @@
+"""
+Misst die Kaltstart-Zeit des Editors und des Headless-Runners.
+
+Jedes Szenario läuft in einem frischen Interpreter mit `-X importtime`. Das Skript meldet die beste
+Zeit aus mehreren Läufen, die teuersten Imports und schlägt fehl (Exit-Code 1), wenn ein Budget
+überschritten wird oder ein Modul geladen wurde, das beim Start nicht geladen werden darf.
+
+    python -m AINodes.src.scripts.measure_startup
+    python -m AINodes.src.scripts.measure_startup --runs 5 --budget headless=0.3
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# Name -> (Code, Budget in Sekunden, Module, die dabei nicht importiert werden dürfen)
+SCENARIOS: Dict[str, Tuple[str, float, Tuple[str, ...]]] = {
+    "backend": (
+        "from AINodes.src.core.node_editor import NodeEditor\n"
+        "NodeEditor()",
+        0.5,
+        ("sklearn", "PySide6"),
+    ),
+    "headless": (
+        "import AINodes.run\n"
+        "AINodes.run.NodeEditor()",
+        0.5,
+        ("sklearn", "PySide6"),
+    ),
+    "editor": (
+        "from AINodes.src.controller.graph_controller import GraphController\n"
+        "from AINodes.src.core.node_editor import NodeEditor\n"
+        "NodeEditor()",
+        1.5,
+        ("sklearn",),
+    ),
+}
+
+# Misst die Zeit im Kindprozess selbst, damit der Interpreter-Start nicht mitgezählt wird
+_TIMING_WRAPPER = (
+    "import sys, time\n"
+    "_start = time.perf_counter()\n"
+    "{code}\n"
+    "_elapsed = time.perf_counter() - _start\n"
+    "sys.stdout.write(repr((_elapsed, sorted(sys.modules))))\n"
+)
+
+
+def run_scenario(code: str) -> Tuple[float, List[str], Dict[str, int]]:
+    """
+    Führt ein Szenario in einem neuen Interpreter aus.
+
+    :param code: Der auszuführende Python-Code.
+    :return: Ein Tupel (Zeit in Sekunden, geladene Module, {Paket: eigene Importzeit in µs}).
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _TIMING_WRAPPER.format(code=code)],
+        capture_output=True, text=True, env=env, cwd=PROJECT_ROOT
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Szenario fehlgeschlagen:\n{process.stderr[-2000:]}")
+
+    elapsed, modules = ast.literal_eval(process.stdout.strip().splitlines()[-1])
+
+    # Eigene Importzeit pro Top-Level-Paket aufsummieren (z. B. alle numpy.* Module)
+    imports: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        imports[package] = imports.get(package, 0) + int(self_time)
+    return elapsed, modules, imports
+
+
+def measure(runs: int, budgets: Dict[str, float], top: int) -> bool:
+    """
+    Misst alle Szenarien und gibt einen Bericht aus.
+
+    :param runs: Anzahl der Läufe pro Szenario, gewertet wird der schnellste.
+    :param budgets: Budgets in Sekunden, überschreiben die Standardwerte.
+    :param top: Anzahl der teuersten Imports, die angezeigt werden.
+    :return: True, wenn alle Szenarien ihr Budget einhalten.
+    """
+    success = True
+    for name, (code, default_budget, forbidden) in SCENARIOS.items():
+        budget = budgets.get(name, default_budget)
+        results = [run_scenario(code) for _ in range(runs)]
+        elapsed, modules, imports = min(results, key=lambda result: result[0])
+
+        loaded_forbidden = sorted({module.split(".")[0] for module in modules} & set(forbidden))
+        ok = elapsed <= budget and not loaded_forbidden
+        success &= ok
+
+        print(f"{'✅' if ok else '❌'} {name}: {elapsed * 1e3:.1f} ms (Budget {budget * 1e3:.0f} ms)")
+        for package, self_time in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"     {self_time / 1e3:8.1f} ms  {package}")
+        if loaded_forbidden:
+            print(f"     Beim Start geladen, obwohl verboten: {', '.join(loaded_forbidden)}")
+    return success
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Misst die Kaltstart-Zeit von AINodes.")
+    parser.add_argument("--runs", type=int, default=3, help="Läufe pro Szenario (Standard: 3).")
+    parser.add_argument("--top", type=int, default=5, help="Anzahl der angezeigten teuersten Imports.")
+    parser.add_argument("--budget", action="append", default=[], metavar="SZENARIO=SEKUNDEN",
+                        help="Überschreibt das Budget eines Szenarios.")
+    args = parser.parse_args(argv)
+
+    budgets = {}
+    for entry in args.budget:
+        name, _, seconds = entry.partition("=")
+        if name not in SCENARIOS:
+            parser.error(f"Unbekanntes Szenario: {name}")
+        budgets[name] = float(seconds)
+
+    return 0 if measure(args.runs, budgets, args.top) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
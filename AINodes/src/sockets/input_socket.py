@@ -8,6 +8,12 @@ if TYPE_CHECKING:
     from AINodes.src.sockets.output_socket import OutputSocket  # Only imported for type hints
     from AINodes.src.core.node import Node
 
+# Input data types that also accept outputs of other data types
+# - A "chunks" input iterates over row blocks, an in-memory array can be split into blocks as well
+COMPATIBLE_TYPES = {
+    "chunks": ("array",),
+}
+
 
 class InputSocket(Socket):
     """
@@ -15,6 +21,8 @@ class InputSocket(Socket):
     - Input sockets receive data from output sockets of other nodes.
     """
 
+    __slots__ = ("connected_socket", "seen_version")
+
     def __init__(self, parent_node: Node, data_type: str, socket_name: str):
         """
         Initializes an input socket.
@@ -25,50 +33,97 @@ class InputSocket(Socket):
         """
         super().__init__(parent_node, data_type, socket_name)
         self.connected_socket: Optional[OutputSocket] = None  # Stores reference to connected output socket
+        self.seen_version: int = 0  # Output version of the connected node that was read last
 
     def connect(self, output_socket: "OutputSocket") -> None:
         """
         Establishes a connection between this input socket and an output socket.
-        - Ensures that both sockets have the same data type.
+        - Ensures that both sockets have the same data type (or a compatible one, see COMPATIBLE_TYPES).
         - Prevents connections within the same node.
+        - Replaces an existing connection and keeps the consumer lists of both output sockets up to date.
 
         :param output_socket: The output socket to connect to.
         :raises TypeError: If the sockets have different data types or belong to the same node.
         """
-        if self.data_type != output_socket.data_type:
+        if not self.accepts(output_socket.data_type):
             raise TypeError("Cannot connect sockets with different data types!")
         if self.parent_node == output_socket.parent_node:
             raise TypeError("Cannot connect sockets of the same node!")
+        if self.connected_socket is output_socket:
+            return
 
+        if self.connected_socket is not None:
+            self.connected_socket.consumers.remove(self)
         self.connected_socket = output_socket  # Store the connection reference
+        output_socket.consumers.append(self)
+        self.parent_node.mark_dirty()
+        Socket.topology_revision += 1
+
+    def read_from(self, output_socket: "OutputSocket", register: bool = False) -> None:
+        """
+        Lets this socket read from an output socket without changing the topology of the graph.
+        - `Socket.topology_revision` is not incremented, so the compiled plans of the editor stay valid.
+        - Only with `register` is the socket added to the consumers of the output socket; use it for output
+          sockets that do not belong to the graph.
+        - Meant for temporary copies of nodes (see ParameterSweep), which are dropped without disconnecting.
+
+        :param output_socket: The output socket to read from.
+        :raises TypeError: If the data types do not match.
+        """
+        if not self.accepts(output_socket.data_type):
+            raise TypeError("Cannot connect sockets with different data types!")
+        if register:
+            output_socket.consumers.append(self)
+        self.connected_socket = output_socket
+        self.seen_version = 0
+
+    def accepts(self, data_type: str) -> bool:
+        """
+        :param data_type: The data type of an output socket.
+        :return: True if this socket can be connected to an output of the given data type.
+        """
+        return data_type == self.data_type or data_type in COMPATIBLE_TYPES.get(self.data_type, ())
 
     def pass_data(self) -> Optional[Any]:
         """
         Requests data from the connected output socket.
         - If connected, retrieves the value from the output socket.
-        - If the value has changed, resets the node's cache.
+        - Remembers the output version that was read, so the parent node can detect changed inputs.
 
         :return: The received data or None if no connection exists.
         """
         if self.connected_socket:
             new_value = self.connected_socket.pass_data()
-
-            # Reset cache if the value has changed
-            if new_value != self.parent_node.output_cache:
-                self.parent_node.output_cache = None
-
+            self.seen_version = self.connected_socket.parent_node.output_version
             return new_value
         return None
 
+    def is_current(self) -> bool:
+        """
+        Checks whether the connected output has changed since this socket last read it.
+
+        :return: True if no newer output version is available.
+        """
+        if self.connected_socket is None:
+            return True
+        return self.connected_socket.parent_node.output_version == self.seen_version
+
+    def mark_current(self) -> None:
+        """
+        Records the current output version of the connected node as read, without pulling its value.
+        """
+        if self.connected_socket is not None:
+            self.seen_version = self.connected_socket.parent_node.output_version
+
     def remove_connection(self):
         """
         Trennt diese Verbindung im Backend.
-        Falls es eine Gegenverbindung gibt, wird sie auch aufgelöst.
+        Der Socket wird auch aus der Consumer-Liste des Output-Sockets entfernt (O(Grad)).
         """
         if self.connected_socket:
             other = self.connected_socket
             self.connected_socket = None
-
-            if hasattr(other, "connected_socket") and other.connected_socket == self:
-                other.connected_socket = None
+            other.consumers.remove(self)
+            self.parent_node.mark_dirty()
+            Socket.topology_revision += 1
 
@@ -1,7 +1,7 @@
 from __future__ import annotations  # Enables forward type declarations
-from typing import TYPE_CHECKING, Any
-
+from typing import TYPE_CHECKING, List
 
+from AINodes.src.core.lazy_output import evaluate_output, LazyOutput
 from AINodes.src.sockets.socket import Socket
 
 if TYPE_CHECKING:
@@ -14,6 +14,8 @@ class OutputSocket(Socket):
     - Output sockets provide data to input sockets of other nodes.
     """
 
+    __slots__ = ("consumers",)
+
     def __init__(self, parent_node: Node, data_type: str, socket_name: str):
         """
         Initializes an output socket.
@@ -23,6 +25,8 @@ class OutputSocket(Socket):
         :param socket_name: A unique identifier for this socket within the node.
         """
         super().__init__(parent_node, data_type, socket_name)
+        # Reverse adjacency: the input sockets reading from this socket, maintained by InputSocket
+        self.consumers: List[InputSocket] = []
 
     def pass_data(self) -> any:
         """
@@ -30,13 +34,24 @@ class OutputSocket(Socket):
         - If the node's execution result is a dictionary, the method returns the
           value associated with this socket's key.
         - Otherwise, it returns the full execution result.
+        - Outputs the node returned as LazyOutput are only computed here, when a socket requests them.
+        - NumPy arrays are passed on without copying, as read-only views, so consumers can not
+          modify the cached output of this node.
 
         :return: The data stored in the node's execution output.
         """
+        import numpy as np  # Imported here so loading the socket module does not pull in NumPy at startup
+
         result = self.parent_node.execute()
 
         if isinstance(result, dict) and self.socket_name in result:
-            return result[self.socket_name]
+            result = evaluate_output(self.parent_node, result, self.socket_name)
+        elif isinstance(result, LazyOutput):
+            result = result.get()
+
+        if isinstance(result, np.ndarray) and result.flags.writeable:
+            result = result.view()
+            result.flags.writeable = False
 
         return result
 
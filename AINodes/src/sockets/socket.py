@@ -1,20 +1,28 @@
+import itertools
 from abc import ABC, abstractmethod
 
 from typing import TYPE_CHECKING
 
-import uuid
-
 if TYPE_CHECKING:
     from AINodes.src.core.node import Node
 
+# Source of socket ids. Integers are much cheaper to create, hash and store than UUID strings.
+_socket_ids = itertools.count(1)
+
 
 class Socket(ABC):
     """
     Abstract base class for all sockets in the node system.
     - Sockets handle data flow between nodes.
     - Each socket is linked to a parent node.
+    - Uses __slots__, so large graphs do not pay for an instance dictionary per socket.
     """
 
+    __slots__ = ("socket_id", "parent_node", "data_type", "socket_name")
+
+    # Incremented whenever any connection is created or removed, so compiled execution plans can detect changes.
+    topology_revision: int = 0
+
     def __init__(self, parent_node, data_type: str, socket_name: str):
         """
         Initializes a socket with a reference to its parent node.
@@ -23,8 +31,7 @@ class Socket(ABC):
         :param data_type: The data type this socket handles (e.g., "float", "string").
         :param socket_name: A unique identifier for this socket within the node.
         """
-
-        self.socket_id = str(uuid.uuid4())
+        self.socket_id: int = next(_socket_ids)  # Unique within the process
         self.parent_node: Node = parent_node  # Reference to parent node
         self.data_type: str = data_type  # Type of data this socket handles
         self.socket_name: str = socket_name  # Unique identifier for the socket
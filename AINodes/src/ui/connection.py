@@ -17,9 +17,9 @@ class Connection(QGraphicsLineItem):
             end_socket.connections.append(self)
 
     def update_position(self):
-        start_pos = self.start_socket.sceneBoundingRect().center()
+        start_pos = self.start_socket.scene_center()
         if self.end_socket:
-            end_pos = self.end_socket.sceneBoundingRect().center()
+            end_pos = self.end_socket.scene_center()
         else:
             end_pos = start_pos
         self.setLine(start_pos.x(), start_pos.y(), end_pos.x(), end_pos.y())
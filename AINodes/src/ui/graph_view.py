@@ -2,9 +2,14 @@ from PySide6.QtCore import Qt, QPointF, QEvent
 from PySide6.QtGui import QPainter, QKeyEvent
 from PySide6.QtWidgets import QGraphicsView, QApplication
 
+from AINodes.src.ui.graphic_node import DETAIL_ZOOM_THRESHOLD
 from AINodes.src.ui.node_search_popup import NodeSearchPopup
 
 
+# Nodes this far outside the viewport (in pixels) already get their widgets, so they are ready when scrolled in
+VISIBLE_MARGIN = 200
+
+
 class GraphView(QGraphicsView):
     def __init__(self, scene, parent=None):
 
@@ -16,7 +21,11 @@ class GraphView(QGraphicsView):
         self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Only the changed regions are repainted; nodes are cached as pixmaps (see GraphicNode)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        # Item bounding rects already include the pen width and the shadow
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
         self.search_popup = NodeSearchPopup(scene.controller, self)
@@ -29,6 +38,9 @@ class GraphView(QGraphicsView):
         self.is_panning = False
         self.last_mouse_pos = None
 
+        self.horizontalScrollBar().valueChanged.connect(self.update_visible_region)
+        self.verticalScrollBar().valueChanged.connect(self.update_visible_region)
+
     def search_popup_was_closed(self):
         """Callback for when the search popup signals it has been closed."""
         print("GraphView: Search popup was closed. Clearing reference.")
@@ -104,6 +116,33 @@ class GraphView(QGraphicsView):
         if not QApplication.instance(): return
         scale_factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
         self.scale(scale_factor, scale_factor)
+        self.update_detail_level()
+
+    def update_detail_level(self) -> None:
+        """
+        Switches the scene to the simplified rendering when zoomed out below DETAIL_ZOOM_THRESHOLD.
+        - Antialiasing is turned off as well, it is not visible at that size.
+        """
+        detailed = self.transform().m11() >= DETAIL_ZOOM_THRESHOLD
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, detailed)
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "set_detailed"):
+            scene.set_detailed(detailed)
+        self.update_visible_region()
+
+    def update_visible_region(self) -> None:
+        """
+        Reports the visible area (plus VISIBLE_MARGIN) to the scene, which materializes the nodes in it.
+        """
+        scene = self.scene()
+        if scene is None or not hasattr(scene, "update_visible_nodes"):
+            return
+        viewport_rect = self.viewport().rect().adjusted(-VISIBLE_MARGIN, -VISIBLE_MARGIN, VISIBLE_MARGIN, VISIBLE_MARGIN)
+        scene.update_visible_nodes(self.mapToScene(viewport_rect).boundingRect())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_visible_region()
 
     def mouseMoveEvent(self, event):
         if not QApplication.instance(): return
@@ -1,14 +1,26 @@
-from pathlib import Path
-
 from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QBrush, QColor, QPen, QPainterPath, QTextOption, QPainter, QPalette
-from PySide6.QtWidgets import QGraphicsItem, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsDropShadowEffect, \
-    QDoubleSpinBox, QComboBox, QLineEdit, QGraphicsProxyWidget, QStyleOptionGraphicsItem, QWidget
+from PySide6.QtGui import QBrush, QColor, QPen, QPainterPath, QPainter
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsTextItem, QGraphicsSceneMouseEvent, QStyleOptionGraphicsItem, \
+    QWidget
 
 from AINodes.src.core.node import Node
-from AINodes.src.sockets.socket import Socket
-from AINodes.src.ui.graphic_socket import GraphicSocket
+from AINodes.src.ui.graphic_socket import GraphicSocket, SocketAnchor
+
+# Below this zoom factor nodes are drawn as plain boxes without text, shadow, sockets or parameters
+DETAIL_ZOOM_THRESHOLD = 0.5
 
+# Colors and pens shared by all nodes, so paint() does not create them on every repaint
+BODY_BRUSH = QBrush(QColor(48, 48, 48))
+TITLE_BRUSH = QBrush(QColor(60, 120, 100))
+SHADOW_BRUSH = QBrush(QColor(0, 0, 0, 110))
+OUTLINE_PEN = QPen(QColor(20, 20, 20), 1)
+SELECTION_PEN = QPen(QColor(255, 255, 255), 1)
+TITLE_TEXT_COLOR = QColor(255, 255, 255)
+FIELD_BRUSH = QBrush(QColor(48, 48, 48))
+FIELD_PEN = QPen(QColor(94, 94, 94), 1)
+TEXT_COLOR = QColor(255, 255, 255)
+CORNER_RADIUS = 8.0
+SHADOW_OFFSET = 3
 
 
 class GraphicNode(QGraphicsItem):
@@ -21,6 +33,8 @@ class GraphicNode(QGraphicsItem):
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+        # Repaints while panning reuse a pixmap of the node, it is only redrawn when the node or the zoom changes
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         self.node = parent
         self.node_type = parent.node_type
@@ -43,7 +57,6 @@ class GraphicNode(QGraphicsItem):
         socket_section_height = (socket_rows * self.vertical_spacing) + self.padding if socket_rows > 0 else 0
 
         self.parameters = {}
-        self.parameter_widgets = []
         self.num_params = 0
         parameter_section_height = 0
         if hasattr(parent, "serialize_parameters"):
@@ -62,9 +75,23 @@ class GraphicNode(QGraphicsItem):
         self.title_rect = QRectF(-self.width / 2, -self.total_height / 2, self.width, self.title_height)
         self.body_rect = QRectF(-self.width / 2, self.title_rect.bottom(), self.width, self.body_height)
 
-        # --- Create Child Items (Sockets, Labels, Parameter Widgets) ---
-        self.sockets = []
+        # --- Paths are built once, paint() only draws them ---
+        self.outline_path = QPainterPath()
+        self.outline_path.addRoundedRect(self.node_rect, CORNER_RADIUS, CORNER_RADIUS)
+        self.shadow_path = self.outline_path.translated(SHADOW_OFFSET, SHADOW_OFFSET)
+        title_area = QPainterPath()
+        title_area.addRect(self.title_rect)
+        self.title_path = self.outline_path.intersected(title_area)  # Title bar with the rounded top corners
+        self.detailed = True  # Whether labels and sockets are shown
+
+        # --- Create Child Items ---
+        # Off-screen the node is a single item: the sockets are plain anchors for the connections.
+        # Socket items and labels are only created while the node is near the viewport, see materialize().
+        self.sockets = []  # SocketAnchor per socket, always present
+        self.socket_views = []  # GraphicSocket per socket while materialized
         self.socket_labels = []
+        self.socket_rows = []  # (label text, socket center x, row center y, is input) per socket
+        self.materialized = False
 
         # Y offset for first row of content within the body
         content_start_y = self.body_rect.top() + self.padding / 2
@@ -82,24 +109,9 @@ class GraphicNode(QGraphicsItem):
 
             # --- X calculation remains UNCHANGED from your provided code ---
             socket_center_x = self.width / 2 - self.horizontal_padding - self.socket_radius + 15
-            # Create socket using correct X and NEW Y
-            socket = GraphicSocket(socket_id, socket_center_x, row_center_y, self, is_input=False)
-            self.sockets.append(socket)
-
-            # Create Output Label
-            label = QGraphicsTextItem(parent.outputs[i].socket_name, self)
-            label.setDefaultTextColor(Qt.GlobalColor.white)
-            label_height = label.boundingRect().height()
-            label_width = label.boundingRect().width()
-            # Calculate label's TOP Y using NEW row_center_y
-            label_top_y = row_center_y - (label_height / 2)
-            # --- Label X calculation remains UNCHANGED from your provided code ---
-            socket_left_edge = socket_center_x - self.socket_radius
-            label_right_x = socket_left_edge - self.label_socket_spacing
-            label_left_x = label_right_x - label_width
-            # Set label position with UNCHANGED X and NEW Y
-            label.setPos(label_left_x, label_top_y)
-            self.socket_labels.append(label)
+            # The anchor is placed at the socket center, socket item and label are created in materialize()
+            self.sockets.append(SocketAnchor(socket_id, self, QPointF(socket_center_x, row_center_y), False))
+            self.socket_rows.append((parent.outputs[i].socket_name, socket_center_x, row_center_y, False))
 
             # Increment row index for the next item
             current_row_index += 1
@@ -113,38 +125,31 @@ class GraphicNode(QGraphicsItem):
 
             # --- X calculation remains UNCHANGED from your provided code ---
             socket_center_x = -self.width / 2 + self.horizontal_padding + self.socket_radius - 15
-            # Create socket using correct X and NEW Y
-            socket = GraphicSocket(socket_id, socket_center_x, row_center_y, self, is_input=True)
-            self.sockets.append(socket)
-
-            # Create Input Label
-            label = QGraphicsTextItem(parent.inputs[i].socket_name, self)
-            label.setDefaultTextColor(Qt.GlobalColor.white)
-            label_height = label.boundingRect().height()
-            # Calculate label's TOP Y using NEW row_center_y
-            label_top_y = row_center_y - (label_height / 2)
-            # --- Label X calculation remains UNCHANGED from your provided code ---
-            socket_right_edge = socket_center_x + self.socket_radius
-            label_left_x = socket_right_edge + self.label_socket_spacing
-            # Set label position with UNCHANGED X and NEW Y
-            label.setPos(label_left_x, label_top_y)
-            self.socket_labels.append(label)
+            self.sockets.append(SocketAnchor(socket_id, self, QPointF(socket_center_x, row_center_y), True))
+            self.socket_rows.append((parent.inputs[i].socket_name, socket_center_x, row_center_y, True))
 
             # Increment row index
             current_row_index += 1
 
 
-        # --- Create Parameter Widgets (Positioned below ALL sockets) ---
-        # *** CHANGED: param_start_y calculation uses updated socket_section_height ***
+        # --- Parameters (Positioned below ALL sockets) ---
+        # They are painted by paint(); clicking a field opens the scene's shared ParameterEditor
         param_start_y = self.body_rect.top() + socket_section_height + self.padding / 2
-        self.create_parameter_widgets(param_start_y)  # Pass correct starting Y
-
-        # --- Effects ---
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setOffset(3, 3)
-        shadow.setColor(QColor(0, 0, 0, 180))
-        self.setGraphicsEffect(shadow)
+        available_content_width = self.width - 2 * self.padding
+        label_width = available_content_width * 0.4  # Allocate 40% width to label
+        field_width = available_content_width * 0.55  # Allocate 55% width to the value field
+        field_height = self.vertical_spacing * 0.8  # Slightly less than row height
+        self.param_rows = []  # (parameter name, label rect, field rect) per parameter
+        for i, key in enumerate(self.parameters):
+            row_center_y = param_start_y + (i * self.vertical_spacing) + (self.vertical_spacing / 2)
+            label_rect = QRectF(-self.width / 2 + self.padding, row_center_y - self.vertical_spacing / 2,
+                                label_width, self.vertical_spacing)
+            field_rect = QRectF(self.width / 2 - self.padding - field_width, row_center_y - field_height / 2,
+                                field_width, field_height)
+            self.param_rows.append((key, label_rect, field_rect))
+
+        # The shadow is painted as an offset path in paint(); a QGraphicsDropShadowEffect per node would
+        # blur every node on every repaint and disable the item cache.
 
     # --- Other methods (boundingRect, paint, itemChange) remain the same as before ---
     def boundingRect(self) -> QRectF:
@@ -152,63 +157,124 @@ class GraphicNode(QGraphicsItem):
         return self.node_rect.adjusted(-extra, -extra, extra, extra)
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget | None = None) -> None:
-        # --- Configuration ---
-        radius = 8.0 # Adjust this value for desired roundness (e.g., 8.0 or your previous 20.0)
-
-        # --- 1. Define the Overall Rounded Shape ---
-        # Use addRoundedRect for a reliable rounded rectangle path.
-        full_node_path = QPainterPath()
-        full_node_path.addRoundedRect(self.node_rect, radius, radius)
-
-        # --- 2. Draw Backgrounds using Clipping ---
-        painter.save() # Save painter state before clipping
-
-        # Set the clip region to the rounded path. Everything drawn
-        # after this will be confined within this shape.
-        painter.setClipPath(full_node_path)
-
-        # Draw the main body background (fills the entire clipped area)
+        # --- Level of detail: zoomed out, a plain box is enough ---
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < DETAIL_ZOOM_THRESHOLD:
+            painter.fillRect(self.node_rect, BODY_BRUSH)
+            painter.fillRect(self.title_rect, TITLE_BRUSH)
+            if self.isSelected():
+                painter.setPen(SELECTION_PEN)
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRect(self.node_rect)
+            return
+
+        # --- 1. Shadow and backgrounds, from the cached paths ---
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(QColor(48, 48, 48))) # Dark grey body
-        # Use drawPath to ensure filling exactly the clipped rounded shape
-        painter.drawPath(full_node_path)
-
-        # Draw the title background rectangle. Because of the clip path,
-        # only the portion within the rounded node shape (including the
-        # rounded top corners) will be visible.
-        painter.setBrush(QBrush(QColor(60, 120, 100))) # Green title
-        # Draw the rectangular title area; clipping handles the shape.
-        painter.drawRect(self.title_rect)
-
-        painter.restore() # Restore painter state (removes clipping)
-
-        # --- 3. Draw Node Outline ---
-        # Draw the outline using the same rounded path AFTER restoring
-        # from the clip, so the outline itself isn't clipped.
-        painter.setPen(QPen(QColor(20, 20, 20), 1)) # Subtle outline color
-        painter.setBrush(Qt.BrushStyle.NoBrush) # No fill for the outline
-        painter.drawPath(full_node_path)
-
-        # --- 4. Draw Title Text ---
-        painter.setPen(QColor(255, 255, 255)) # White text
+        painter.setBrush(SHADOW_BRUSH)
+        painter.drawPath(self.shadow_path)
+        painter.setBrush(BODY_BRUSH)
+        painter.drawPath(self.outline_path)
+        painter.setBrush(TITLE_BRUSH)
+        painter.drawPath(self.title_path)
+
+        # --- 2. Outline, or the selection highlight ---
+        painter.setPen(SELECTION_PEN if self.isSelected() else OUTLINE_PEN)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(self.outline_path)
+
+        # --- 3. Title text ---
+        painter.setPen(TITLE_TEXT_COLOR)
         painter.drawText(self.title_rect, Qt.AlignmentFlag.AlignCenter, self.node_type)
 
-        # --- 5. Draw Selection Highlight ---
-        if self.isSelected():
-            pen = QPen(QColor(255, 255, 255), 1)  # Use a distinct selection color (e.g., yellow)
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-
-            # Draw the highlight slightly inside the main outline for better visibility
-            # Adjusting the original path or creating a slightly smaller rounded rect
-            # For simplicity, let's draw the highlight using the same full path but with the selection pen
-            # Or draw a rectangle slightly inset:
-            inset = 0  # Amount to inset the selection rectangle
-            selection_rect = self.node_rect.adjusted(inset, inset, -inset, -inset)
-            # To draw a rounded rectangle highlight easily:
-            painter.drawRoundedRect(selection_rect, radius - inset, radius - inset)  # Use slightly smaller radius
-            # If you prefer a sharp rectangle selection:
-            # painter.drawRect(selection_rect)
+        # --- 4. Parameters ---
+        if self.param_rows:
+            self.paint_parameters(painter)
+
+    def paint_parameters(self, painter: QPainter) -> None:
+        """
+        Paints the parameter labels and value fields. The field of the parameter being edited is
+        covered by the editor widget.
+        """
+        values = self.node.serialize_parameters()
+        editor = self.parameter_editor()
+        for key, label_rect, field_rect in self.param_rows:
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(label_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+                             | Qt.TextFlag.TextWrapAnywhere, f"{key}:")
+
+            value = values.get(key)
+            if isinstance(value, bool):
+                # A check box at the left of the field
+                box = QRectF(field_rect.left(), field_rect.center().y() - 7, 14, 14)
+                painter.setPen(FIELD_PEN)
+                painter.setBrush(FIELD_BRUSH)
+                painter.drawRoundedRect(box, 3, 3)
+                if value:
+                    painter.setPen(QPen(TEXT_COLOR, 2))
+                    painter.drawLine(box.left() + 3, box.center().y(), box.center().x() - 1, box.bottom() - 3)
+                    painter.drawLine(box.center().x() - 1, box.bottom() - 3, box.right() - 3, box.top() + 3)
+                continue
+
+            if editor is not None and editor.is_editing(self, key):
+                continue
+            painter.setPen(FIELD_PEN)
+            painter.setBrush(FIELD_BRUSH)
+            painter.drawRoundedRect(field_rect, 4, 4)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(field_rect.adjusted(4, 0, -4, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                             self.format_parameter(value))
+
+    @staticmethod
+    def format_parameter(value) -> str:
+        """
+        Formats a parameter value like its editor shows it.
+        """
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return "" if value is None else str(value)
+
+    def parameter_editor(self):
+        scene = self.scene()
+        return getattr(scene, "parameter_editor", None) if scene is not None else None
+
+    def parameter_at(self, pos: QPointF):
+        """
+        :param pos: A position in the node's coordinates.
+        :return: (name, field rect) of the parameter field at the position, or None.
+        """
+        for key, _, field_rect in self.param_rows:
+            if field_rect.contains(pos):
+                return key, field_rect
+        return None
+
+    def mousePressEvent(self, event: QGraphicsSceneMouseEvent) -> None:
+        hit = self.parameter_at(event.pos()) if event.button() == Qt.MouseButton.LeftButton else None
+        if hit is None:
+            super().mousePressEvent(event)
+            return
+
+        key, field_rect = hit
+        value = self.node.serialize_parameters().get(key)
+        if isinstance(value, bool):
+            self._update_node_param(key, not value)
+        else:
+            editor = self.parameter_editor()
+            if editor is not None:
+                editor.open(self, key, value, field_rect)
+                self.update()
+        event.accept()
+
+    def set_detailed(self, detailed: bool) -> None:
+        """
+        Shows or hides the child items (labels, sockets, an open parameter editor), see DETAIL_ZOOM_THRESHOLD.
+        - Connections stay attached, they anchor to the SocketAnchors and not to the socket items.
+
+        :param detailed: True to show the child items.
+        """
+        if detailed == self.detailed:
+            return
+        self.detailed = detailed
+        for child in self.childItems():
+            child.setVisible(detailed)
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value) -> QGraphicsItem | QPointF | None:
         # Use ItemPositionHasChanged for efficiency after move completes
@@ -231,131 +297,47 @@ class GraphicNode(QGraphicsItem):
                     connection.update_position()
         return super().itemChange(change, value)
 
-    def create_parameter_widgets(self, start_y: float):
-        if not self.parameters:
-            return  # Nothing to create
+    def materialize(self) -> None:
+        """
+        Creates the socket items and labels (when the node comes near the viewport).
+        """
+        if self.materialized:
+            return
+        self.materialized = True
 
-        # Available width for label + widget within the node body, considering padding
-        available_content_width = self.width - 2 * self.padding
-        label_width_ratio = 0.4  # Allocate 40% width to label
-        widget_width_ratio = 0.55  # Allocate 55% width to widget
-        spacing_ratio = 0.05  # Allocate 5% width to spacing
-
-        for i, (key, value) in enumerate(self.parameters.items()):
-            # Calculate vertical center for this parameter row
-            current_row_y = start_y + (i * self.vertical_spacing) + (self.vertical_spacing / 2)
-
-            # --- Label for the parameter ---
-            param_label_text = f"{key}:"
-            param_label = QGraphicsTextItem(param_label_text, self)
-            param_label.setDefaultTextColor(Qt.GlobalColor.white)
-            # Position label left-aligned
-            label_max_width = available_content_width * label_width_ratio
-            param_label.setTextWidth(label_max_width)  # Limit label width if needed
-
-            label_height = param_label.boundingRect().height()
-            label_top_y = current_row_y - (label_height / 2)  # Center vertically
-            label_left_x = -self.width / 2 + self.padding  # Align with left padding
-            param_label.setPos(label_left_x, label_top_y)
-            self.socket_labels.append(param_label)  # Add to general labels list
-
-            # --- Actual Widget ---
-            widget_instance = None  # Store the actual QWidget
-
-            # Determine widget type based on value type (and key for specifics)
-            if isinstance(value, (float, int)):
-                widget_instance = QDoubleSpinBox()
-                widget_instance.setValue(float(value))
-                widget_instance.setRange(-999999, 999999)
-                widget_instance.setSingleStep(0.1 if isinstance(value, float) else 1.0)
-                widget_instance.setDecimals(4 if isinstance(value, float) else 0)  # Adjust precision
-                # widget_instance.setAlignment(Qt.AlignmentFlag.AlignRight)
-                widget_instance.valueChanged.connect(lambda val, k=key: self._update_node_param(k, val))
-
-                widget_instance.setStyleSheet("""
-                    QDoubleSpinBox {
-                        background-color: #303030;
-                        border: 1px solid #5e5e5e;
-                        color: white;
-                        padding: 2px;
-                        border-radius: 4px;
-                    }
-                    
-                    QDoubleSpinBox::down-button {
-                        image: url(C:/Users/Jan/source/repos/AINodes/AINodes/src/ui/icons/keyboard_arrow_down.svg);
-                        background-color: #222;
-                        border: None;
-                        width: 20px;
-                        border-bottom-right-radius: 3px;
-                        border-top: 1px solid #5e5e5e;
-                        border-left: 1px solid #5e5e5e;
-                        image-rendering: auto;
-                    }
-                    QDoubleSpinBox::up-button {
-                        image: url(C:/Users/Jan/source/repos/AINodes/AINodes/src/ui/icons/keyboard_arrow_up.svg);
-                        background-color: #222;
-                        border: None;
-                        width: 20px;
-                        border-top-right-radius: 3px;
-                        border-left: 1px solid #5e5e5e;
-                        image-rendering: auto;
-                        
-
-
-                    }
-                    
-                    QDoubleSpinBox::up-button:hover, QDoubleSpinBox::down-button:hover {
-                        background-color: #3a3a3a;
-                    }
-                """)
-
-            elif isinstance(value, str) and key == "dataset_name" and hasattr(self.node, "AVAILABLE_DATASETS"):
-                widget_instance = QComboBox()
-                datasets = getattr(self.node, "AVAILABLE_DATASETS", {})
-                if isinstance(datasets, dict):
-                    widget_instance.addItems(list(datasets.keys()))
-                else:
-                    widget_instance.addItems(list(datasets))
-                widget_instance.setCurrentText(value)
-                widget_instance.currentTextChanged.connect(lambda val, k=key: self._update_node_param(k, val))
-
-            elif isinstance(value, str):
-                widget_instance = QLineEdit()
-                widget_instance.setText(value)
-                widget_instance.textChanged.connect(lambda val, k=key: self._update_node_param(k, val))
-
-            elif isinstance(value, bool):
-                from PySide6.QtWidgets import QCheckBox  # Import locally if not already imported
-                widget_instance = QCheckBox()
-                widget_instance.setChecked(value)
-                widget_instance.toggled.connect(lambda val, k=key: self._update_node_param(k, val))
-
-            # Add more elif conditions for other types...
-
-            if widget_instance:
-                # Set widget size
-                widget_max_width = available_content_width * widget_width_ratio
-                widget_instance.setFixedWidth(widget_max_width)
-                widget_instance.setFixedHeight(self.vertical_spacing * 0.8)  # Slightly less than row height
-
-                # Wrap widget in proxy
-                proxy = QGraphicsProxyWidget(self)
-                proxy.setWidget(widget_instance)
-
-                # Position proxy widget (right-aligned in the remaining space)
-                widget_left_x = self.width / 2 - self.padding - widget_max_width
-                widget_top_y = current_row_y - (widget_instance.height() / 2)  # Center vertically
-
-                proxy.setPos(widget_left_x, widget_top_y)
-                proxy = QGraphicsProxyWidget(self)
-                proxy.setWidget(widget_instance)
-
-                # --- ADD THIS LINE ---
-                proxy.setCacheMode(QGraphicsItem.CacheMode.NoCache)
-                # ---------------------
-
-                # ... (Position proxy widget) ...
-                self.parameter_widgets.append(proxy)
+        for anchor, (text, socket_center_x, row_center_y, is_input) in zip(self.sockets, self.socket_rows):
+            socket = GraphicSocket(anchor.socket_id, socket_center_x, row_center_y, self, is_input=is_input)
+            socket.setVisible(self.detailed)
+            self.socket_views.append(socket)
+
+            label = QGraphicsTextItem(text, self)
+            label.setDefaultTextColor(Qt.GlobalColor.white)
+            label_height = label.boundingRect().height()
+            label_top_y = row_center_y - (label_height / 2)
+            if is_input:
+                label_left_x = socket_center_x + self.socket_radius + self.label_socket_spacing
+            else:
+                label_left_x = socket_center_x - self.socket_radius - self.label_socket_spacing - label.boundingRect().width()
+            label.setPos(label_left_x, label_top_y)
+            label.setVisible(self.detailed)
+            self.socket_labels.append(label)
+
+    def dematerialize(self) -> None:
+        """
+        Removes the socket items and labels (when the node left the viewport).
+        The node is then a single item drawn as its title bar, body and parameters.
+        """
+        if not self.materialized:
+            return
+        self.materialized = False
+
+        scene = self.scene()
+        for item in self.socket_views + self.socket_labels:
+            item.setParentItem(None)
+            if scene is not None:
+                scene.removeItem(item)
+        self.socket_views = []
+        self.socket_labels = []
 
     def _update_node_param(self, key: str, value):
         if hasattr(self.node, key):
@@ -368,8 +350,15 @@ class GraphicNode(QGraphicsItem):
                 if value_type is float and isinstance(value, int):
                     value = float(value)
 
-                setattr(self.node, key, value)
+                self.node.set_parameter(key, value)
             except Exception as e:
                 print(f"Error updating parameter {key}: {e}")
+                return
+            self.update()  # Repaint the value field
+
+            # Lets the controller re-run the affected outputs in live mode
+            scene = self.scene()
+            if scene is not None and getattr(scene, "controller", None) is not None:
+                scene.controller.parameter_changed(self.node)
         else:
             print(f"No parameter key {key} in node {self.node}")
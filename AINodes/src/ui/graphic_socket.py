@@ -1,15 +1,39 @@
-from typing import List
-
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QPointF
 from PySide6.QtGui import QBrush, QColor, QPen
-from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsSceneMouseEvent, QGraphicsItem, QGraphicsLineItem
+from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsSceneMouseEvent, QGraphicsItem
+
+
+class SocketAnchor:
+    """
+    The position of a socket on its node view, where connections attach.
+    - Exists for every socket, also while the node is not materialized; it is no graphics item, so
+      off-screen nodes do not pay for a QObject and an item per socket.
+    - The visible GraphicSocket is only created while the node is near the viewport (see GraphicNode.materialize).
+    """
+
+    __slots__ = ("socket_id", "node_item", "center", "is_input", "connections")
+
+    def __init__(self, socket_id: int, node_item: QGraphicsItem, center: QPointF, is_input: bool):
+        """
+        :param socket_id: The id of the backend socket.
+        :param node_item: The node view the socket belongs to.
+        :param center: The center of the socket in the node's coordinates.
+        :param is_input: Whether the socket is an input.
+        """
+        self.socket_id = socket_id
+        self.node_item = node_item
+        self.center = center
+        self.is_input = is_input
+        self.connections = []
+
+    def scene_center(self) -> QPointF:
+        return self.node_item.mapToScene(self.center)
 
-from AINodes.src.ui.connection import Connection
 
 class GraphicSocket(QObject, QGraphicsEllipseItem):
-    socket_right_clicked = Signal(str)
+    socket_right_clicked = Signal(int)
 
-    def __init__(self, socket_id: str, x_pos, y_pos, parent_node, is_input=True):
+    def __init__(self, socket_id: int, x_pos, y_pos, parent_node, is_input=True):
         QObject.__init__(self)
         # Define ellipse geometry relative to its local (0,0) origin
         radius = 5  # Half of the desired 10x10 size
@@ -49,6 +49,17 @@ class MainWindow(QMainWindow):
         self.toolbar.addWidget(self.run_button)
         self.run_button.clicked.connect(self.on_run_button_clicked)
 
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.toolbar.addWidget(self.cancel_button)
+        self.cancel_button.clicked.connect(self.on_cancel_button_clicked)
+
+        self.live_button = QPushButton("Live")
+        self.live_button.setCheckable(True)
+        self.live_button.setToolTip("Re-run the affected outputs automatically after parameter changes")
+        self.toolbar.addWidget(self.live_button)
+        self.live_button.toggled.connect(self.on_live_button_toggled)
+
         self.save_button = QPushButton("Save")
         self.toolbar.addWidget(self.save_button)
         self.save_button.clicked.connect(self.on_save_button_clicked)
@@ -60,6 +71,23 @@ class MainWindow(QMainWindow):
     def log(self, message: str):
         self.log_console.log(message)
 
+    def set_run_state(self, running: bool, pending: bool = False) -> None:
+        """
+        Shows whether the graph is currently executed in the background.
+
+        :param running: True while a run is active.
+        :param pending: True if another run is queued after the current one.
+        """
+        self.cancel_button.setEnabled(running)
+        self.run_button.setText("Run (queued)" if pending else "Run")
+        if running:
+            self.statusBar().showMessage("Running…")
+        else:
+            self.statusBar().clearMessage()
+
+    def show_run_progress(self, text: str) -> None:
+        self.statusBar().showMessage(f"Running {text}")
+
     def on_load_button_clicked(self):
         filepath, _ = QFileDialog.getOpenFileName(self, "Open File", os.path.expanduser("~"), )
         self.controller.load_graph(filepath)
@@ -67,6 +95,16 @@ class MainWindow(QMainWindow):
     def on_run_button_clicked(self):
         self.controller.run()
 
+    def on_cancel_button_clicked(self):
+        self.controller.cancel_run()
+
+    def on_live_button_toggled(self, checked: bool):
+        self.controller.set_live_mode(checked)
+
+    def closeEvent(self, event):
+        self.controller.shutdown()
+        super().closeEvent(event)
+
     def on_save_button_clicked(self):
         filepath, _ = QFileDialog.getSaveFileName(
             self,
@@ -90,8 +128,20 @@ class MainWindow(QMainWindow):
             action = menu.addAction(node_name)
             action.triggered.connect(lambda checked=False, name=node_name: self.controller.create_node(name))
 
+        menu.addSeparator()
+        refresh_action = menu.addAction("Refresh Nodes")
+        refresh_action.triggered.connect(self.on_refresh_nodes_triggered)
         return menu
 
+    def on_refresh_nodes_triggered(self):
+        """
+        Scans the node files again and rebuilds the node menu.
+        """
+        self.controller.refresh_available_nodes()
+        old_menu = self.add_node_button.menu()
+        self.add_node_button.setMenu(self.create_node_menu())
+        old_menu.deleteLater()
+
     def keyPressEvent(self, event):
         """
         Beendet die Anwendung bei Escape.
@@ -1,63 +1,152 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, Optional, Set, Tuple
 from typing import TYPE_CHECKING
 
-from PySide6.QtGui import QColor, QBrush, QPainter
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QBrush
 from PySide6.QtWidgets import QGraphicsScene
 
 from AINodes.src.core.node import Node
 from AINodes.src.ui.connection import Connection
 from AINodes.src.ui.graphic_node import GraphicNode
-from AINodes.src.ui.graphic_socket import GraphicSocket
+from AINodes.src.ui.graphic_socket import GraphicSocket, SocketAnchor
+from AINodes.src.ui.parameter_editor import ParameterEditor
 
 if TYPE_CHECKING:
     from AINodes.src.controller.graph_controller import GraphController
 
 
 class NodeScene(QGraphicsScene):
+    """
+    The scene holding the node views.
+    - Node views are virtualized: every node is a single lightweight item (body, title, painted parameters) with
+      socket anchors for its connections. Socket items and labels are only created for nodes near the visible
+      area and removed when they leave it. The view reports the visible area through `update_visible_nodes`.
+    - Parameters are edited with one shared ParameterEditor, opened by clicking a painted parameter.
+    """
+
     def __init__(self, controller: GraphController = None, parent=None):
         super().__init__(parent)
         large_dim = 100000
         self.setSceneRect(-large_dim / 2, -large_dim / 2, large_dim, large_dim)
         self.setBackgroundBrush(QBrush(QColor(29, 29, 29)))
         self.controller = controller
-        self.nodes: List[GraphicNode] = []
-        self.connections: List[Connection] = []
+        # Indexes for O(1) lookups by id, kept consistent on add and remove
+        self.nodes: Dict[str, GraphicNode] = {}  # node_id -> view
+        self.sockets: Dict[int, SocketAnchor] = {}  # socket_id -> anchor, the socket items come and go
+        self.connections: Dict[Tuple[int, int], Connection] = {}  # (output socket id, input socket id) -> view
+        self.detailed = True  # Level of detail of the nodes, set by the view depending on the zoom
+        self.visible_rect: Optional[QRectF] = None  # Area reported by the view, None until it is shown
+        self.parameter_editor = ParameterEditor()
+        self._materialized: Set[GraphicNode] = set()  # Nodes with socket items and labels
 
     def register_socket(self, socket: GraphicSocket) -> None:
         socket.socket_right_clicked.connect(self.handle_socket_right_clicked)
 
     def add_node_view(self, node: Node, x: float = 0, y: float = 0) -> None:
         newGraphicNode = GraphicNode(node, x=x, y=y)
-        self.nodes.append(newGraphicNode)
+        newGraphicNode.set_detailed(self.detailed)
+        self.nodes[newGraphicNode.node_id] = newGraphicNode
         self.addItem(newGraphicNode)
         for socket in newGraphicNode.sockets:
+            self.sockets[socket.socket_id] = socket
+        if (self.detailed and self.visible_rect is not None
+                and self.visible_rect.intersects(newGraphicNode.sceneBoundingRect())):
+            self._materialize(newGraphicNode)
+
+    def update_visible_nodes(self, visible_rect: QRectF) -> None:
+        """
+        Creates the socket items and labels of the nodes in the given area and removes those of all other nodes.
+        Zoomed out (see `set_detailed`) no node is materialized.
+
+        :param visible_rect: The visible area in scene coordinates, including a margin.
+        """
+        self.visible_rect = visible_rect
+        if self.detailed:
+            wanted = {item for item in self.items(visible_rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect)
+                      if isinstance(item, GraphicNode)}
+        else:
+            wanted = set()
+
+        for item in self._materialized - wanted:
+            item.dematerialize()
+        for item in wanted - self._materialized:
+            self._materialize(item)
+        self._materialized = wanted
+
+    def _materialize(self, item: GraphicNode) -> None:
+        item.materialize()
+        for socket in item.socket_views:
             self.register_socket(socket)
+        self._materialized.add(item)
+
+    def set_detailed(self, detailed: bool) -> None:
+        """
+        Switches all nodes between the full and the simplified (zoomed out) rendering.
+
+        :param detailed: True to show labels and sockets.
+        """
+        if detailed == self.detailed:
+            return
+        self.detailed = detailed
+        if not detailed:
+            self.parameter_editor.close()
+        for item in self.nodes.values():
+            item.set_detailed(detailed)
+        if self.visible_rect is not None:
+            self.update_visible_nodes(self.visible_rect)
 
     def remove_node_view(self, node_id: str):
         """Entfernt eine Node anhand seiner ID."""
-        for item in self.nodes:
-            if isinstance(item, GraphicNode) and item.node_id == node_id:
-                for socket in item.sockets:
-                    for conn in getattr(socket, 'connections', []):
-                        conn.delete_connection()
-                self.removeItem(item)
-
-    def add_connection_view(self, output_socket_id: str, input_socket_id: str) -> None:
+        item = self.nodes.pop(node_id, None)
+        if item is None:
+            return
+        if self.parameter_editor.is_editing(item):
+            self.parameter_editor.close()
+        item.dematerialize()
+        self._materialized.discard(item)
+
+        for socket in item.sockets:
+            for conn in list(getattr(socket, 'connections', [])):
+                self._forget_connection(conn)
+                conn.delete_connection()
+            self.sockets.pop(socket.socket_id, None)
+        self.removeItem(item)
+
+    def get_node_view(self, node_id: str) -> Optional[GraphicNode]:
+        return self.nodes.get(node_id)
+
+    def add_connection_view(self, output_socket_id: int, input_socket_id: int) -> None:
         output_socket = self.find_socket_by_id(output_socket_id)
         input_socket = self.find_socket_by_id(input_socket_id)
 
+        # An input accepts only one connection, a replaced connection loses its view
+        for conn in list(input_socket.connections):
+            self._forget_connection(conn)
+            conn.delete_connection()
+
         new_connection = Connection(output_socket, input_socket)
-        self.connections.append(new_connection)
+        self.connections[(output_socket_id, input_socket_id)] = new_connection
         self.addItem(new_connection)
 
-    def find_socket_by_id(self, socket_id: str) -> GraphicSocket:
-        for graphic_node in self.nodes:
-            for socket in graphic_node.sockets:
-                if socket.socket_id == socket_id:
-                    return socket
-        return None
+    def remove_connection_view(self, output_socket_id: int, input_socket_id: int) -> None:
+        connection = self.connections.pop((output_socket_id, input_socket_id), None)
+        if connection is not None:
+            connection.delete_connection()
+
+    def _forget_connection(self, connection: Connection) -> None:
+        if connection.end_socket is not None:
+            self.connections.pop((connection.start_socket.socket_id, connection.end_socket.socket_id), None)
+
+    def find_socket_by_id(self, socket_id: int) -> SocketAnchor:
+        return self.sockets.get(socket_id)
+
+    def mousePressEvent(self, event):
+        # A click outside the open parameter editor finishes editing
+        if self.parameter_editor.is_editing() and not self.parameter_editor.contains(event.scenePos()):
+            self.parameter_editor.close()
+        super().mousePressEvent(event)
 
-    def handle_socket_right_clicked(self, socket_id: str):
+    def handle_socket_right_clicked(self, socket_id: int):
         self.controller.connect_socket(socket_id)
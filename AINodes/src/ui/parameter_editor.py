@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from PySide6.QtCore import QRectF
+from PySide6.QtWidgets import QGraphicsProxyWidget, QDoubleSpinBox, QComboBox, QLineEdit, QWidget
+
+from AINodes.src.core.node import Node
+
+if TYPE_CHECKING:
+    from AINodes.src.ui.graphic_node import GraphicNode
+
+SPINBOX_STYLE = """
+    QDoubleSpinBox {
+        background-color: #303030;
+        border: 1px solid #5e5e5e;
+        color: white;
+        padding: 2px;
+        border-radius: 4px;
+    }
+
+    QDoubleSpinBox::down-button {
+        image: url(C:/Users/Jan/source/repos/AINodes/AINodes/src/ui/icons/keyboard_arrow_down.svg);
+        background-color: #222;
+        border: None;
+        width: 20px;
+        border-bottom-right-radius: 3px;
+        border-top: 1px solid #5e5e5e;
+        border-left: 1px solid #5e5e5e;
+        image-rendering: auto;
+    }
+    QDoubleSpinBox::up-button {
+        image: url(C:/Users/Jan/source/repos/AINodes/AINodes/src/ui/icons/keyboard_arrow_up.svg);
+        background-color: #222;
+        border: None;
+        width: 20px;
+        border-top-right-radius: 3px;
+        border-left: 1px solid #5e5e5e;
+        image-rendering: auto;
+    }
+
+    QDoubleSpinBox::up-button:hover, QDoubleSpinBox::down-button:hover {
+        background-color: #3a3a3a;
+    }
+"""
+
+# Stacks the open editor above nodes and connections
+EDITOR_Z_VALUE = 1000
+
+
+def editor_type(node: Node, key: str, value: Any) -> Optional[type]:
+    """
+    Returns the widget type used to edit a parameter, None for parameters without an editor.
+    - Booleans have no editor, the node toggles them on click.
+
+    :param node: The node owning the parameter.
+    :param key: The parameter name.
+    :param value: The current value.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (float, int)):
+        return QDoubleSpinBox
+    if isinstance(value, str) and key == "dataset_name" and hasattr(node, "AVAILABLE_DATASETS"):
+        return QComboBox
+    if isinstance(value, str):
+        return QLineEdit
+    return None
+
+
+class ParameterEditor:
+    """
+    The real editor widget of a scene. Parameters are painted by their GraphicNode; clicking one opens this
+    editor over the painted field.
+    - At most one editor is open. Its widget is created on first use (one per widget type) and reused afterwards.
+    - Every change is written to the node right away, like with the former per-parameter widgets
+      (the live mode of the controller relies on it).
+    - The editor closes when editing is finished (Enter, focus loss or a selected combo box entry).
+    """
+
+    def __init__(self):
+        self._proxies: Dict[type, QGraphicsProxyWidget] = {}  # Widget type -> embedded editor
+        self._active: Optional[QGraphicsProxyWidget] = None
+        self._node_item: Optional[GraphicNode] = None
+        self._key: Optional[str] = None
+        self._configuring = False  # Suppresses change signals while the editor is filled
+
+    @property
+    def created(self) -> int:
+        """
+        The number of editor widgets created so far.
+        """
+        return len(self._proxies)
+
+    def is_editing(self, node_item: Optional[GraphicNode] = None, key: Optional[str] = None) -> bool:
+        """
+        :param node_item: Only check this node, None for any node.
+        :param key: Only check this parameter of the node, None for any parameter.
+        :return: True if an editor is open.
+        """
+        return (self._active is not None and (node_item is None or self._node_item is node_item)
+                and (key is None or self._key == key))
+
+    def contains(self, scene_pos) -> bool:
+        """
+        :return: True if the open editor covers the given scene position.
+        """
+        return self._active is not None and self._active.sceneBoundingRect().contains(scene_pos)
+
+    def _proxy(self, widget_type: type) -> QGraphicsProxyWidget:
+        proxy = self._proxies.get(widget_type)
+        if proxy is not None:
+            return proxy
+
+        widget: QWidget = widget_type()
+        if widget_type is QDoubleSpinBox:
+            widget.setStyleSheet(SPINBOX_STYLE)
+            widget.valueChanged.connect(self._on_value_changed)
+            widget.editingFinished.connect(self.close)
+        elif widget_type is QComboBox:
+            widget.currentTextChanged.connect(self._on_value_changed)
+            widget.activated.connect(lambda index: self.close())
+        else:
+            widget.textChanged.connect(self._on_value_changed)
+            widget.editingFinished.connect(self.close)
+
+        proxy = QGraphicsProxyWidget()
+        proxy.setWidget(widget)
+        proxy.setZValue(EDITOR_Z_VALUE)
+        proxy.setVisible(False)
+        self._proxies[widget_type] = proxy
+        return proxy
+
+    def open(self, node_item: GraphicNode, key: str, value: Any, rect: QRectF) -> None:
+        """
+        Opens the editor for a parameter over its painted field.
+
+        :param node_item: The node view the parameter belongs to.
+        :param key: The parameter name.
+        :param value: The current value.
+        :param rect: The field of the parameter in the node's coordinates.
+        """
+        self.close()
+        widget_type = editor_type(node_item.node, key, value)
+        if widget_type is None:
+            return
+
+        proxy = self._proxy(widget_type)
+        widget = proxy.widget()
+        self._configuring = True
+        try:
+            if widget_type is QDoubleSpinBox:
+                widget.setRange(-999999, 999999)
+                widget.setSingleStep(0.1 if isinstance(value, float) else 1.0)
+                widget.setDecimals(4 if isinstance(value, float) else 0)  # Adjust precision
+                widget.setValue(float(value))
+            elif widget_type is QComboBox:
+                widget.clear()
+                datasets = getattr(node_item.node, "AVAILABLE_DATASETS", {})
+                widget.addItems(list(datasets.keys()) if isinstance(datasets, dict) else list(datasets))
+                widget.setCurrentText(value)
+            else:
+                widget.setText(value)
+        finally:
+            self._configuring = False
+
+        widget.setFixedSize(rect.size().toSize())
+        proxy.setParentItem(node_item)
+        proxy.setPos(rect.topLeft())
+        proxy.setVisible(True)
+        self._active, self._node_item, self._key = proxy, node_item, key
+
+        proxy.setFocus()
+        widget.setFocus()
+        if widget_type in (QLineEdit, QDoubleSpinBox):
+            widget.selectAll()
+        elif widget_type is QComboBox:
+            widget.showPopup()
+
+    def close(self) -> None:
+        """
+        Hides the open editor. The edits have already been written to the node.
+        """
+        if self._active is None:
+            return
+        proxy, node_item = self._active, self._node_item
+        self._active, self._node_item, self._key = None, None, None
+
+        proxy.setVisible(False)
+        proxy.setParentItem(None)  # Stays in the scene as a hidden top-level item until it is needed again
+        node_item.update()
+
+    def _on_value_changed(self, value: Any) -> None:
+        if self._configuring or self._active is None:
+            return
+        self._node_item._update_node_param(self._key, value)
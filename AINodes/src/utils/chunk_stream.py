@@ -0,0 +1,101 @@
+import itertools
+import os
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class ChunkStream:
+    """
+    A re-iterable stream of fixed-size row blocks read from a .npy or CSV file.
+    - Iterating yields 2D arrays of at most `chunk_size` rows; only one block is held in memory at a time.
+    - For .npy files the blocks are read-only slices of a memory map, nothing is copied.
+    - CSV files must contain numeric values only; every block is parsed when it is reached.
+      Blank lines are skipped, so a block can hold fewer rows.
+    - The stream only stores the file path and the read options, so it is cheap to pickle.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: str = ",",
+                 skip_header: int = 0):
+        """
+        :param file_path: The path of the .npy or CSV file.
+        :param chunk_size: The number of rows per block.
+        :param delimiter: The column delimiter (CSV only).
+        :param skip_header: The number of lines to skip at the start of the file (CSV only).
+        :raises ValueError: If chunk_size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+        self.file_path = file_path
+        self.chunk_size = int(chunk_size)
+        self.delimiter = delimiter
+        self.skip_header = int(skip_header)
+
+    @property
+    def is_npy(self) -> bool:
+        return self.file_path.lower().endswith(".npy")
+
+    def open_array(self) -> np.ndarray:
+        """
+        Returns the full content of a .npy file as a read-only memory map.
+
+        :raises ValueError: If the stream reads a CSV file.
+        """
+        if not self.is_npy:
+            raise ValueError(f"{self.file_path} is not a .npy file.")
+        return np.load(self.file_path, mmap_mode="r", allow_pickle=False)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if self.is_npy:
+            yield from iter_chunks(self.open_array(), self.chunk_size)
+            return
+
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            lines = itertools.islice(f, self.skip_header, None)
+            while True:
+                window = list(itertools.islice(lines, self.chunk_size))
+                if not window:
+                    break  # End of file
+                block = [line for line in window if line.strip()]
+                if block:  # A window of blank lines is skipped, the rows after it still follow
+                    yield np.loadtxt(block, delimiter=self.delimiter, dtype=float, ndmin=2)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Reads the whole file into one read-only array.
+        - .npy files are memory-mapped, CSV files are parsed block by block and concatenated.
+        """
+        if self.is_npy:
+            return self.open_array()
+
+        blocks = list(self)
+        array = np.concatenate(blocks) if blocks else np.empty((0, 0))
+        array.flags.writeable = False
+        return array
+
+    def __repr__(self) -> str:
+        return f"<ChunkStream {os.path.basename(self.file_path)} ({self.chunk_size} rows per block)>"
+
+
+def iter_chunks(value: Any, chunk_size: Optional[int] = None) -> Iterator[np.ndarray]:
+    """
+    Iterates over the row blocks of either a ChunkStream or an in-memory array.
+    - Lets nodes accept both outputs of a file input node.
+
+    :param value: A ChunkStream or anything `np.asarray` accepts.
+    :param chunk_size: The number of rows per block for arrays (defaults to DEFAULT_CHUNK_SIZE).
+    :return: An iterator over 2D (or 1D) blocks.
+    """
+    if isinstance(value, ChunkStream):
+        yield from value
+        return
+
+    array = np.asarray(value)
+    if array.ndim == 0:
+        yield array
+        return
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    for start in range(0, len(array), chunk_size):
+        yield array[start:start + chunk_size]
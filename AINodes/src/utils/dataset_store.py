@@ -0,0 +1,124 @@
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from AINodes.src.utils.logger import logger
+
+# Overrides the directory in which loaded datasets are kept as .npy files
+DATASET_CACHE_ENV = "AINODES_DATASET_CACHE"
+DEFAULT_DATASET_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ainodes", "datasets")
+
+ARRAY_NAMES = ("features", "targets")
+
+
+class DatasetStore:
+    """
+    Process-wide store for the sklearn datasets.
+    - Each dataset is loaded from sklearn once and saved as .npy files in the cache directory.
+    - The arrays are served as read-only memory maps, so every node (and every run) shares one buffer
+      and the operating system can share the pages between processes.
+    - Once the cache is populated, neither scikit-learn nor a network connection is needed.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        :param cache_dir: The directory holding the .npy files
+                          (defaults to $AINODES_DATASET_CACHE or ~/.cache/ainodes/datasets).
+        """
+        self.cache_dir = os.path.abspath(cache_dir or os.environ.get(DATASET_CACHE_ENV) or DEFAULT_DATASET_CACHE_DIR)
+        self._datasets: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def _paths(self, name: str) -> Dict[str, str]:
+        return {array_name: os.path.join(self.cache_dir, name, f"{array_name}.npy") for array_name in ARRAY_NAMES}
+
+    def _load_cached(self, name: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        paths = self._paths(name)
+        if not all(os.path.exists(path) for path in paths.values()):
+            return None
+        try:
+            return tuple(np.load(paths[array_name], mmap_mode="r") for array_name in ARRAY_NAMES)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dataset cache for '{name}' is unreadable, loading it again: {e}")
+            return None
+
+    def _save(self, name: str, arrays: Tuple[np.ndarray, np.ndarray]) -> bool:
+        """
+        Writes the arrays of a dataset to the cache directory.
+        - Every file is written to a temporary name first and then renamed, so concurrent processes
+          never see a partially written file.
+
+        :return: True if the dataset could be saved.
+        """
+        directory = os.path.join(self.cache_dir, name)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for array_name, array in zip(ARRAY_NAMES, arrays):
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npy.tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+                    os.replace(tmp_path, self._paths(name)[array_name])
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not save dataset '{name}' to {directory}: {e}")
+            return False
+        return True
+
+    def get(self, name: str, loader_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the features and targets of a dataset.
+
+        :param name: The name of the dataset, used as the directory name in the cache.
+        :param loader_name: The sklearn.datasets function that loads the dataset (e.g. "load_iris").
+        :return: A tuple (X, y) of read-only arrays.
+        :raises Exception: Whatever the sklearn loader raises if the dataset is not cached and can not be loaded.
+        """
+        arrays = self._datasets.get(name)
+        if arrays is not None:
+            return arrays
+
+        with self._lock:
+            arrays = self._datasets.get(name)
+            if arrays is None:
+                arrays = self._load_cached(name)
+            if arrays is None:
+                from sklearn import datasets
+
+                dataset = getattr(datasets, loader_name)()
+                arrays = (np.asarray(dataset.data), np.asarray(dataset.target))
+                if self._save(name, arrays):
+                    arrays = self._load_cached(name) or arrays
+                for array in arrays:
+                    if isinstance(array, np.ndarray) and array.flags.writeable:
+                        array.flags.writeable = False
+            self._datasets[name] = arrays
+        return arrays
+
+    def clear(self) -> None:
+        """
+        Forgets the datasets held in memory, the files in the cache directory are kept.
+        """
+        with self._lock:
+            self._datasets.clear()
+
+
+_store: Optional[DatasetStore] = None
+_store_lock = threading.Lock()
+
+
+def get_dataset_store() -> DatasetStore:
+    """
+    Returns the dataset store of this process.
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = DatasetStore()
+        return _store